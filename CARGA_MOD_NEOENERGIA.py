@@ -1,679 +1,938 @@
+"""
+Módulo: CARGA_MOD_NEOENERGIA.py
+
+Árvore de carga de estruturas (postes DT/R) de linhas de distribuição.
+
+- calcular_arvore_carga(estrutura, linha): cálculo de uma estrutura, sem E/S;
+- calcular_arvores_carga(estruturas, linha): várias estruturas no mesmo processo,
+  reaproveitando a tabela de cabos carregada;
+- executar_linha(tabela, linha): linha completa em um pool de processos, com
+  progresso, falhas isoladas por estrutura e resumo de carga_resultante;
+- salvar_em_txt / gerar_graficos / gerar_memorial: saídas de uma estrutura
+  (matplotlib e python-docx só são importados por essas funções).
+
+Executado como script, calcula e documenta a estrutura de exemplo abaixo.
+"""
+import copy
+import os
+import pickle
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-import mecanico_linhas as ml
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
-import time
-import xml.etree.ElementTree as ET
-from matplotlib.patches import Polygon
-from docx import Document
-from docx.enum.text import WD_BREAK
-from docx.shared import Cm
-from docx.shared import Inches
-from docx.enum.table import  WD_ALIGN_VERTICAL
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-
-
-# Registre o tempo de início
-tempo_inicial = time.time()
-numero_documento = "Catu"
-nome_LT = "LD 69 kV Catu - Entre Rios"
-
-deflexao = 0
-deflexao_bissetriz = 0
-rugosidade = "B"
-temperatura = {
-    "coincidente": 16,
-    "EDS": 21,
-    "minima": 4,
-    }
+
+import mecanico_linhas as ml
+from cabos import carregar_tabela_cabos
+
+
+# =============================================================
+# Dados de entrada (exemplo)
+# =============================================================
+
+# Parâmetros comuns à linha. Qualquer chave pode ser redefinida por estrutura.
+LINHA_EXEMPLO: Dict[str, Any] = {
+    "numero_documento": "Catu",
+    "nome_LT": "LD 69 kV Catu - Entre Rios",
+    "rugosidade": "B",
+    "terreno": "B",
+    "altitude": 100,
+    "temperatura": {
+        "coincidente": 16,
+        "EDS": 21,
+        "minima": 4,
+    },
+    "vento": {"projeto": 23.62, "extremo": 38.3},
+    "periodo_retorno": 150,
+    "cabo": "Linnet",
+    "cabo_pr1": "5/16'",
+    "cabo_pr2": "Penguin",
+    "tracao_eds": {"vante": 1400, "re": 1400},
+    "tracao_eds_pr2": {"vante": 400, "re": 400},
+    "tracao_eds_pr": {"vante": 400, "re": 400},
+    "isolador": {"comprimento": 1.5, "area": 0.59, "peso": 50},
+    "peso_homens": 200,
+}
 
 qtd_cabo_fase = 1
 qtd_cabo_pr = 1
-poste = "DT" #DT OU R , PARA TORRES DEIXAR SEM NADA
-Carga_inicial = 1500
 
+ESTRUTURA_EXEMPLO: Dict[str, Any] = {
+    "nome_estrutura": " 0/2",
+    "altura_estrutura": 21,
+    "poste": "DT",  # DT OU R , PARA TORRES DEIXAR SEM NADA
+    "Carga_inicial": 1500,
+    "deflexao": 0,
+    "deflexao_bissetriz": 0,
+    "vao": {"vante": 250, "re": 250},
+    "vao_de_peso": {"min": 50, "max": 300},
+    "vao_regulador": {"vante": 250, "re": 250},
+    "geometria_estrutura": {
+        "Fase_1": {"H": 3.8, "X": -1.9, "Tipo": "Suspensao", "cabo": LINHA_EXEMPLO["cabo"], "qtd": qtd_cabo_fase},
+        "Fase_2": {"H": 2.04, "X": 1.8, "Tipo": "Suspensao", "cabo": LINHA_EXEMPLO["cabo"], "qtd": qtd_cabo_fase},
+        "Fase_3": {"H": 4.73, "X": 1.8, "Tipo": "Suspensao", "cabo": LINHA_EXEMPLO["cabo"], "qtd": qtd_cabo_fase},
+        "Cabo_PR_1": {"H": 0.2, "X": 0, "Tipo": "Suspensao", "cabo": LINHA_EXEMPLO["cabo_pr1"], "qtd": qtd_cabo_pr},
+    },
+}
+
+# Planilha de cabos (lida via tabela compilada, ver cabos.carregar_tabela_cabos)
+CAMINHO_DB_CABOS = "_db/cabos.xlsx"
+
+# Tipo/dimensões do tronco por carga nominal do poste
+dt_tipo = {
+    1500: 3,
+    2000: 6,
+    2500: 6,
+    3000: 6,
+    4000: 9,
+    }
 
+r_tipo = {
+    1500: 10,
+    2000: 10,
+    2500: 16,
+    3000: 18,
+    4000: 23
+    }
 
-terreno = "B"
-altitude = 100
-cabo = "Linnet"
-cabo_pr1 = "5/16'"
-cabo_pr2 = "Penguin"
-vento = {"projeto":23.62,"extremo":38.3 }
-periodo_retorno = 150
+dt_dim = {
+    3: {"Face_A": 224+5, "Face_B": 170+5},
+    6: {"Face_A": 308+5, "Face_B": 230+5},
+    9: {"Face_A": 392+5, "Face_B": 290+5},
+    }
 
-tracao_eds = {"vante": 1400,"re": 1400}
+r_dim = {
+    10: {"Face_A": 280+5, "Face_B": 280+5},
+    16: {"Face_A": 370+5, "Face_B": 370+5},
+    18: {"Face_A": 400+5, "Face_B": 400+5},
+    23: {"Face_A": 475+5, "Face_B": 475+5},
+    }
 
-tracao_eds_pr2 = {"vante": 400, "re": 400}
-tracao_eds_pr = {"vante": 400, "re": 400}
 
-vao = {"vante":  250 ,"re": 250}
+# =============================================================
+# Cálculo
+# =============================================================
 
-vao_de_peso =  {"min":50,"max":300 }
+def carregar_db_cabos(caminho: str = CAMINHO_DB_CABOS) -> pd.DataFrame:
+    """Tabela de cabos como DataFrame (coluna 'Cabo' + colunas da planilha)."""
+    return pd.DataFrame(carregar_tabela_cabos(caminho))
 
-vao_regulador = {"vante":  250 ,"re":250}
 
+@dataclass(frozen=True, slots=True)
+class PropriedadesCabo:
+    """Colunas da tabela de cabos usadas no cálculo (unidades da planilha)."""
+    nome: str
+    diametro_mm: float
+    peso_kgfm: float
+    E: float
+    S: float
+    COEF: float
 
-isolador = {"comprimento": 1.5,"area": 0.59, "peso": 50 }
 
-nome_estrutura = " 0/2"
-altura_estrutura = 21
-geometria_estrutura = {
-    "Fase_1": {"H": 3.8, "X": -1.9, "Tipo": "Suspensao", "cabo": cabo, "qtd": qtd_cabo_fase},
-    "Fase_2": {"H": 2.04, "X": 1.8, "Tipo": "Suspensao", "cabo": cabo, "qtd": qtd_cabo_fase},
-    "Fase_3": {"H": 4.73, "X": 1.8, "Tipo": "Suspensao", "cabo": cabo, "qtd": qtd_cabo_fase},
-    "Cabo_PR_1": {"H": 0.2, "X": 0, "Tipo": "Suspensao", "cabo": cabo_pr1, "qtd": qtd_cabo_pr},
+# campo de PropriedadesCabo -> coluna da tabela de cabos
+COLUNAS_PROPRIEDADES_CABO = {
+    "diametro_mm": "Diametro (mm)",
+    "peso_kgfm": "Peso (kgf/m)",
+    "E": "E",
+    "S": "S",
+    "COEF": "COEF",
 }
 
-peso_homens = 200
 
-dt_tipo = { 
-    1500:3,
-    2000:6,
-    2500:6,
-    3000:6,
-    4000:9,  
+def propriedades_cabos(db_cabos: pd.DataFrame, nomes: Iterable[str]) -> Dict[str, PropriedadesCabo]:
+    """
+    Resolve de uma vez as propriedades dos cabos `nomes` ({nome: PropriedadesCabo}).
+    Com nomes repetidos na tabela vale a primeira linha, como no .iloc[0] usado antes.
+    """
+    nomes = list(dict.fromkeys(nomes))
+    linhas = db_cabos.drop_duplicates("Cabo").set_index("Cabo")
+    faltando = [n for n in nomes if n not in linhas.index]
+    if faltando:
+        raise ValueError(f"Cabo(s) não encontrado(s) na tabela de cabos: {faltando}")
+    colunas = linhas.loc[nomes, list(COLUNAS_PROPRIEDADES_CABO.values())].to_numpy(dtype=float)
+    return {
+        nome: PropriedadesCabo(nome, *map(float, valores))
+        for nome, valores in zip(nomes, colunas)
     }
 
-r_tipo = {
-    1500:10,
-    2000:10,
-    2500:16,
-    3000:18,
-    4000:23
+
+def _mudanca_estado_cabo(
+    cabo: PropriedadesCabo, vao: float, p1: float, p2: float, t1: float, t2: float, T0: float
+) -> float:
+    return ml.mudanca_estado(cabo.E, cabo.S, vao, cabo.COEF, p1, p2, t1, t2, T0)
+
+
+# Árvore de carga por hipótese: fórmula, grupo de fator_sobrecarga e fator do
+# vento no cabo. Grupo None mantém os fatores da hipótese anterior, como no laço
+# original (6-10 e 18 usam os de "Vento Máximo"). Hipótese fora da tabela: ("normal", None, 1.0).
+COEFICIENTES_HIPOTESES: Dict[int, Tuple[str, Optional[str], float]] = {
+    **{h: ("normal", "Vento Máximo", 1.0) for h in range(1, 6)},
+    **{h: ("normal", None, 0.25) for h in range(6, 11)},
+    11: ("construcao", "Construção/Manutenção", 1.0),
+    12: ("ruptura_condutor_re", "Ruptura de cabo", 1.0),
+    13: ("ruptura_condutor_vante", "Ruptura de cabo", 1.0),
+    14: ("ruptura_pr_re", "Ruptura de cabo", 1.0),
+    15: ("ruptura_pr_vante", "Ruptura de cabo", 1.0),
+    16: ("cascata", "Contenção em cascata", 1.0),
+    17: ("temperatura_minima", "Vento Máximo", 1.0),
+    18: ("terminal", None, 1.0),
+}
+
+
+def montar_arvore_carga(
+    hipoteses: Dict[int, Dict[str, Any]],
+    geometria_estrutura: Dict[str, Dict[str, Any]],
+    cabos: Dict[str, PropriedadesCabo],
+    forca_isolador: Dict[int, Dict[str, Dict[str, float]]],
+    pressao_vento_cabo: Dict[int, Dict[str, Dict[str, float]]],
+    tracao_cabo1: Dict[int, Dict[str, Dict[str, float]]],
+    fator_sobrecarga: Dict[str, Dict[str, float]],
+    *,
+    isolador: Dict[str, float],
+    vao: Dict[str, float],
+    vao_de_peso: Dict[str, float],
+    deflexao: float,
+    diametro_mm: float,
+) -> Dict[int, Dict[str, Dict[str, int]]]:
+    """
+    Cargas T, Vmin, Vmax e L (com fatores de sobrecarga) por hipótese e ponto
+    de fixação, calculadas em arrays (hipóteses × pontos).
+
+    Cada fórmula de COEFICIENTES_HIPOTESES é avaliada na grade inteira e as
+    linhas das hipóteses que a usam são copiadas; fatores de sobrecarga e do
+    vento no cabo são colunas por hipótese.
+    """
+    ids = list(hipoteses)
+    pontos = list(geometria_estrutura)
+    forma = (len(ids), len(pontos))
+    coefs = [COEFICIENTES_HIPOTESES.get(h, ("normal", None, 1.0)) for h in ids]
+
+    # ---- tabelas por hipótese (uma linha por hipótese) ----
+    grupos: List[str] = []
+    for h, (_, grupo, _) in zip(ids, coefs):
+        grupo = grupo or (grupos[-1] if grupos else None)
+        if grupo is None:
+            raise ValueError(f"Hipótese {h} sem fator de sobrecarga definido.")
+        grupos.append(grupo)
+    FS_T, FS_L, FS_V_normal, FS_V_reduzido = (
+        np.array([[fator_sobrecarga[g][k]] for g in grupos], dtype=float).reshape(-1, 1)
+        for k in ("T", "L", "V_normal", "V_reduzido")
+    )
+    fator_vento = np.array([f for _, _, f in coefs], dtype=float).reshape(-1, 1)
+    formula = [f for f, _, _ in coefs]
+
+    # ---- grades hipóteses × pontos ----
+    qtd = np.array([geometria_estrutura[c]["qtd"] for c in pontos], dtype=float)
+    peso = np.array([cabos[geometria_estrutura[c]["cabo"]].peso_kgfm for c in pontos], dtype=float)
+    pr = np.array([c.startswith("Cabo_PR") for c in pontos], dtype=bool)
+
+    def grade(dados: Dict[int, Dict[str, Dict[str, float]]], campo: str, padrao: Optional[float] = None) -> np.ndarray:
+        return np.array([
+            [dados[h][c][campo] if padrao is None or c in dados[h] else padrao for c in pontos]
+            for h in ids
+        ], dtype=float).reshape(forma)
+
+    Tr, Tv = grade(tracao_cabo1, "re"), grade(tracao_cabo1, "vante")
+    pv_re, pv_vante = grade(pressao_vento_cabo, "re"), grade(pressao_vento_cabo, "vante")
+    T_isolador = grade(forca_isolador, "Forca T", 0.0)
+    L_isolador = grade(forca_isolador, "Forca L", 0.0)
+    V_isolador = np.array([
+        [isolador["peso"] if c in forca_isolador[h] else 0 for c in pontos] for h in ids
+    ], dtype=float).reshape(forma)
+
+    cos_meia = np.cos(np.radians(deflexao/2))
+    sin_meia = np.sin(np.radians(deflexao/2))
+
+    # ---- termos comuns ----
+    Ac_vante = fator_vento*pv_vante * (diametro_mm /1000) * vao["vante"]
+    Ac_re = fator_vento*pv_re * (diametro_mm /1000) * vao["re"]
+    Ac_T = 0.5*(Ac_vante + Ac_re)*cos_meia
+    Ac_L = 0.5*(Ac_vante - Ac_re)*cos_meia
+    Tc_T = (Tr + Tv)*sin_meia
+    Tc_L = np.abs((Tr - Tv)*cos_meia)
+    maximo_T = np.maximum(Tr, Tv)
+
+    T_normal = qtd*(Ac_T + Tc_T) + T_isolador
+    L_normal = qtd*(Ac_L + Tc_L) + L_isolador
+    Vmin_cabo = np.broadcast_to(qtd*vao_de_peso["min"]*peso, forma)
+    Vmax_cabo = np.broadcast_to(qtd*vao_de_peso["max"]*peso, forma)
+    Vmin_normal = Vmin_cabo + V_isolador
+    Vmax_normal = Vmax_cabo + V_isolador
+
+    # ---- cabos mais altos (rompidos em 12-15); como antes, só com a hipótese 12 ----
+    mais_alto_condutor = np.zeros(len(pontos), dtype=bool)
+    mais_alto_pr = np.zeros(len(pontos), dtype=bool)
+    if 12 in hipoteses:
+        altura = np.array([max(geometria_estrutura[c]["H_re"], geometria_estrutura[c]["H_vante"]) for c in pontos])
+        for alvo, mascara in ((mais_alto_pr, pr), (mais_alto_condutor, ~pr)):
+            if mascara.any():
+                alvo[np.flatnonzero(mascara)[np.argmax(altura[mascara])]] = True
+
+    # ---- fórmulas: (T, L, Vmin, Vmax) na grade inteira ----
+    def ruptura_condutor(T_rompido: np.ndarray) -> Tuple[np.ndarray, ...]:
+        fator = np.where(mais_alto_condutor, 0.7, 1.0)
+        return (
+            np.where(mais_alto_condutor, T_rompido*sin_meia*qtd, ((Tr + Tv)*sin_meia + Ac_T)*qtd),
+            np.where(mais_alto_condutor, 1*T_rompido*cos_meia*qtd, (Tr - Tv)*cos_meia*qtd),
+            Vmin_cabo*fator,
+            Vmax_cabo*fator,
+        )
+
+    def ruptura_pr(T_rompido: np.ndarray, angulo_rad: float) -> Tuple[np.ndarray, ...]:
+        # ângulo + Ac_T dentro do seno e V_isolador somado a T: fórmulas originais
+        fator = np.where(mais_alto_pr, 0.7, 1.0)
+        return (
+            np.where(mais_alto_pr, T_rompido*np.sin(angulo_rad + Ac_T)*qtd + V_isolador, T_normal),
+            np.where(mais_alto_pr, 1.25*T_rompido*np.cos(angulo_rad)*qtd + L_isolador, L_normal),
+            Vmin_normal*fator,
+            Vmax_normal*fator,
+        )
+
+    formulas: Dict[str, Callable[[], Tuple[np.ndarray, ...]]] = {
+        "normal": lambda: (T_normal, L_normal, Vmin_normal, Vmax_normal),
+        "construcao": lambda: (
+            (Tr + Tv)*sin_meia*qtd,
+            0.1132*qtd*maximo_T,
+            np.zeros(forma),
+            1.25*qtd*maximo_T*0.93,
+        ),
+        "ruptura_condutor_re": lambda: ruptura_condutor(Tr),
+        "ruptura_condutor_vante": lambda: ruptura_condutor(Tv),
+        "ruptura_pr_re": lambda: ruptura_pr(Tr, np.radians(deflexao/2)),
+        "ruptura_pr_vante": lambda: ruptura_pr(Tv, np.radians(deflexao)),
+        "cascata": lambda: (T_normal, maximo_T*np.where(pr, 0.60, 0.40)*qtd, Vmin_normal, Vmax_normal),
+        "temperatura_minima": lambda: (
+            ((Tr + Tv)*sin_meia + Ac_T)*qtd + T_isolador,
+            (Tr - Tv)*cos_meia*qtd + L_isolador,
+            Vmin_normal,
+            Vmax_normal,
+        ),
+        "terminal": lambda: (
+            qtd*np.maximum(Ac_T, maximo_T*sin_meia) + T_isolador,
+            qtd*np.maximum(Ac_L, np.maximum(np.abs(Tr), np.abs(Tv))*cos_meia) + L_isolador,
+            Vmin_normal,
+            Vmax_normal,
+        ),
+    }
+    cargas = np.zeros((4,) + forma)  # T, L, Vmin, Vmax
+    for nome in dict.fromkeys(formula):
+        linhas = np.array([f == nome for f in formula])
+        cargas[:, linhas] = np.stack(formulas[nome]())[:, linhas]
+    T_cabo, L_cabo, Vmin, Vmax = cargas
+
+    T = np.rint(T_cabo*FS_T).astype(int)
+    L = np.rint(np.abs(L_cabo*FS_L)).astype(int)
+    Vmin = np.rint(Vmin*FS_V_reduzido).astype(int)
+    Vmax = np.rint(Vmax*FS_V_normal).astype(int)
+    return {
+        h: {
+            chave: {"T": int(T[i, j]), "Vmin": int(Vmin[i, j]), "Vmax": int(Vmax[i, j]), "L": int(L[i, j])}
+            for j, chave in enumerate(pontos)
+        }
+        for i, h in enumerate(ids)
     }
 
-dt_dim = {
-    3:{"Face_A": 224+5, "Face_B": 170+5 },
-    6:{"Face_A": 308+5, "Face_B": 230+5 },
-    9:{"Face_A": 392+5, "Face_B": 290+5 },
+
+def calcular_arvore_carga(
+    estrutura: Dict[str, Any],
+    linha: Dict[str, Any],
+    *,
+    db_cabos: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
+    """
+    Calcula a árvore de carga de uma estrutura.
+
+    Args:
+        estrutura: dados da estrutura (ver ESTRUTURA_EXEMPLO).
+        linha: dados comuns da linha (ver LINHA_EXEMPLO); chaves repetidas
+            em `estrutura` prevalecem.
+        db_cabos: tabela de cabos já carregada (padrão: carregar_db_cabos()).
+
+    Returns:
+        Dicionário com as entradas usadas e os resultados intermediários e
+        finais (arvore_carga, momentoT, momentoL, carga_resultante, ...),
+        consumido por salvar_em_txt, gerar_graficos e gerar_memorial.
+    """
+    p = {**linha, **estrutura}
+    dbCabos = carregar_db_cabos() if db_cabos is None else db_cabos
+
+    rugosidade = p["rugosidade"]
+    terreno = p["terreno"]
+    altitude = p["altitude"]
+    temperatura = p["temperatura"]
+    vento = p["vento"]
+    cabo = p["cabo"]
+    cabo_pr1 = p["cabo_pr1"]
+    cabo_pr2 = p["cabo_pr2"]
+    tracao_eds = p["tracao_eds"]
+    tracao_eds_pr = p["tracao_eds_pr"]
+    tracao_eds_pr2 = p["tracao_eds_pr2"]
+    isolador = p["isolador"]
+    altura_estrutura = p["altura_estrutura"]
+    poste = p["poste"]
+    Carga_inicial = p["Carga_inicial"]
+    deflexao = p["deflexao"]
+    deflexao_bissetriz = p["deflexao_bissetriz"]
+    vao = p["vao"]
+    vao_de_peso = p["vao_de_peso"]
+    vao_regulador = p["vao_regulador"]
+    # a geometria recebe alturas corrigidas e fatores: copia para não alterar a entrada
+    geometria_estrutura = copy.deepcopy(p["geometria_estrutura"])
+
+    L_tronco  = altura_estrutura/4
+    incremento_A = 28*L_tronco
+    incremento_B = 20*L_tronco
+
+
+    tronco = {1: copy.deepcopy(dt_dim[dt_tipo[Carga_inicial]])}
+
+
+    con_a = 28
+    con_b = 20
+
+    if poste =="R":
+        tronco = {1: copy.deepcopy(r_dim[r_tipo[Carga_inicial]])}
+        con_a = 15
+        con_b = 15
+
+
+    for i in range(2, 2 + 4):
+        tronco[i] = {'Face_A': tronco[i-1]['Face_A'] + incremento_A, 'Face_B': tronco[i-1]['Face_B'] + incremento_B}
+        tronco[i-1]["area_A"] = (tronco[i-1]['Face_A'] +tronco[i]['Face_A'])* L_tronco/2000
+        tronco[i-1]["area_B"] = (tronco[i-1]['Face_B'] +tronco[i]['Face_B'])* L_tronco/2000
+        tronco[i-1]["centroide"] = round((L_tronco / 3) * (
+            (tronco[i - 1]["Face_A"]*2 + tronco[i]["Face_A"]) /
+            (tronco[i - 1]["Face_A"] + tronco[i]["Face_A"])) + (5-i)*L_tronco,2)
+
+        tronco[i - 1]["gt"] = round(ml.GT(tronco[i-1]["centroide"], rugosidade),2)
+        tronco[i-1]["secaoA"] = round( (tronco[1]["Face_A"] + (altura_estrutura - tronco[i-1]["centroide"])*con_a)/1000,2)
+        tronco[i-1]["secaoB"] = round((tronco[1]["Face_B"] + (altura_estrutura - tronco[i-1]["centroide"])*con_b)/1000,2)
+
+
+    # propriedades resolvidas uma vez; os laços abaixo só consultam o dicionário
+    cabos = propriedades_cabos(dbCabos, [cabo, *(fase["cabo"] for fase in geometria_estrutura.values())])
+    dadosCabo = dbCabos[dbCabos['Cabo'] == cabo]
+    dados_pr1 = dbCabos[dbCabos['Cabo'] == cabo_pr1]
+    condutor = cabos[cabo]
+
+    # Cada estado físico distinto (cabo, vão, T_EDS, t1, t2, p1, p2) é resolvido uma
+    # vez por execução: hipóteses sem vento à mesma temperatura e ré/vante iguais
+    # repetem a mesma solução. cache_info().hits = soluções economizadas.
+    mudanca_estado = lru_cache(maxsize=None)(_mudanca_estado_cabo)
+
+    tracao_min = {
+        "vante": mudanca_estado(
+            condutor,
+            float(vao["vante"]),
+            condutor.peso_kgfm,
+            condutor.peso_kgfm,
+            float(temperatura["EDS"]),
+            float(temperatura["minima"]),
+            float(tracao_eds["vante"]),
+        ),
+
+        "re":  mudanca_estado(
+            condutor,
+            float(vao["re"]),
+            condutor.peso_kgfm,
+            condutor.peso_kgfm,
+            float(temperatura["EDS"]),
+            float(temperatura["minima"]),
+            float(tracao_eds["re"]),
+        ),
     }
 
-r_dim = {
-    10:{"Face_A": 280+5, "Face_B": 280+5 },
-    16:{"Face_A": 370+5, "Face_B": 370+5 },
-    18:{"Face_A": 400+5, "Face_B": 400+5 },
-    23:{"Face_A": 475+5, "Face_B": 475+5 },
+    Cxposte = 2 ## mudar para circular
+
+    if poste == "R":
+        Cxposte = 1.2
+    #hipoteses
+    hipoteses = {
+        1: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 90, "nome": "Vento máximo Transversal"},
+        2: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 0, "nome": "Vento máximo Longitudinal"},
+        3: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 45, "nome": "Vento máximo a 45 graus"},
+        4: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 60, "nome": "Vento máximo a 60 graus"},
+        5: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 75, "nome": "Vento máximo a 75 graus"},
+        6: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 90, "nome": "Vento de alta intensidade Transversal"},
+        #7: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 0, "nome": "Vento de alta intensidade Longitudinal"},
+        8: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 45, "nome": "Vento de alta intensidade a 45 graus"},
+        9: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 60, "nome": "Vento de alta intensidade a 60 graus"},
+        10: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 75, "nome": "Vento de alta intensidade a 75 graus"},
+        11: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0, "nome": "Construção/Manutenção"},                           # construcao
+        12: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0, "nome": "Cabo condutor rompido a vante"},                           #cabo rompido vante
+        #13: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "Cabo condutor rompido a ré"},                           #cabo rompido re
+        14: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "PR rompido a vante"},                           #pr rompido vante
+        15: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "PR rompido a ré"},                           #pr rompido re
+        #16: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "Contenção em cascata"},                           #Contenção em cascata
+        17: {'Temperatura': temperatura["minima"], 'Vento': 0, 'Ângulo': 0,"nome": "Temperatura mínima"},
+        #18: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 90, "nome": "Terminal"},
     }
 
-L_tronco  = altura_estrutura/4
-incremento_A = 28*L_tronco
-incremento_B = 20*L_tronco
-
-
-tronco = {1:dt_dim[dt_tipo[Carga_inicial]]}
-
-
-
-con_a = 28
-con_b = 20
-
-if poste =="R": 
-    tronco = {1:r_dim[r_tipo[Carga_inicial]]}
-    con_a = 15
-    con_b = 15
-
-
-for i in range(2, 2 + 4):
-    tronco[i] = {'Face_A': tronco[i-1]['Face_A'] + incremento_A, 'Face_B': tronco[i-1]['Face_B'] + incremento_B}
-    tronco[i-1]["area_A"] = (tronco[i-1]['Face_A'] +tronco[i]['Face_A'])* L_tronco/2000
-    tronco[i-1]["area_B"] = (tronco[i-1]['Face_B'] +tronco[i]['Face_B'])* L_tronco/2000
-    tronco[i-1]["centroide"] = round((L_tronco / 3) * (
-        (tronco[i - 1]["Face_A"]*2 + tronco[i]["Face_A"]) /
-        (tronco[i - 1]["Face_A"] + tronco[i]["Face_A"])) + (5-i)*L_tronco,2) 
-    
-    tronco[i - 1]["gt"] = round(ml.GT(tronco[i-1]["centroide"], rugosidade),2)
-    tronco[i-1]["secaoA"] = round( (tronco[1]["Face_A"] + (altura_estrutura - tronco[i-1]["centroide"])*con_a)/1000,2)
-    tronco[i-1]["secaoB"] = round((tronco[1]["Face_B"] + (altura_estrutura - tronco[i-1]["centroide"])*con_b)/1000,2)
-
-
-
-dbCabos = dados_excel = pd.read_excel("_db/cabos.xlsx")
-dadosCabo = dbCabos[dbCabos['Cabo'] == cabo]
-dados_pr1 = dbCabos[dbCabos['Cabo'] == cabo_pr1]
-dados_pr2 = dbCabos[dbCabos['Cabo'] == cabo_pr2]
-tracao_min = {
-    "vante": ml.mudanca_estado(
-        float(dadosCabo["E"].iloc[0]),
-        float(dadosCabo["S"].iloc[0]),
-        float(vao["vante"]),
-        float(dadosCabo["COEF"].iloc[0]),
-        float(dadosCabo["Peso (kgf/m)"].iloc[0]),
-        float(dadosCabo["Peso (kgf/m)"].iloc[0]),
-        float(temperatura["EDS"]),
-        float(temperatura["minima"]),
-        float(tracao_eds["vante"]),
-    ),
-    
-    "re":  ml.mudanca_estado(
-        float(dadosCabo["E"].iloc[0]),
-        float(dadosCabo["S"].iloc[0]),
-        float(vao["re"]),
-        float(dadosCabo["COEF"].iloc[0]),
-        float(dadosCabo["Peso (kgf/m)"].iloc[0]),
-        float(dadosCabo["Peso (kgf/m)"].iloc[0]),
-        float(temperatura["EDS"]),
-        float(temperatura["minima"]),
-        float(tracao_eds["re"]),
-    ),
-}
+    fator_sobrecarga = {
+        "Ruptura de cabo":  {"T": 1, "L": 1, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
+        "Vento de alta intensidade":  {"T": 1, "L": 1, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
+        "Vento Máximo":  {"T": 1.15, "L": 1.15, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
+        "Contenção em cascata":  {"T": 1, "L": 1, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
+        "Construção/Manutenção": {"T": 1.5, "L":1.5, "V_normal": 1.5, "V_reduzido": 1.5 if vao_de_peso["min"] < 0 else 0.67 },
+         }
 
-Cxposte = 2 ## mudar para circular
-
-if poste == "R":
-    Cxposte = 1.2
-#hipoteses
-hipoteses = {
-    1: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 90, "nome": "Vento máximo Transversal"},
-    2: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 0, "nome": "Vento máximo Longitudinal"},
-    3: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 45, "nome": "Vento máximo a 45 graus"},
-    4: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 60, "nome": "Vento máximo a 60 graus"},
-    5: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 75, "nome": "Vento máximo a 75 graus"},
-    6: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 90, "nome": "Vento de alta intensidade Transversal"},
-    #7: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 0, "nome": "Vento de alta intensidade Longitudinal"},
-    8: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 45, "nome": "Vento de alta intensidade a 45 graus"},
-    9: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 60, "nome": "Vento de alta intensidade a 60 graus"},
-    10: {'Temperatura': temperatura["coincidente"], 'Vento': vento["extremo"], 'Ângulo': 75, "nome": "Vento de alta intensidade a 75 graus"},
-    11: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0, "nome": "Construção/Manutenção"},                           # construcao
-    12: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0, "nome": "Cabo condutor rompido a vante"},                           #cabo rompido vante
-    #13: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "Cabo condutor rompido a ré"},                           #cabo rompido re
-    14: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "PR rompido a vante"},                           #pr rompido vante
-    15: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "PR rompido a ré"},                           #pr rompido re 
-    #16: {'Temperatura': temperatura["EDS"], 'Vento': 0, 'Ângulo': 0,"nome": "Contenção em cascata"},                           #Contenção em cascata
-    17: {'Temperatura': temperatura["minima"], 'Vento': 0, 'Ângulo': 0,"nome": "Temperatura mínima"},
-    #18: {'Temperatura': temperatura["coincidente"], 'Vento': vento["projeto"], 'Ângulo': 90, "nome": "Terminal"},
-}
 
-fator_sobrecarga = {
-    "Ruptura de cabo":  {"T": 1, "L": 1, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
-    "Vento de alta intensidade":  {"T": 1, "L": 1, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
-    "Vento Máximo":  {"T": 1.15, "L": 1.15, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
-    "Contenção em cascata":  {"T": 1, "L": 1, "V_normal": 1.15, "V_reduzido": 1.15 if vao_de_peso["min"] < 0 else 0.87},
-    "Construção/Manutenção": {"T": 1.5, "L":1.5, "V_normal": 1.5, "V_reduzido": 1.5 if vao_de_peso["min"] < 0 else 0.67 },
-     }
+    massa = ml.massa_do_ar(temperatura["coincidente"], altitude)
 
+    pressoes_referencia = {
+        key: ml.pressao(massa, value) for key, value in vento.items()
+    }
 
-massa = ml.massa_do_ar(temperatura["coincidente"], altitude)
+    # CORRIGINDO A ALTURA DAS ESTRUTURAS
+    for chave, fase in geometria_estrutura.items():
+         fase["H"] = altura_estrutura - fase["H"]
+         peso = cabos[fase["cabo"]].peso_kgfm
+         fase["H_re"] =  round(fase["H"] - (peso*vao["re"]**2)/(12*tracao_min["re"]),2)
+         fase["H_vante"] =  round(fase["H"] - (peso*vao["vante"]**2)/(12*tracao_min["vante"]),2)
+         if fase["Tipo"] == "Suspensão":
+             fase["H_re"] = fase["H_re"]-isolador["comprimento"]
+             fase["H_vante"] = fase["H_vante"]-isolador["comprimento"]
+         fase["gc_re"] = ml.GC(fase["H_re"], rugosidade)
+         fase["gc_vante"] = ml.GC(fase["H_vante"], rugosidade)
 
-pressoes_referencia = {
-    key: ml.pressao(massa, value) for key, value in vento.items()
-}
-        
-# CORRIGINDO A ALTURA DAS ESTRUTURAS
-for chave, fase in geometria_estrutura.items():
-     fase["H"] = altura_estrutura - fase["H"]
-     peso = float(dbCabos.loc[dbCabos['Cabo'] == fase["cabo"], "Peso (kgf/m)"].iloc[0])
-     fase["H_re"] =  round(fase["H"] - (peso*vao["re"]**2)/(12*tracao_min["re"]),2)
-     fase["H_vante"] =  round(fase["H"] - (peso*vao["vante"]**2)/(12*tracao_min["vante"]),2)
-     if fase["Tipo"] == "Suspensão":
-         fase["H_re"] = fase["H_re"]-isolador["comprimento"]
-         fase["H_vante"] = fase["H_vante"]-isolador["comprimento"]
-     fase["gc_re"] = ml.GC(fase["H_re"], rugosidade)
-     fase["gc_vante"] = ml.GC(fase["H_vante"], rugosidade)
-     
-gl = {"vante": ml.GL(vao["vante"]),
-      "re": ml.GL(vao["re"]),
-      }    
-
-
-#CRIANDO A GEOMETRIA DO ISOLADOR
-geometria_isolador = {}
-
-for chave, fase in geometria_estrutura.items():
-    if chave.startswith("Fase"):
-        # Se a chave for uma fase, crie a geometria do isolador
-        isolador_geometria = {
-            "H": fase["H"] - isolador["comprimento"] / 2 if fase["Tipo"] == "Suspensão" else fase["H"],
-            "X": fase["X"]
-        }
-        geometria_isolador[chave] = isolador_geometria
-        
-        
-                    
-for chave, fase in geometria_isolador.items():
-    # Calcule o valor de gt para a altura H na fase e um tipo de terreno (você deve substituir 'Terreno' pelo valor real)
-    gt = ml.GT(fase["H"], terreno)
-    
-    # Adicione o valor de gt à geometria do isolador
-    fase["gt"] = gt
-
-for fase, valores in geometria_isolador.items():
-    valores['pre_pro'] = round(valores['gt'] *pressoes_referencia["projeto"]*1.2,2)
-    valores['pre_ext'] =round( valores['gt'] *pressoes_referencia["extremo"]*1.2,2)
-
-
-
-# Inicialize o dicionário para armazenar as forças para cada hipótese e fase
-forca_isolador = {}
-pressao_vento_cabo = {}
-tracao_cabo = {}
-tracao_cabo1 = {}
-pressao_ven_cabo = {}
-arvore_carga = {}
-arvore_carga_poste = {}
-forca_poste =  {}
-Cx_cabo = 1
-pressao_tronco = {}
-
-
-
-# Loop sobre as hipóteses em hipoteses
-for hipotese, parametros_hipotese in hipoteses.items():
-    # Inicialize o dicionário para armazenar as forças para cada fase
-    forcas_por_fase = {}
-    temp = parametros_hipotese['Temperatura']
-    vento_1= parametros_hipotese['Vento']
-    angulo = parametros_hipotese['Ângulo']
-    
-    # Inicialize o dicionário para armazenar as pressões para cada cabo
-    pressao_ven_cabo = {}
-    forcas_por_tronco = {}
-    pressao_tronco_int = {}
-    
-    # Loop sobre as fases em geometria_isolador
-    for fase, parametros_fase in geometria_isolador.items():
-        # Calcule as forças longitudinais e transversais para cada hipótese e fase
-        pressao_longitudinal = round(ml.pressao(massa, vento_1)*parametros_fase["gt"]*np.cos(np.radians(angulo)), 2)*1.2
-        pressao_trans = round(ml.pressao(massa, vento_1)*parametros_fase["gt"]*np.sin(np.radians(angulo)), 2)*1.2
-        
-        if 6 <= hipotese <= 10:
-            pressao_longitudinal = round(ml.pressao(massa, vento_1)*1*np.cos(np.radians(angulo)), 2)*1.2
-            pressao_trans = round(ml.pressao(massa, vento_1)*1*np.sin(np.radians(angulo)), 2)*1.2
-            
-        
-        forcas_longitudinais = round(pressao_longitudinal*isolador["area"], 2)
-        forcas_transversais = round(pressao_trans*isolador["area"], 2)
-        
-        # Armazene as forças no dicionário forcas_por_fase
-        forcas_por_fase[fase] = {
-            "Forca L": forcas_longitudinais,
-            "Forca T": forcas_transversais
-        }
-        
-        
-    
-    # Armazene as forças para cada hipótese no dicionário forcas_por_hipotese_e_fase
-    forca_isolador[hipotese] = forcas_por_fase
-    
-    for chave, valor in geometria_estrutura.items():
-        
-        if dbCabos[dbCabos['Cabo'] == valor["cabo"]]["Diametro (mm)"].iloc[0] < 15:
-            Cx_cabo = 1.2
-        
-        
-        pressao_vante = ml.pressao_cabo(gl["vante"], valor["gc_vante"], ml.pressao(massa, vento_1), angulo)*Cx_cabo
-        pressao_re = ml.pressao_cabo(gl["re"], valor["gc_re"], ml.pressao(massa, vento_1), angulo)*Cx_cabo
-        
-        
-        if 6 <= hipotese <= 10:
-            pressao_vante = ml.pressao_cabo(1, 1, ml.pressao(massa, vento_1), angulo)
-            pressao_re = ml.pressao_cabo(1, 1, ml.pressao(massa, vento_1), angulo)  
-        
-        pressao_ven_cabo[chave] = {
-            "re": pressao_re,
-            "vante": pressao_vante,
-        }
-    
-    # Armazene as pressões para cada hipótese no dicionário pressao_vento_cabo
-    pressao_vento_cabo[hipotese] = pressao_ven_cabo
-    
-    for i, (chave, valor) in enumerate(tronco.items()):
-      if i < len(tronco) - 1:
-        pressao_longitudinal_1 = round(ml.pressao(massa, vento_1)*valor["gt"]*np.cos(np.radians(angulo)), 2)*Cxposte
-        pressao_trans_1 = round(ml.pressao(massa, vento_1)*valor["gt"]*np.sin(np.radians(angulo)), 2)*Cxposte
-        
-        if 6 <= hipotese <= 10:
-            pressao_longitudinal_1 = round(ml.pressao(massa, vento_1)*1*np.cos(np.radians(angulo)), 2)*Cxposte
-            pressao_trans_1 = round(ml.pressao(massa, vento_1)*1*np.sin(np.radians(angulo)), 2)*Cxposte
-            
-        
-        forcas_longitudinais = round(pressao_longitudinal_1*valor["secaoA"]*L_tronco, 2)
-        forcas_transversais = round(pressao_trans_1*valor["secaoB"]*L_tronco, 2)
-        
-        # Armazene as forças no dicionário forcas_por_fase
-        forcas_por_tronco[chave] = {
-            "Forca L": int(round(forcas_longitudinais,0)),
-            "Forca T": int(round(forcas_transversais,0))
-        }
-        
-        pressao_tronco_int[chave] = {
-           "L": round(pressao_longitudinal_1,2),
-           "T": round(pressao_trans_1,0) 
-        }
-    
-    # Armazene as forças para cada hipótese no dicionário forcas_por_hipotese_e_fase
-    forca_poste[hipotese] = forcas_por_tronco
-    pressao_tronco[hipotese] = pressao_tronco_int
-      
-for hipotese, parametros_hipotese in hipoteses.items():
-    # Inicialize o dicionário para armazenar as forças para cada fase
-    forcas_por_fase = {}
+    gl = {"vante": ml.GL(vao["vante"]),
+          "re": ml.GL(vao["re"]),
+          }
+
+
+    #CRIANDO A GEOMETRIA DO ISOLADOR
+    geometria_isolador = {}
+
+    for chave, fase in geometria_estrutura.items():
+        if chave.startswith("Fase"):
+            # Se a chave for uma fase, crie a geometria do isolador
+            isolador_geometria = {
+                "H": fase["H"] - isolador["comprimento"] / 2 if fase["Tipo"] == "Suspensão" else fase["H"],
+                "X": fase["X"]
+            }
+            geometria_isolador[chave] = isolador_geometria
+
+
+    for chave, fase in geometria_isolador.items():
+        # Calcule o valor de gt para a altura H na fase e um tipo de terreno (você deve substituir 'Terreno' pelo valor real)
+        gt = ml.GT(fase["H"], terreno)
+
+        # Adicione o valor de gt à geometria do isolador
+        fase["gt"] = gt
+
+    for fase, valores in geometria_isolador.items():
+        valores['pre_pro'] = round(valores['gt'] *pressoes_referencia["projeto"]*1.2,2)
+        valores['pre_ext'] =round( valores['gt'] *pressoes_referencia["extremo"]*1.2,2)
+
+
+    # Inicialize o dicionário para armazenar as forças para cada hipótese e fase
+    forca_isolador = {}
+    pressao_vento_cabo = {}
     tracao_cabo = {}
-    temp = parametros_hipotese["Temperatura"]
-
-    
-    for chave, valor in geometria_estrutura.items():
-        cabo_selecionado = dbCabos.loc[dbCabos['Cabo'] == valor["cabo"]]
-        
-        E = float(cabo_selecionado["E"].iloc[0])
-        S = float(cabo_selecionado["S"].iloc[0])
-        alpha = float(cabo_selecionado["COEF"].iloc[0])
-        p1 = float(cabo_selecionado["Peso (kgf/m)"].iloc[0])
-        t1 = temperatura["EDS"]
-        t2 = temp
-        
-        diametro_mm = float(cabo_selecionado["Diametro (mm)"].iloc[0])
-        
-        if "Cabo_PR_1" in chave or "Cabo_PR_2" in chave:
-            T0_vante = tracao_eds_pr["vante"]
-            T0_re = tracao_eds_pr["re"]
-            
-            if "Cabo_PR_2" in chave:
-                T0_vante = tracao_eds_pr2["vante"]
-                T0_re = tracao_eds_pr2["re"]
-            
-        else:
-            T0_vante = tracao_eds["vante"]
-            T0_re = tracao_eds["re"]
-        
-        
-        
-        p2_re = np.sqrt(p1**2 + (0.001 * pressao_vento_cabo[hipotese][chave]["re"] * diametro_mm)**2)
-        p2_vante = np.sqrt(p1**2 + (0.001 * pressao_vento_cabo[hipotese][chave]["vante"] * diametro_mm)**2)
-        
-        if 6 <= hipotese <= 10:
-            p2_re = np.sqrt(p1**2 + (0.001*0.25 * pressao_vento_cabo[hipotese][chave]["re"] * diametro_mm)**2)
-            p2_vante = np.sqrt(p1**2 + (0.001*0.25 * pressao_vento_cabo[hipotese][chave]["vante"] * diametro_mm)**2) 
-        
-        tracao_cabo[chave] = {
-            "re": ml.mudanca_estado(E, S, vao_regulador["re"], alpha, p1, p2_re, t1, t2, T0_re),
-            "vante": ml.mudanca_estado(E, S, vao_regulador["vante"], alpha, p1, p2_vante, t1, t2, T0_vante),  
+    tracao_cabo1 = {}
+    pressao_ven_cabo = {}
+    arvore_carga = {}
+    arvore_carga_poste = {}
+    forca_poste =  {}
+    Cx_cabo = 1
+    pressao_tronco = {}
+
+
+    # Loop sobre as hipóteses em hipoteses
+    for hipotese, parametros_hipotese in hipoteses.items():
+        # Inicialize o dicionário para armazenar as forças para cada fase
+        forcas_por_fase = {}
+        temp = parametros_hipotese['Temperatura']
+        vento_1= parametros_hipotese['Vento']
+        angulo = parametros_hipotese['Ângulo']
+
+        # Inicialize o dicionário para armazenar as pressões para cada cabo
+        pressao_ven_cabo = {}
+        forcas_por_tronco = {}
+        pressao_tronco_int = {}
+
+        # Loop sobre as fases em geometria_isolador
+        for fase, parametros_fase in geometria_isolador.items():
+            # Calcule as forças longitudinais e transversais para cada hipótese e fase
+            pressao_longitudinal = round(ml.pressao(massa, vento_1)*parametros_fase["gt"]*np.cos(np.radians(angulo)), 2)*1.2
+            pressao_trans = round(ml.pressao(massa, vento_1)*parametros_fase["gt"]*np.sin(np.radians(angulo)), 2)*1.2
+
+            if 6 <= hipotese <= 10:
+                pressao_longitudinal = round(ml.pressao(massa, vento_1)*1*np.cos(np.radians(angulo)), 2)*1.2
+                pressao_trans = round(ml.pressao(massa, vento_1)*1*np.sin(np.radians(angulo)), 2)*1.2
+
+
+            forcas_longitudinais = round(pressao_longitudinal*isolador["area"], 2)
+            forcas_transversais = round(pressao_trans*isolador["area"], 2)
+
+            # Armazene as forças no dicionário forcas_por_fase
+            forcas_por_fase[fase] = {
+                "Forca L": forcas_longitudinais,
+                "Forca T": forcas_transversais
+            }
+
+
+        # Armazene as forças para cada hipótese no dicionário forcas_por_hipotese_e_fase
+        forca_isolador[hipotese] = forcas_por_fase
+
+        for chave, valor in geometria_estrutura.items():
+
+            # Cx_cabo não volta a 1 entre cabos/hipóteses (comportamento original mantido)
+            if cabos[valor["cabo"]].diametro_mm < 15:
+                Cx_cabo = 1.2
+
+
+            pressao_vante = ml.pressao_cabo(gl["vante"], valor["gc_vante"], ml.pressao(massa, vento_1), angulo)*Cx_cabo
+            pressao_re = ml.pressao_cabo(gl["re"], valor["gc_re"], ml.pressao(massa, vento_1), angulo)*Cx_cabo
+
+
+            if 6 <= hipotese <= 10:
+                pressao_vante = ml.pressao_cabo(1, 1, ml.pressao(massa, vento_1), angulo)
+                pressao_re = ml.pressao_cabo(1, 1, ml.pressao(massa, vento_1), angulo)
+
+            pressao_ven_cabo[chave] = {
+                "re": pressao_re,
+                "vante": pressao_vante,
+            }
+
+        # Armazene as pressões para cada hipótese no dicionário pressao_vento_cabo
+        pressao_vento_cabo[hipotese] = pressao_ven_cabo
+
+        for i, (chave, valor) in enumerate(tronco.items()):
+          if i < len(tronco) - 1:
+            pressao_longitudinal_1 = round(ml.pressao(massa, vento_1)*valor["gt"]*np.cos(np.radians(angulo)), 2)*Cxposte
+            pressao_trans_1 = round(ml.pressao(massa, vento_1)*valor["gt"]*np.sin(np.radians(angulo)), 2)*Cxposte
+
+            if 6 <= hipotese <= 10:
+                pressao_longitudinal_1 = round(ml.pressao(massa, vento_1)*1*np.cos(np.radians(angulo)), 2)*Cxposte
+                pressao_trans_1 = round(ml.pressao(massa, vento_1)*1*np.sin(np.radians(angulo)), 2)*Cxposte
+
+
+            forcas_longitudinais = round(pressao_longitudinal_1*valor["secaoA"]*L_tronco, 2)
+            forcas_transversais = round(pressao_trans_1*valor["secaoB"]*L_tronco, 2)
+
+            # Armazene as forças no dicionário forcas_por_fase
+            forcas_por_tronco[chave] = {
+                "Forca L": int(round(forcas_longitudinais,0)),
+                "Forca T": int(round(forcas_transversais,0))
+            }
+
+            pressao_tronco_int[chave] = {
+               "L": round(pressao_longitudinal_1,2),
+               "T": round(pressao_trans_1,0)
+            }
+
+        # Armazene as forças para cada hipótese no dicionário forcas_por_hipotese_e_fase
+        forca_poste[hipotese] = forcas_por_tronco
+        pressao_tronco[hipotese] = pressao_tronco_int
+
+    for hipotese, parametros_hipotese in hipoteses.items():
+        # Inicialize o dicionário para armazenar as forças para cada fase
+        forcas_por_fase = {}
+        tracao_cabo = {}
+        temp = parametros_hipotese["Temperatura"]
+
+
+        for chave, valor in geometria_estrutura.items():
+            cabo_selecionado = cabos[valor["cabo"]]
+
+            p1 = cabo_selecionado.peso_kgfm
+            t1 = temperatura["EDS"]
+            t2 = temp
+
+            diametro_mm = cabo_selecionado.diametro_mm
+
+            if "Cabo_PR_1" in chave or "Cabo_PR_2" in chave:
+                T0_vante = tracao_eds_pr["vante"]
+                T0_re = tracao_eds_pr["re"]
+
+                if "Cabo_PR_2" in chave:
+                    T0_vante = tracao_eds_pr2["vante"]
+                    T0_re = tracao_eds_pr2["re"]
+
+            else:
+                T0_vante = tracao_eds["vante"]
+                T0_re = tracao_eds["re"]
+
+
+            p2_re = np.sqrt(p1**2 + (0.001 * pressao_vento_cabo[hipotese][chave]["re"] * diametro_mm)**2)
+            p2_vante = np.sqrt(p1**2 + (0.001 * pressao_vento_cabo[hipotese][chave]["vante"] * diametro_mm)**2)
+
+            if 6 <= hipotese <= 10:
+                p2_re = np.sqrt(p1**2 + (0.001*0.25 * pressao_vento_cabo[hipotese][chave]["re"] * diametro_mm)**2)
+                p2_vante = np.sqrt(p1**2 + (0.001*0.25 * pressao_vento_cabo[hipotese][chave]["vante"] * diametro_mm)**2)
+
+            tracao_cabo[chave] = {
+                "re": mudanca_estado(cabo_selecionado, vao_regulador["re"], p1, p2_re, t1, t2, T0_re),
+                "vante": mudanca_estado(cabo_selecionado, vao_regulador["vante"], p1, p2_vante, t1, t2, T0_vante),
+            }
+
+        tracao_cabo1[hipotese] = tracao_cabo
+
+
+    # calculo da árvore de carga (hipóteses × pontos de fixação, ver montar_arvore_carga)
+    # diametro_mm é o do último cabo do laço das trações (comportamento original mantido)
+    arvore_carga = montar_arvore_carga(
+        hipoteses, geometria_estrutura, cabos, forca_isolador, pressao_vento_cabo, tracao_cabo1,
+        fator_sobrecarga, isolador=isolador, vao=vao, vao_de_peso=vao_de_peso,
+        deflexao=deflexao, diametro_mm=diametro_mm,
+    )
+
+     # CALCULO DOS MOMENTOS
+
+    momentoT = {}
+    momentoL = {}
+    resultante = {}
+    ang_resultante = {}
+    fator_reducao = {}
+    carga_resultante={}
+
+    for chave, hipotese in hipoteses.items():
+            momento_t_temp = {}
+            mt = 0
+            m_l = 0
+            res = 0
+            for fase, valor in geometria_estrutura.items():
+                mt += valor["H"]*arvore_carga[chave][fase]["T"] + valor["X"]*arvore_carga[chave][fase]["Vmax"]
+                m_l += valor["H"]*arvore_carga[chave][fase]["L"]
+
+            for i, (troncos, dados2) in enumerate(tronco.items()):
+                 if i < len(tronco) - 1:
+                   mt += dados2["centroide"]*forca_poste[chave][troncos]["Forca T"]
+                   m_l += dados2["centroide"]*forca_poste[chave][troncos]["Forca L"]
+
+            momentoT[chave] = int(round(mt,0))
+            momentoL[chave] = int(round(m_l,0))
+
+            resultante[chave] = int(round(np.sqrt(momentoT[chave]**2 + momentoL[chave]**2)/(altura_estrutura-0.8),0))
+            if poste != "R":
+                ang_resultante[chave] = abs(round( deflexao_bissetriz- np.rad2deg(np.arctan( momentoL[chave]/ momentoT[chave])),2))
+            if poste == "DT":
+                fator_reducao[chave] = round(min(1, 1.0329*np.exp(-0.00722*ang_resultante[chave])),2)
+                if ang_resultante[chave] > 85 :
+                   fator_reducao[chave] = 0.5
+            else:
+                fator_reducao[chave] = 1
+            carga_resultante[chave]= int(round(resultante[chave]/ fator_reducao[chave],0))
+
+
+    info = mudanca_estado.cache_info()
+    resultado = dict(p)
+    resultado.update(
+        geometria_estrutura=geometria_estrutura,
+        tronco=tronco,
+        L_tronco=L_tronco,
+        dadosCabo=dadosCabo,
+        dados_pr1=dados_pr1,
+        cabos=cabos,
+        tracao_min=tracao_min,
+        hipoteses=hipoteses,
+        fator_sobrecarga=fator_sobrecarga,
+        massa=massa,
+        forca_isolador=forca_isolador,
+        pressao_vento_cabo=pressao_vento_cabo,
+        tracao_cabo1=tracao_cabo1,
+        forca_poste=forca_poste,
+        pressao_tronco=pressao_tronco,
+        arvore_carga=arvore_carga,
+        momentoT=momentoT,
+        momentoL=momentoL,
+        resultante=resultante,
+        ang_resultante=ang_resultante,
+        fator_reducao=fator_reducao,
+        carga_resultante=carga_resultante,
+        # dados simples: o resultado volta dos processos de executar_linha por pickle
+        estatisticas_mudanca_estado={"solucoes": info.misses, "reaproveitadas": info.hits},
+    )
+    return resultado
+
+
+def calcular_arvores_carga(
+    estruturas: Iterable[Dict[str, Any]],
+    linha: Dict[str, Any],
+    *,
+    db_cabos: Optional[pd.DataFrame] = None,
+    caminho_db_cabos: str = CAMINHO_DB_CABOS,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Calcula várias estruturas em sequência no mesmo processo, carregando a
+    tabela de cabos uma única vez. Retorna {nome_estrutura: resultado}.
+    """
+    dbCabos = carregar_db_cabos(caminho_db_cabos) if db_cabos is None else db_cabos
+    return {
+        estrutura["nome_estrutura"]: calcular_arvore_carga(estrutura, linha, db_cabos=dbCabos)
+        for estrutura in estruturas
+    }
+
+
+# =============================================================
+# Linha completa em paralelo (uma tarefa por estrutura)
+# =============================================================
+
+# Colunas esperadas na tabela de estruturas; as demais chaves de
+# ESTRUTURA_EXEMPLO/LINHA_EXEMPLO também podem vir como colunas.
+COLUNAS_ESTRUTURAS = (
+    "nome_estrutura", "altura_estrutura", "geometria_estrutura",
+    "vao", "vao_de_peso", "vao_regulador", "deflexao",
+)
+
+
+@dataclass
+class ResultadoLinha:
+    """
+    Resultado de executar_linha: resultados por estrutura (na ordem da tabela)
+    e falhas por estrutura (traceback do processo que calculou).
+    """
+    resultados: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    falhas: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def resumo(self) -> pd.DataFrame:
+        """carga_resultante (daN) por estrutura (linhas) e hipótese (colunas)."""
+        return pd.DataFrame.from_dict(
+            {nome: r["carga_resultante"] for nome, r in self.resultados.items()}, orient="index"
+        ).rename_axis(index="estrutura", columns="hipotese")
+
+    @property
+    def envoltoria(self) -> pd.DataFrame:
+        """Maior carga_resultante de cada hipótese e a estrutura que a produz."""
+        resumo = self.resumo
+        return pd.DataFrame({"carga_resultante": resumo.max(), "estrutura": resumo.idxmax()})
+
+
+def estruturas_de_tabela(tabela: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Converte a tabela de estruturas (DataFrame ou registros) em dicionários
+    para calcular_arvore_carga. Células vazias (None/NaN) são omitidas para
+    que valham os dados da linha.
+    """
+    registros = tabela.to_dict("records") if isinstance(tabela, pd.DataFrame) else list(tabela)
+    estruturas = [
+        {k: v for k, v in registro.items() if not (v is None or (isinstance(v, float) and np.isnan(v)))}
+        for registro in registros
+    ]
+    nomes = [e.get("nome_estrutura") for e in estruturas]
+    if None in nomes:
+        raise ValueError("Toda estrutura precisa de 'nome_estrutura'.")
+    repetidos = sorted({n for n in nomes if nomes.count(n) > 1})
+    if repetidos:
+        raise ValueError(f"Nomes de estrutura repetidos: {repetidos}")
+    return estruturas
+
+
+def imprimir_progresso(concluidas: int, total: int, nome: str, erro: Optional[str]) -> None:
+    """Relatório de progresso padrão de executar_linha."""
+    situacao = "ok" if erro is None else "ERRO: " + erro.strip().splitlines()[-1]
+    print(f"[{concluidas}/{total}] {nome}: {situacao}")
+
+
+def executar_linha(
+    estruturas: Union[pd.DataFrame, Iterable[Dict[str, Any]]],
+    linha: Dict[str, Any],
+    *,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    caminho_db_cabos: str = CAMINHO_DB_CABOS,
+    progresso: Optional[Callable[[int, int, str, Optional[str]], None]] = imprimir_progresso,
+) -> ResultadoLinha:
+    """
+    Calcula a árvore de carga de todas as estruturas da linha em um pool de
+    processos (uma tarefa por estrutura).
+
+    Uma estrutura que falha não interrompe as demais: o traceback fica em
+    ResultadoLinha.falhas. Cada processo carrega a tabela de cabos uma vez.
+
+    Args:
+        estruturas: tabela de estruturas (ver COLUNAS_ESTRUTURAS e estruturas_de_tabela).
+        linha: dados comuns da linha (ver LINHA_EXEMPLO).
+        workers: número de processos (padrão: os.cpu_count()).
+        executor: executor já criado (ex.: ThreadPoolExecutor); ignora workers.
+        caminho_db_cabos: planilha de cabos, relativa ao diretório de trabalho.
+        progresso: chamado a cada estrutura concluída com
+            (concluídas, total, nome, traceback ou None); None desliga.
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("workers deve ser positivo.")
+    lista = estruturas_de_tabela(estruturas)
+    caminho_db_cabos = os.path.abspath(caminho_db_cabos)  # processos podem mudar de diretório
+
+    ex = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+    try:
+        futuros = {
+            ex.submit(_tarefa_arvore_carga, estrutura, linha, caminho_db_cabos): estrutura["nome_estrutura"]
+            for estrutura in lista
         }
-    
-    tracao_cabo1[hipotese] = tracao_cabo
-    
-    
-
-altura_maxima = -float('inf')
-altura_maxima_condutor = -float('inf')
-cabo_condutor_mais_alto = None
-cabo_pr_mais_alto = None
-
-#calculo da árvore de carga
-
-for hipotese, parametros_hipotese in hipoteses.items():
-     carga = {}
-     carga_homens = 200
-     
-     if hipotese == 12: # Identificar cabo mais alto
-             for chave, valor in geometria_estrutura.items():
-                 if chave.startswith("Cabo_PR"):
-                     altura_cabo_pr = max(valor['H_re'], valor['H_vante'])
-                     if altura_cabo_pr > altura_maxima:
-                         altura_maxima = altura_cabo_pr
-                         cabo_pr_mais_alto = chave
-                 else:
-                     altura_cabo_condutor = max(valor['H_re'], valor['H_vante'])
-                     if altura_cabo_condutor > altura_maxima_condutor:
-                         altura_maxima_condutor = altura_cabo_condutor
-                         cabo_condutor_mais_alto = chave
-                         
-     for chave, valor in geometria_estrutura.items():
-         
-         cabo_selecionado = dbCabos.loc[dbCabos['Cabo'] == valor["cabo"]]
-         peso = float(cabo_selecionado["Peso (kgf/m)"].iloc[0])
-         
-        
-         try:
-             T_isolador  = forca_isolador[hipotese][chave]["Forca T"]
-             L_isolador = forca_isolador[hipotese][chave]["Forca L"]
-             V_isolador = isolador["peso"]
-         except KeyError:
-            T_isolador = 0
-            L_isolador = 0
-            V_isolador = 0
-          
-         Ac_vante = pressao_vento_cabo[hipotese][chave]["vante"]* (diametro_mm /1000) * vao["vante"] 
-         Ac_re = pressao_vento_cabo[hipotese][chave]["re"]* (diametro_mm /1000) * vao["re"]
-         Ac_T = 0.5*(Ac_vante + Ac_re)*np.cos(np.radians(deflexao/2))
-         Ac_L = 0.5*(Ac_vante - Ac_re)*np.cos(np.radians(deflexao/2))
-         
-         Tc_T =  (tracao_cabo1[hipotese][chave]["re"]+ tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))
-         Tc_L = abs((tracao_cabo1[hipotese][chave]["re"]- tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao/2)))
-  
-         T_cabo =    valor["qtd"]*(Ac_T + Tc_T) + T_isolador
-         L_cabo =    valor["qtd"]*(Ac_L + Tc_L) + L_isolador
-    
-
-         Vmin = valor["qtd"]*vao_de_peso["min"]*peso + V_isolador  
-         Vmax = valor["qtd"]*vao_de_peso["max"]*peso + V_isolador
-         
-         if 1 <= hipotese <= 5:
-           
-             FS_T = fator_sobrecarga["Vento Máximo"]["T"]
-             FS_L = fator_sobrecarga["Vento Máximo"]["L"]
-             FS_V_normal = fator_sobrecarga["Vento Máximo"]["V_normal"]
-             FS_V_reduzido = fator_sobrecarga["Vento Máximo"]["V_reduzido"]
-             
-         if 6 <= hipotese <= 10:
-             
-             Ac_vante = 0.25*pressao_vento_cabo[hipotese][chave]["vante"]* (diametro_mm /1000) * vao["vante"] 
-             Ac_re = 0.25*pressao_vento_cabo[hipotese][chave]["re"]* (diametro_mm /1000) * vao["re"]
-             Ac_T = 0.5*(Ac_vante + Ac_re)*np.cos(np.radians(deflexao/2))
-             Ac_L = 0.5*(Ac_vante - Ac_re)*np.cos(np.radians(deflexao/2))
-             
-             Tc_T =  (tracao_cabo1[hipotese][chave]["re"]+ tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))
-             Tc_L = abs((tracao_cabo1[hipotese][chave]["re"]- tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao/2)))
-      
-             T_cabo =    valor["qtd"]*(Ac_T + Tc_T) + T_isolador
-             L_cabo =    valor["qtd"]*(Ac_L + Tc_L) + L_isolador
-        
-
-             Vmin = valor["qtd"]*vao_de_peso["min"]*peso + V_isolador  
-             Vmax = valor["qtd"]*vao_de_peso["max"]*peso + V_isolador
-             
-             
-         
-         
-         if hipotese == 11: #construção
-         
-             Vmax = 1.25*valor["qtd"]*max(tracao_cabo1[hipotese][chave]["re"],tracao_cabo1[hipotese][chave]["vante"])*0.93 
-             Vmin = 0
-             L_cabo = 0.1132*valor["qtd"]*max(tracao_cabo1[hipotese][chave]["re"],tracao_cabo1[hipotese][chave]["vante"])
-             T_cabo = (tracao_cabo1[hipotese][chave]["re"]+ tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))*valor["qtd"]
-             
-             FS_T = fator_sobrecarga["Construção/Manutenção"]["T"]
-             FS_L = fator_sobrecarga["Construção/Manutenção"]["L"]
-             FS_V_normal = fator_sobrecarga["Construção/Manutenção"]["V_normal"]
-             FS_V_reduzido = fator_sobrecarga["Construção/Manutenção"]["V_reduzido"]
-         
-            
-         if hipotese == 12: #cabo rompido
-         
-                     
-         
-            T_cabo = ((tracao_cabo1[hipotese][chave]["re"]+ tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))+ Ac_T)*valor["qtd"]
-            L_cabo = (tracao_cabo1[hipotese][chave]["re"]- tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao/2))*valor["qtd"]
-  
-            Vmin = valor["qtd"]*vao_de_peso["min"]*peso       
-            Vmax = valor["qtd"]*vao_de_peso["max"]*peso    
-                    
-         
-            if chave == cabo_condutor_mais_alto:
-                 Vmax = Vmax*0.7
-                 Vmin = Vmin*0.7
-                 T_cabo = (tracao_cabo1[hipotese][chave]["re"])*np.sin(np.radians(deflexao/2))*valor["qtd"]
-                 L_cabo = 1*(tracao_cabo1[hipotese][chave]["re"])*np.cos(np.radians(deflexao/2))*valor["qtd"]
-                 
-            FS_T = fator_sobrecarga["Ruptura de cabo"]["T"]
-            FS_L = fator_sobrecarga["Ruptura de cabo"]["L"]
-            FS_V_normal = fator_sobrecarga["Ruptura de cabo"]["V_normal"]
-            FS_V_reduzido = fator_sobrecarga["Ruptura de cabo"]["V_reduzido"]
-                 
-         if hipotese ==13: #cabo rompido
-             T_cabo = ((tracao_cabo1[hipotese][chave]["re"]+ tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))+ Ac_T)*valor["qtd"]
-             L_cabo = (tracao_cabo1[hipotese][chave]["re"]- tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao/2))*valor["qtd"]
-  
-             Vmin = valor["qtd"]*vao_de_peso["min"]*peso       
-             Vmax = valor["qtd"]*vao_de_peso["max"]*peso    
-                    
-                    
-             if chave == cabo_condutor_mais_alto:
-                 Vmax = Vmax*0.7
-                 Vmin = Vmin*0.7
-                 T_cabo = (tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))*valor["qtd"]
-                 L_cabo = 1*(tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao/2))*valor["qtd"]
-                 
-             FS_T = fator_sobrecarga["Ruptura de cabo"]["T"]
-             FS_L = fator_sobrecarga["Ruptura de cabo"]["L"]
-             FS_V_normal = fator_sobrecarga["Ruptura de cabo"]["V_normal"]
-             FS_V_reduzido = fator_sobrecarga["Ruptura de cabo"]["V_reduzido"]
-
-         if hipotese ==14: # para-raio rompido
-         
-
-                         
-             if chave == cabo_pr_mais_alto:
-                 Vmax = Vmax*0.7
-                 Vmin = Vmin*0.7
-                 T_cabo = (tracao_cabo1[hipotese][chave]["re"])*np.sin(np.radians(deflexao/2)+ Ac_T)*valor["qtd"]+V_isolador
-                 L_cabo = 1.25*(tracao_cabo1[hipotese][chave]["re"])*np.cos(np.radians(deflexao/2))*valor["qtd"]+L_isolador
-                 
-             FS_T = fator_sobrecarga["Ruptura de cabo"]["T"]
-             FS_L = fator_sobrecarga["Ruptura de cabo"]["L"]
-             FS_V_normal = fator_sobrecarga["Ruptura de cabo"]["V_normal"]
-             FS_V_reduzido = fator_sobrecarga["Ruptura de cabo"]["V_reduzido"]
-                 
-         if hipotese ==15:  # para-raio rompido
-             if chave == cabo_pr_mais_alto:
-                 Vmax = Vmax*0.7
-                 Vmin = Vmin*0.7
-                 T_cabo = (tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao)+ Ac_T)*valor["qtd"]+V_isolador
-                 L_cabo = 1.25*(tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao))*valor["qtd"]+L_isolador    
-                 
-             FS_T = fator_sobrecarga["Ruptura de cabo"]["T"]
-             FS_L = fator_sobrecarga["Ruptura de cabo"]["L"]
-             FS_V_normal = fator_sobrecarga["Ruptura de cabo"]["V_normal"]
-             FS_V_reduzido = fator_sobrecarga["Ruptura de cabo"]["V_reduzido"]
-                 
-         if hipotese == 16:            # Contenção cascata
-               
-         
-            if chave.startswith("Cabo_PR"):
-                     L_cabo = max(tracao_cabo1[hipotese][chave]["vante"],tracao_cabo1[hipotese][chave]["re"])*0.60 * valor["qtd"]
+        obtidos: Dict[str, Dict[str, Any]] = {}
+        falhas: Dict[str, str] = {}
+        for concluidas, futuro in enumerate(as_completed(futuros), start=1):
+            nome = futuros[futuro]
+            try:
+                resultado, erro = futuro.result()
+            except Exception:  # processo morto, erro de pickle etc.
+                resultado, erro = None, traceback.format_exc()
+            if erro is None:
+                obtidos[nome] = resultado
             else:
-                     L_cabo = max(tracao_cabo1[hipotese][chave]["vante"],tracao_cabo1[hipotese][chave]["re"])*0.40 * valor["qtd"]
-                     
-            FS_T = fator_sobrecarga["Contenção em cascata"]["T"]
-            FS_L = fator_sobrecarga["Contenção em cascata"]["L"]
-            FS_V_normal = fator_sobrecarga["Contenção em cascata"]["V_normal"]
-            FS_V_reduzido = fator_sobrecarga["Contenção em cascata"]["V_reduzido"]
-                     
-         if hipotese == 17:  # Temperatura mínima
-             T_cabo = ((tracao_cabo1[hipotese][chave]["re"]+ tracao_cabo1[hipotese][chave]["vante"])*np.sin(np.radians(deflexao/2))+
-                       Ac_T)*valor["qtd"]+T_isolador
-             L_cabo = (tracao_cabo1[hipotese][chave]["re"]- tracao_cabo1[hipotese][chave]["vante"])*np.cos(np.radians(deflexao/2))*valor["qtd"]+L_isolador
-             
-             Vmin = valor["qtd"]*vao_de_peso["min"]*peso + V_isolador
-             
-             Vmax = valor["qtd"]*vao_de_peso["max"]*peso + V_isolador
-             
-             FS_T = fator_sobrecarga["Vento Máximo"]["T"]
-             FS_L = fator_sobrecarga["Vento Máximo"]["L"]
-             FS_V_normal = fator_sobrecarga["Vento Máximo"]["V_normal"]
-             FS_V_reduzido = fator_sobrecarga["Vento Máximo"]["V_reduzido"]
-             
-         
-         if hipotese == 18:  # Terminal
-                Ac_vante = pressao_vento_cabo[hipotese][chave]["vante"]* (diametro_mm /1000) * vao["vante"] 
-                Ac_re = pressao_vento_cabo[hipotese][chave]["re"]* (diametro_mm /1000) * vao["re"]
-                Ac_T = 0.5*(Ac_vante + Ac_re)*np.cos(np.radians(deflexao/2))
-                Ac_L = 0.5*(Ac_vante - Ac_re)*np.cos(np.radians(deflexao/2))
-                
-                Tc_T =  (max(tracao_cabo1[hipotese][chave]["re"],tracao_cabo1[hipotese][chave]["vante"]))*np.sin(np.radians(deflexao/2))
-                Tc_L = (max((abs(tracao_cabo1[hipotese][chave]["re"]), abs(tracao_cabo1[hipotese][chave]["vante"])))*np.cos(np.radians(deflexao/2)))
-         
-                T_cabo =    valor["qtd"]*max(Ac_T, Tc_T) + T_isolador
-                L_cabo =    valor["qtd"]*max(Ac_L , Tc_L) + L_isolador
-           
-    
-                Vmin = valor["qtd"]*vao_de_peso["min"]*peso + V_isolador  
-                Vmax = valor["qtd"]*vao_de_peso["max"]*peso + V_isolador
-            
-            
-    
-         carga[chave] = {
-            "T": int(round(T_cabo*FS_T,0)),
-            "Vmin":int(round(Vmin*FS_V_reduzido ,0)),
-            "Vmax":int(round(Vmax*FS_V_normal ,0)),
-            "L": int(round(abs(L_cabo*FS_L),0)),
-           }
-         
-         
-     arvore_carga[hipotese] = carga
-         
- # CALCULO DOS MOMENTOS
-
-momentoT = {}
-momentoL = {}
-resultante = {}
-ang_resultante = {}
-fator_reducao = {}
-carga_resultante={}
-
-for chave, hipotese in hipoteses.items():
-        momento_t_temp = {}
-        mt = 0
-        ml = 0
-        res = 0
-        for fase, valor in geometria_estrutura.items(): 
-            mt += valor["H"]*arvore_carga[chave][fase]["T"] + valor["X"]*arvore_carga[chave][fase]["Vmax"]
-            ml += valor["H"]*arvore_carga[chave][fase]["L"]
-            
-        for i, (troncos, dados2) in enumerate(tronco.items()):
-             if i < len(tronco) - 1: 
-               mt += dados2["centroide"]*forca_poste[chave][troncos]["Forca T"]
-               ml += dados2["centroide"]*forca_poste[chave][troncos]["Forca L"]
-           
-        momentoT[chave] = int(round(mt,0))
-        momentoL[chave] = int(round(ml,0))
-        
-        resultante[chave] = int(round(np.sqrt(momentoT[chave]**2 + momentoL[chave]**2)/(altura_estrutura-0.8),0))
-        if poste != "R":
-            ang_resultante[chave] = abs(round( deflexao_bissetriz- np.rad2deg(np.arctan( momentoL[chave]/ momentoT[chave])),2))
-        if poste == "DT":
-            fator_reducao[chave] = round(min(1, 1.0329*np.exp(-0.00722*ang_resultante[chave])),2)
-            if ang_resultante[chave] > 85 :
-               fator_reducao[chave] = 0.5
-        else:
-            fator_reducao[chave] = 1
-        carga_resultante[chave]= int(round(resultante[chave]/ fator_reducao[chave],0))
-            
-        
+                falhas[nome] = erro
+            if progresso is not None:
+                progresso(concluidas, len(futuros), nome, erro)
+    finally:
+        if executor is None:
+            ex.shutdown()
+
+    ordem = [e["nome_estrutura"] for e in lista]
+    return ResultadoLinha(
+        resultados={n: obtidos[n] for n in ordem if n in obtidos},
+        falhas={n: falhas[n] for n in ordem if n in falhas},
+    )
+
 
+@lru_cache(maxsize=None)
+def _db_cabos_do_processo(caminho: str) -> pd.DataFrame:
+    return carregar_db_cabos(caminho)
 
 
+def _tarefa_arvore_carga(
+    estrutura: Dict[str, Any], linha: Dict[str, Any], caminho_db_cabos: str
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    # Nível de módulo para ser serializável por pickle. O erro volta como
+    # texto para não depender de a exceção ser serializável.
+    try:
+        return calcular_arvore_carga(estrutura, linha, db_cabos=_db_cabos_do_processo(caminho_db_cabos)), None
+    except Exception:
+        return None, traceback.format_exc()
 
-caminho_arquivo = 'arvore_carga.txt'
-salvar_em_txt(arvore_carga, caminho_arquivo)
-# Criar um DataFrame a partir do dicionário
-# Criar o elemento raiz do XML
 
-root = ET.Element("arvore_carga")
+# =============================================================
+# Saídas (txt, gráficos e memorial)
+# =============================================================
 
+def salvar_em_txt(dados: Dict[Any, Any], caminho_arquivo: str) -> None:
+    """Grava um dicionário aninhado (ex.: arvore_carga) como texto, uma chave por linha."""
+    with open(caminho_arquivo, "w", encoding="utf-8") as arquivo:
+        for chave, valor in dados.items():
+            arquivo.write(f"{chave}: {valor}\n")
 
 
-# Criar a árvore XML
-arvore_xml = ET.ElementTree(root)
+def salvar_em_xml(caminho_arquivo: str) -> None:
+    # Criar o elemento raiz do XML
+    root = ET.Element("arvore_carga")
 
-# Salvar o arquivo XML
-arvore_xml.write("arvore_carga.xml", encoding="utf-8", xml_declaration=True)
+    # Criar a árvore XML
+    arvore_xml = ET.ElementTree(root)
+
+    # Salvar o arquivo XML
+    arvore_xml.write(caminho_arquivo, encoding="utf-8", xml_declaration=True)
 
 
 def plot_arrows_exemplo(ax, x, y, label_0, label_90, label_45, cor):
-  
-    ax.arrow(x - 1.15, y, 1, 0, head_width=0.1, head_length=0.1, fc=cor, ec=cor, linewidth=1.2)  # seta a 0 graus  
+
+    ax.arrow(x - 1.15, y, 1, 0, head_width=0.1, head_length=0.1, fc=cor, ec=cor, linewidth=1.2)  # seta a 0 graus
     ax.arrow(x, y, 0, -1, head_width=0.1, head_length=0.1, fc=cor, ec=cor, linewidth=1.2)  # seta a -90 graus
     ax.arrow(x, y, 1 / np.sqrt(2), 1 / np.sqrt(3), head_width=0.1, head_length=0.1, fc=cor, ec=cor, linewidth=1.2)  # seta a 45 graus
     ax.annotate(f'{label_0}\n', (x - 0.7 , y - 0.6), textcoords="offset points", xytext=(0, 10), ha='center', color = cor)
@@ -685,9 +944,8 @@ def plot_arrows_exemplo(ax, x, y, label_0, label_90, label_45, cor):
 def plot_arrows(ax, x, y, label_0, label_90, label_45):
     if label_0 != 0 :
         ax.arrow(x - 1.15, y, 1, 0, head_width=0.1, head_length=0.1, fc='black', ec='black', linewidth=1.2)  # seta a 0 graus
-     
-        
-     
+
+
     ax.arrow(x, y, 0, -1, head_width=0.1, head_length=0.1, fc='black', ec='black', linewidth=1.2)  # seta a -90 graus
     if label_45 != 0 :
         ax.arrow(x, y, 1 / np.sqrt(2), 1 / np.sqrt(3), head_width=0.1, head_length=0.1, fc='black', ec='black', linewidth=1.2)  # seta a 45 graus
@@ -695,11 +953,11 @@ def plot_arrows(ax, x, y, label_0, label_90, label_45):
     # Adicionar valores associados às setas
     if label_0 != 0 :
         ax.annotate(f'{label_0}\n', (x - 0.7 , y - 0.6), textcoords="offset points", xytext=(0, 10), ha='center')
-     
-    linhas = label_90.split('\n')   
+
+    linhas = label_90.split('\n')
     for i, linha in enumerate(linhas):
         ax.annotate(f'{linha}\n', (x+0.03+i*0.3, y - 0.9), textcoords="offset points", xytext=(0, i * 0.0), ha='center', rotation=90)
-        
+
     if label_45 != 0 :
         ax.annotate(f'{label_45}\n', (x + 0.5 + 2 / np.sqrt(2) / 2, y + 0.7 / np.sqrt(2) / 10),
                 textcoords="offset points", xytext=(0, 10), ha='center')
@@ -710,125 +968,148 @@ def plot_arrows2(ax, h_p, valor_T, valor_L):
 
 
     if valor_T != 0 :
-        ax.arrow(-4, h_p, 1, 0, head_width=0.1, head_length=0.1, fc='blue', ec='blue', linewidth=1.2) 
+        ax.arrow(-4, h_p, 1, 0, head_width=0.1, head_length=0.1, fc='blue', ec='blue', linewidth=1.2)
         ax.annotate(f'{valor_T}\n', (-3.5, h_p-0.7), textcoords="offset points", xytext=(0, 10), ha='center', color='blue')
-        
+
     if valor_L != 0 :
          ax.arrow(-2.9, h_p, 1 / np.sqrt(2), 1 / np.sqrt(3), head_width=0.1, head_length=0.1, fc='blue', ec='blue', linewidth=1.2)
          ax.annotate(f'{valor_L}', (-1.8, h_p + 1 / np.sqrt(2) / 10), textcoords="offset points", xytext=(0, 10), ha='center', color='blue')
-                
-
-amostras = list(carga_resultante.keys())
-valores = list(carga_resultante.values())
-
-plt.grid(True, linestyle='--', alpha=0.7)
-# Criar um gráfico de barras
-plt.bar(amostras, valores, color='blue')
-
-# Adicionar uma linha horizontal para o valor da carga inicial
-plt.axhline(y=Carga_inicial, color='red', linestyle='-', label='Carga nominal do Poste')
-
-plt.ylim(0, Carga_inicial + 500)
-# Adicionar rótulos ao gráfico
-plt.title('Gráfico das Cargas finais no poste')
-plt.xlabel('Estado de Carga')
-plt.ylabel('Cargas finais (kgf)')
-
-# Adicionar uma legenda
-plt.legend()
-
-# Definir a escala no eixo x para mostrar todas as amostras
-plt.xticks(amostras)
-plt.savefig('arvore/resumo.png', dpi=300, bbox_inches='tight',  format='png')    
-
-
-
-for chave, hipotese in hipoteses.items():
-    # Criar uma figura com DPI de 300
-    fig, ax = plt.subplots(dpi=300,figsize=(10, 10))
-    vertices = [
-    (-0.0005 * tronco[5]["Face_A"], 0),
-    (-0.0005 * tronco[1]["Face_A"], altura_estrutura),
-    (0.0005 * tronco[1]["Face_A"], altura_estrutura),
-    (0.0005 * tronco[5]["Face_A"], 0)
-]
-    quadrado = Polygon(vertices, closed=True, edgecolor='black', facecolor='#D3D3D3')
-    ax.add_patch(quadrado)
-    
-    # Definir limites do gráfico
-    altura = altura_estrutura
-    ax.set_xlim(-9, 8)
-    ax.set_ylim(1, altura+2)
-    
-    # Adicionar grades para melhor orientação
-    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
-    ax.minorticks_on()
-    ax.grid(True, which='minor', linestyle=':', linewidth=0.5)
-
-
-    # Plotar setas em diferentes posições com valores associados
-    for fase, dados in geometria_estrutura.items():
-        x = dados['X']
-        y = dados['H']
-        carga_info = arvore_carga[chave][fase]  # Usei a carga do nível 1 para simplificar, ajuste conforme necessário
-        plot_arrows(ax, x, y, carga_info["T"], f" {carga_info['Vmax']}\n({carga_info['Vmin']})", carga_info["L"])
-    
-    
-    for i, (troncos, dados2) in enumerate(tronco.items()):
-     if i < len(tronco) - 1: 
-      
-        hc = dados2["centroide"]
-        carga_info2 = forca_poste[chave][troncos]
-        plot_arrows2(ax,hc, carga_info2["Forca T"],carga_info2["Forca L"])
-    
-    
-    x = 6
-    y = 7.5
-    plot_arrows_exemplo(ax, x, y, "T","V", "L", "black")
-    ax.text(4.5,9, "Cargas nos cabos", va='center', fontsize=10, color='black')
-    
-    x = 6
-    y = 3.8
-    plot_arrows_exemplo(ax, x, y, "T","V", "L", "blue")
-    ax.text(4.5,5.2, "Cargas no poste", va='center', fontsize=10, color='blue')
-    
-    chaves = hipoteses.keys()
-    
-    # Convertendo as chaves para uma lista (opcional, dependendo do que você precisa)
-    lista_de_chaves = chave
-    cor_Texto = "purple"
-    inicio  = - 8
-    plt.title("Hipótese de carga: " + str(hipotese["nome"]))
-    plt.xlabel('Eixo Transversal')
-    plt.ylabel('Altura (m)')
-    ax.text(inicio, altura +1.6, 'Estrutura:' +nome_estrutura , ha='left', va='center', fontsize=10, color='purple')
-    ax.text(inicio, altura +1.1, "Deflexão = " + str(deflexao) + "°", ha='left', va='center', fontsize=10, color='purple')
-    ax.text(inicio, altura +0.6, 'Cargas em kgf', ha='left', va='center', fontsize=10, color='purple')
-    ax.text(inicio, altura +0.1, 'Vento = ' + str(hipotese["Vento"]) +"m/s; Ângulo = " +str(hipotese["Ângulo"])+"°", ha='left', va='center', fontsize=10, color='purple')
-    ax.text(inicio, altura - 0.4, "Mom. Long. = " + str(momentoL[chave]) +"kgfm", ha='left', va='center', fontsize=10, color='purple')
-    ax.text(inicio, altura -0.9, "Mom. Trans. = " + str(momentoT[chave])+"kgfm", ha='left', va='center', fontsize=10, color='purple')
-    ax.text(inicio, altura -1.4, "Carga solicitada = "+ str(resultante[chave]) + "kgf", ha='left', va='center', fontsize=10, color='purple')
-    
-    if poste =="DT":
-        ax.text(inicio, altura -1.9, "Ângulo result. P/ face 'B' = "+ str(ang_resultante[chave]) +"°", ha='left', va='center', fontsize=10, color='purple')
-        ax.text(inicio, altura -2.4, "Fator de correção = "+ str(fator_reducao[chave]), ha='left', va='center', fontsize=10, color='purple')
-        ax.text(inicio, altura -2.9, "Carga final = "+ str(carga_resultante[chave]) +"kgf", ha='left', va='center', fontsize=10, color='purple')
-    if poste =="R":   
-        ax.text(inicio, altura -1.9, "Fator de correção = "+ str(fator_reducao[chave]), ha='left', va='center', fontsize=10, color='purple')
-        ax.text(inicio, altura -2.4, "Carga final = "+ str(carga_resultante[chave]) +"kgf", ha='left', va='center', fontsize=10, color='purple')
-    
-
-    
-    fig.savefig("arvore/hipotese de carga" + str(lista_de_chaves)+".png", bbox_inches='tight',  format='png')
-    fig.savefig("arvore/hipotese de carga" + str(lista_de_chaves)+".svg", bbox_inches='tight',  format='svg')
-    # Exibir o gráfico
-    #plt.show()
 
 
+def gerar_graficos(resultado: Dict[str, Any], *, mostrar: bool = False) -> None:
+    """Gráfico de resumo e um gráfico por hipótese em arvore/ (png/svg)."""
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Polygon
+
+    carga_resultante = resultado["carga_resultante"]
+    Carga_inicial = resultado["Carga_inicial"]
+    hipoteses = resultado["hipoteses"]
+    tronco = resultado["tronco"]
+    altura_estrutura = resultado["altura_estrutura"]
+    geometria_estrutura = resultado["geometria_estrutura"]
+    arvore_carga = resultado["arvore_carga"]
+    forca_poste = resultado["forca_poste"]
+    nome_estrutura = resultado["nome_estrutura"]
+    deflexao = resultado["deflexao"]
+    momentoL = resultado["momentoL"]
+    momentoT = resultado["momentoT"]
+    resultante = resultado["resultante"]
+    poste = resultado["poste"]
+    ang_resultante = resultado["ang_resultante"]
+    fator_reducao = resultado["fator_reducao"]
+
+    amostras = list(carga_resultante.keys())
+    valores = list(carga_resultante.values())
+
+    plt.grid(True, linestyle='--', alpha=0.7)
+    # Criar um gráfico de barras
+    plt.bar(amostras, valores, color='blue')
+
+    # Adicionar uma linha horizontal para o valor da carga inicial
+    plt.axhline(y=Carga_inicial, color='red', linestyle='-', label='Carga nominal do Poste')
+
+    plt.ylim(0, Carga_inicial + 500)
+    # Adicionar rótulos ao gráfico
+    plt.title('Gráfico das Cargas finais no poste')
+    plt.xlabel('Estado de Carga')
+    plt.ylabel('Cargas finais (kgf)')
+
+    # Adicionar uma legenda
+    plt.legend()
+
+    # Definir a escala no eixo x para mostrar todas as amostras
+    plt.xticks(amostras)
+    plt.savefig('arvore/resumo.png', dpi=300, bbox_inches='tight',  format='png')
+
+
+    for chave, hipotese in hipoteses.items():
+        # Criar uma figura com DPI de 300
+        fig, ax = plt.subplots(dpi=300,figsize=(10, 10))
+        vertices = [
+        (-0.0005 * tronco[5]["Face_A"], 0),
+        (-0.0005 * tronco[1]["Face_A"], altura_estrutura),
+        (0.0005 * tronco[1]["Face_A"], altura_estrutura),
+        (0.0005 * tronco[5]["Face_A"], 0)
+    ]
+        quadrado = Polygon(vertices, closed=True, edgecolor='black', facecolor='#D3D3D3')
+        ax.add_patch(quadrado)
+
+        # Definir limites do gráfico
+        altura = altura_estrutura
+        ax.set_xlim(-9, 8)
+        ax.set_ylim(1, altura+2)
+
+        # Adicionar grades para melhor orientação
+        ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+        ax.minorticks_on()
+        ax.grid(True, which='minor', linestyle=':', linewidth=0.5)
+
 
+        # Plotar setas em diferentes posições com valores associados
+        for fase, dados in geometria_estrutura.items():
+            x = dados['X']
+            y = dados['H']
+            carga_info = arvore_carga[chave][fase]  # Usei a carga do nível 1 para simplificar, ajuste conforme necessário
+            plot_arrows(ax, x, y, carga_info["T"], f" {carga_info['Vmax']}\n({carga_info['Vmin']})", carga_info["L"])
+
+
+        for i, (troncos, dados2) in enumerate(tronco.items()):
+         if i < len(tronco) - 1:
+
+            hc = dados2["centroide"]
+            carga_info2 = forca_poste[chave][troncos]
+            plot_arrows2(ax,hc, carga_info2["Forca T"],carga_info2["Forca L"])
+
+
+        x = 6
+        y = 7.5
+        plot_arrows_exemplo(ax, x, y, "T","V", "L", "black")
+        ax.text(4.5,9, "Cargas nos cabos", va='center', fontsize=10, color='black')
+
+        x = 6
+        y = 3.8
+        plot_arrows_exemplo(ax, x, y, "T","V", "L", "blue")
+        ax.text(4.5,5.2, "Cargas no poste", va='center', fontsize=10, color='blue')
+
+        chaves = hipoteses.keys()
+
+        # Convertendo as chaves para uma lista (opcional, dependendo do que você precisa)
+        lista_de_chaves = chave
+        cor_Texto = "purple"
+        inicio  = - 8
+        plt.title("Hipótese de carga: " + str(hipotese["nome"]))
+        plt.xlabel('Eixo Transversal')
+        plt.ylabel('Altura (m)')
+        ax.text(inicio, altura +1.6, 'Estrutura:' +nome_estrutura , ha='left', va='center', fontsize=10, color='purple')
+        ax.text(inicio, altura +1.1, "Deflexão = " + str(deflexao) + "°", ha='left', va='center', fontsize=10, color='purple')
+        ax.text(inicio, altura +0.6, 'Cargas em kgf', ha='left', va='center', fontsize=10, color='purple')
+        ax.text(inicio, altura +0.1, 'Vento = ' + str(hipotese["Vento"]) +"m/s; Ângulo = " +str(hipotese["Ângulo"])+"°", ha='left', va='center', fontsize=10, color='purple')
+        ax.text(inicio, altura - 0.4, "Mom. Long. = " + str(momentoL[chave]) +"kgfm", ha='left', va='center', fontsize=10, color='purple')
+        ax.text(inicio, altura -0.9, "Mom. Trans. = " + str(momentoT[chave])+"kgfm", ha='left', va='center', fontsize=10, color='purple')
+        ax.text(inicio, altura -1.4, "Carga solicitada = "+ str(resultante[chave]) + "kgf", ha='left', va='center', fontsize=10, color='purple')
+
+        if poste =="DT":
+            ax.text(inicio, altura -1.9, "Ângulo result. P/ face 'B' = "+ str(ang_resultante[chave]) +"°", ha='left', va='center', fontsize=10, color='purple')
+            ax.text(inicio, altura -2.4, "Fator de correção = "+ str(fator_reducao[chave]), ha='left', va='center', fontsize=10, color='purple')
+            ax.text(inicio, altura -2.9, "Carga final = "+ str(carga_resultante[chave]) +"kgf", ha='left', va='center', fontsize=10, color='purple')
+        if poste =="R":
+            ax.text(inicio, altura -1.9, "Fator de correção = "+ str(fator_reducao[chave]), ha='left', va='center', fontsize=10, color='purple')
+            ax.text(inicio, altura -2.4, "Carga final = "+ str(carga_resultante[chave]) +"kgf", ha='left', va='center', fontsize=10, color='purple')
+
+
+        fig.savefig("arvore/hipotese de carga" + str(lista_de_chaves)+".png", bbox_inches='tight',  format='png')
+        fig.savefig("arvore/hipotese de carga" + str(lista_de_chaves)+".svg", bbox_inches='tight',  format='svg')
+        # Exibir o gráfico
+        #plt.show()
+
+
+    # Exibir o gráfico
+
+    # Exibir o gráfico
+    if mostrar:
+        plt.show()
+    plt.close("all")
 
-# Exibir o gráfico
-plt.show()
 
 def adicionar_tabela(doc, dados):
     # Obter o número de linhas e colunas a partir dos dados
@@ -843,18 +1124,23 @@ def adicionar_tabela(doc, dados):
     for row_index, row in enumerate(table.rows):
         for cell_index, cell in enumerate(row.cells):
             cell.text = str(dados[row_index][cell_index])
-            
-def inserir_grafico(doc, imagem_path, titulo, estilo_titulo=None, largura=Inches(6)):
+
+def inserir_grafico(doc, imagem_path, titulo, estilo_titulo=None, largura=None):
+    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.shared import Inches
+
+    if largura is None:
+        largura = Inches(6)
     # Insere um parágrafo com o título do gráfico
     titulo_paragrafo = doc.add_paragraph()
     titulo_run = titulo_paragrafo.add_run(titulo)
-    
+
     # Aplicar estilo de caractere ao título, se fornecido
     if estilo_titulo:
         titulo_run.font.name = estilo_titulo['font_name']
         titulo_run.font.size = estilo_titulo['font_size']
         titulo_run.font.color.rgb = estilo_titulo['font_color']
-    
+
     titulo_paragrafo.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
 
     # Insere a imagem do gráfico
@@ -866,301 +1152,398 @@ def inserir_grafico(doc, imagem_path, titulo, estilo_titulo=None, largura=Inches
     # Adicione uma quebra de linha após a imagem
     doc.add_paragraph()
 
-#fazer o memorial
-# Crie um documento do Word
-doc = Document("modelo.docx")
-styles = doc.styles
-    
-# Defina as palavras que você deseja procurar e substituir
-
-referencias = {
-    "Numero_desenho": "12343",
-    "Nome_documento": "Capacidade operativa",
-    "nome_lt": nome_LT,
-    }
 
-doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
-doc.add_heading("OBJETIVO", level = 1)
+def gerar_memorial(resultado: Dict[str, Any], *, modelo: str = "modelo.docx") -> str:
+    """Memorial de cálculo (.docx) em arvore/; requer os gráficos de gerar_graficos. Retorna o caminho."""
+    from docx import Document
+    from docx.enum.table import WD_ALIGN_VERTICAL
+    from docx.enum.text import WD_BREAK
+    from docx.shared import Cm, Inches
+
+    nome_LT = resultado["nome_LT"]
+    numero_documento = resultado["numero_documento"]
+    nome_estrutura = resultado["nome_estrutura"]
+    rugosidade = resultado["rugosidade"]
+    vento = resultado["vento"]
+    periodo_retorno = resultado["periodo_retorno"]
+    massa = resultado["massa"]
+    temperatura = resultado["temperatura"]
+    altitude = resultado["altitude"]
+    poste = resultado["poste"]
+    isolador = resultado["isolador"]
+    hipoteses = resultado["hipoteses"]
+    fator_sobrecarga = resultado["fator_sobrecarga"]
+    vao = resultado["vao"]
+    vao_de_peso = resultado["vao_de_peso"]
+    vao_regulador = resultado["vao_regulador"]
+    tracao_eds = resultado["tracao_eds"]
+    tracao_eds_pr = resultado["tracao_eds_pr"]
+    geometria_estrutura = resultado["geometria_estrutura"]
+    pressao_vento_cabo = resultado["pressao_vento_cabo"]
+    tracao_cabo1 = resultado["tracao_cabo1"]
+    tronco = resultado["tronco"]
+    pressao_tronco = resultado["pressao_tronco"]
+    dadosCabo = resultado["dadosCabo"]
+    dados_pr1 = resultado["dados_pr1"]
+
+
+    doc = Document(modelo)
+    styles = doc.styles
+
+    # Defina as palavras que você deseja procurar e substituir
+
+    referencias = {
+        "Numero_desenho": "12343",
+        "Nome_documento": "Capacidade operativa",
+        "nome_lt": nome_LT,
+        }
 
-data = "Este relatório tem como objetivo apresentar o cálculo estrutural para as estruturas da " + nome_LT + "."
-doc.add_paragraph(data, style="First Paragraph")
+    doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+    doc.add_heading("OBJETIVO", level = 1)
+
+    data = "Este relatório tem como objetivo apresentar o cálculo estrutural para as estruturas da " + nome_LT + "."
+    doc.add_paragraph(data, style="First Paragraph")
+
+    doc.add_heading("DADOS BÁSICOS", level = 1)
+    doc.add_heading("Cabos", level = 2)
+
+    dados = [
+        ["Característica","Unidade", "Condutor", "Cabo guarda",],
+        ["Nome","", dadosCabo["Cabo"].iloc[0],dados_pr1["Cabo"].iloc[0]],
+        ["Seção","mm²", dadosCabo["Seção (mm²)"].iloc[0],dados_pr1["Seção (mm²)"].iloc[0]],
+        ["Diâmetro","mm", dadosCabo["Diametro (mm)"].iloc[0],dados_pr1["Diametro (mm)"].iloc[0]],
+        ["Peso","kgf/m", dadosCabo["Peso (kgf/m)"].iloc[0],dados_pr1["Peso (kgf/m)"].iloc[0]],
+        ["Mód. Elast. final","kgf/mm²", dadosCabo["E"].iloc[0],dados_pr1["E"].iloc[0]],
+        ["Coef Dilat. Térm. final","1/°C", dadosCabo["COEF"].iloc[0],dados_pr1["COEF"].iloc[0]],
+        ]
+
+    adicionar_tabela(doc,dados)
+
+    doc.add_heading("Cadeia de Isoladores", level = 2)
+    dados = [
+        ["Área Exposta (mm²)", "Peso (kgf)"],
+        [isolador["area"], isolador["peso"]]
+        ]
+
+    adicionar_tabela(doc,dados)
+
+    massa = round(massa,3)
+    doc.add_heading("Ação do Vento", level = 2)
+    data = "As velocidades de vento a serem utilizadas no projeto da linha e as respectivas pressões e cargas atuantes nos cabos, isoladores e estruturas serão calculadas de acordo com a metodologia da publicação IEC 60826 - International Eletrotechnical Comission: Design Criteria of Overhead Transmission Lines, considerando-se: "
+    doc.add_paragraph(data, style="First Paragraph")
+    doc.add_paragraph(" - Terreno com rugosidade categoria " + rugosidade + ";", style="First Paragraph")
+    doc.add_paragraph(" - Velocidade de Vento de Referência " + str(vento["projeto"]) + " m/s;" , style="First Paragraph")
+    doc.add_paragraph(" - Velocidade de Vento de Alta intensidade " + str(vento["extremo"]) + " m/s;" , style="First Paragraph")
+    doc.add_paragraph(f" - Período de retorno T = {periodo_retorno} anos;", style="First Paragraph")
+    doc.add_paragraph(f" - ρ = massa específica do ar = {massa} (temperatura = {temperatura['coincidente']} °C, altitude = {altitude} m);", style="First Paragraph")
+    doc.add_paragraph(" - g = aceleração da gravidade = 9.81 m/s².",  style="First Paragraph")
+
+    doc.add_heading("Ação de vento na estrutura", level = 3)
+    doc.add_heading("Vento máximo", level = 5)
+    doc.add_paragraph("A carga de vento máximo atuante na estrutura será determinada de acordo com o prescrito na Publicação IEC 60826, utilizando-se a expressão abaixo:", style="First Paragraph")
+
+    if poste == "DT":
+        doc.add_paragraph("A_tc = q₀ Cx Gt a L",  style="First Paragraph")
+        doc.add_paragraph("Onde:",  style="First Paragraph")
+        doc.add_paragraph("- A_tc   é a força exercida pelo vento na estrutura;",  style="First Paragraph")
+        doc.add_paragraph("- q₀   é a pressão dinâmica;",  style="First Paragraph")
+        doc.add_paragraph("- Cx   é o coeficiente de arrasto;",  style="First Paragraph")
+        doc.add_paragraph("- Gt   é o fator combinado de vento para o suporte;",  style="First Paragraph")
+        doc.add_paragraph("- a   é a dimensão do tronco na face de incidência do vento ao nível do centro geométrico do elemento;",  style="First Paragraph")
+        doc.add_paragraph("- L   é o comprimento do tronco.",  style="First Paragraph")
+
+        ## colocar aqui se for R
+
+    doc.add_heading("Vento de alta intensidade", level = 5)
+    doc.add_paragraph("As cargas de vento de alta intensidade são calculadas de forma similar ao item anterior, utilizando-se a expressão abaixo:",  style="First Paragraph")
+    doc.add_paragraph("A_tc = qi Cx a L",  style="First Paragraph")
+    doc.add_paragraph("Onde:",  style="First Paragraph")
+    doc.add_paragraph("qi   É a pressão dinâmica para vento de alta intensidade.",  style="First Paragraph")
 
-doc.add_heading("DADOS BÁSICOS", level = 1)
-doc.add_heading("Cabos", level = 2)
+    doc.add_heading("Ação do vento nas cadeias de isoladores", level = 3)
+    doc.add_heading("Vento máximo", level = 5)
+    doc.add_paragraph("Fi = q₀ Gi Cxi Ai, onde: ",  style="First Paragraph")
+    doc.add_paragraph("- Fi   Carga de vento, atuante na direção do vento, em kgf;",  style="First Paragraph")
+    doc.add_paragraph("- q₀   Pressão dinâmica;",  style="First Paragraph")
+    doc.add_paragraph("- Gi   Fator de rajada, obtido da figura 5 da Publicação IEC 60826;",  style="First Paragraph")
+    doc.add_paragraph("- Cx   é o coeficiente de arrasto = 1.2;",  style="First Paragraph")
+    doc.add_paragraph("- Ai   Área exposta ao vento;",  style="First Paragraph")
 
-dados = [
-    ["Característica","Unidade", "Condutor", "Cabo guarda",],
-    ["Nome","", dadosCabo["Cabo"].iloc[0],dados_pr1["Cabo"].iloc[0]],
-    ["Seção","mm²", dadosCabo["Seção (mm²)"].iloc[0],dados_pr1["Seção (mm²)"].iloc[0]],
-    ["Diâmetro","mm", dadosCabo["Diametro (mm)"].iloc[0],dados_pr1["Diametro (mm)"].iloc[0]],
-    ["Peso","kgf/m", dadosCabo["Peso (kgf/m)"].iloc[0],dados_pr1["Peso (kgf/m)"].iloc[0]],
-    ["Mód. Elast. final","kgf/mm²", dadosCabo["E"].iloc[0],dados_pr1["E"].iloc[0]],
-    ["Coef Dilat. Térm. final","1/°C", dadosCabo["COEF"].iloc[0],dados_pr1["COEF"].iloc[0]],
-    ]
+    doc.add_heading("Vento de alta intensidade", level = 5)
+    doc.add_paragraph("Fi = qi Cxi Ai, onde: ",  style="First Paragraph")
+    doc.add_paragraph("- Fi   Carga de vento, atuante na direção do vento, em kgf;",  style="First Paragraph")
+    doc.add_paragraph("- qi   Pressão dinâmica para vento de alta intensidade;",  style="First Paragraph")
+    doc.add_paragraph("- Cxi   é o coeficiente de arrasto = 1.2;",  style="First Paragraph")
+    doc.add_paragraph("- Ai   Área exposta ao vento;",  style="First Paragraph")
 
-adicionar_tabela(doc,dados)
 
-doc.add_heading("Cadeia de Isoladores", level = 2)
-dados = [
-    ["Área Exposta (mm²)", "Peso (kgf)"],
-    [isolador["area"], isolador["peso"]]
-    ]
+    doc.add_heading("Ação do vento nos cabos", level = 3)
+    doc.add_heading("Vento máximo", level = 5)
+    doc.add_paragraph("Fc = q₀ Gc Gl Cxc Φ L sen²(Ω), onde: ",  style="First Paragraph")
+    doc.add_paragraph("- Fc  Carga de vento, atuando na direção perpendicular ao cabo; ",  style="First Paragraph")
+    doc.add_paragraph("- Gc   Fator de rajada, obtido da figura 3 da IEC 60826;",  style="First Paragraph")
+    doc.add_paragraph("- Gl   Fator de vão, conforme figura 4 da IEC 60826;",  style="First Paragraph")
+    doc.add_paragraph("- Cxc   Coeficiente de arrasto;",  style="First Paragraph")
+    doc.add_paragraph("- Φ   Diâmetro do cabo;",  style="First Paragraph")
+    doc.add_paragraph("- L   Vâo médio da estrutura;",  style="First Paragraph")
+    doc.add_paragraph("- Ω   ângulo entre direção de incidência do vento e o cabo, conforme figura 6 da IEC 60826;",  style="First Paragraph")
 
-adicionar_tabela(doc,dados)
-
-massa = round(massa,3)
-doc.add_heading("Ação do Vento", level = 2)
-data = "As velocidades de vento a serem utilizadas no projeto da linha e as respectivas pressões e cargas atuantes nos cabos, isoladores e estruturas serão calculadas de acordo com a metodologia da publicação IEC 60826 - International Eletrotechnical Comission: Design Criteria of Overhead Transmission Lines, considerando-se: "
-doc.add_paragraph(data, style="First Paragraph")
-doc.add_paragraph(" - Terreno com rugosidade categoria " + rugosidade + ";", style="First Paragraph")
-doc.add_paragraph(" - Velocidade de Vento de Referência " + str(vento["projeto"]) + " m/s;" , style="First Paragraph")
-doc.add_paragraph(" - Velocidade de Vento de Alta intensidade " + str(vento["extremo"]) + " m/s;" , style="First Paragraph")
-doc.add_paragraph(f" - Período de retorno T = {periodo_retorno} anos;", style="First Paragraph")
-doc.add_paragraph(f" - ρ = massa específica do ar = {massa} (temperatura = {temperatura['coincidente']} °C, altitude = {altitude} m);", style="First Paragraph")
-doc.add_paragraph(" - g = aceleração da gravidade = 9.81 m/s².",  style="First Paragraph")
-
-doc.add_heading("Ação de vento na estrutura", level = 3)
-doc.add_heading("Vento máximo", level = 5)
-doc.add_paragraph("A carga de vento máximo atuante na estrutura será determinada de acordo com o prescrito na Publicação IEC 60826, utilizando-se a expressão abaixo:", style="First Paragraph")
-
-if poste == "DT":
-    doc.add_paragraph("A_tc = q₀ Cx Gt a L",  style="First Paragraph")
-    doc.add_paragraph("Onde:",  style="First Paragraph")
-    doc.add_paragraph("- A_tc   é a força exercida pelo vento na estrutura;",  style="First Paragraph")
-    doc.add_paragraph("- q₀   é a pressão dinâmica;",  style="First Paragraph")
-    doc.add_paragraph("- Cx   é o coeficiente de arrasto;",  style="First Paragraph")
-    doc.add_paragraph("- Gt   é o fator combinado de vento para o suporte;",  style="First Paragraph")
-    doc.add_paragraph("- a   é a dimensão do tronco na face de incidência do vento ao nível do centro geométrico do elemento;",  style="First Paragraph")
-    doc.add_paragraph("- L   é o comprimento do tronco.",  style="First Paragraph")
-
-    ## colocar aqui se for R
-    
-doc.add_heading("Vento de alta intensidade", level = 5)    
-doc.add_paragraph("As cargas de vento de alta intensidade são calculadas de forma similar ao item anterior, utilizando-se a expressão abaixo:",  style="First Paragraph")
-doc.add_paragraph("A_tc = qi Cx a L",  style="First Paragraph")
-doc.add_paragraph("Onde:",  style="First Paragraph")
-doc.add_paragraph("qi   É a pressão dinâmica para vento de alta intensidade.",  style="First Paragraph")
-
-doc.add_heading("Ação do vento nas cadeias de isoladores", level = 3)  
-doc.add_heading("Vento máximo", level = 5)  
-doc.add_paragraph("Fi = q₀ Gi Cxi Ai, onde: ",  style="First Paragraph")  
-doc.add_paragraph("- Fi   Carga de vento, atuante na direção do vento, em kgf;",  style="First Paragraph")
-doc.add_paragraph("- q₀   Pressão dinâmica;",  style="First Paragraph")
-doc.add_paragraph("- Gi   Fator de rajada, obtido da figura 5 da Publicação IEC 60826;",  style="First Paragraph")
-doc.add_paragraph("- Cx   é o coeficiente de arrasto = 1.2;",  style="First Paragraph")
-doc.add_paragraph("- Ai   Área exposta ao vento;",  style="First Paragraph")
-
-doc.add_heading("Vento de alta intensidade", level = 5)  
-doc.add_paragraph("Fi = qi Cxi Ai, onde: ",  style="First Paragraph")  
-doc.add_paragraph("- Fi   Carga de vento, atuante na direção do vento, em kgf;",  style="First Paragraph")
-doc.add_paragraph("- qi   Pressão dinâmica para vento de alta intensidade;",  style="First Paragraph")
-doc.add_paragraph("- Cxi   é o coeficiente de arrasto = 1.2;",  style="First Paragraph")
-doc.add_paragraph("- Ai   Área exposta ao vento;",  style="First Paragraph")
- 
-
-doc.add_heading("Ação do vento nos cabos", level = 3)     
-doc.add_heading("Vento máximo", level = 5) 
-doc.add_paragraph("Fc = q₀ Gc Gl Cxc Φ L sen²(Ω), onde: ",  style="First Paragraph")  
-doc.add_paragraph("- Fc  Carga de vento, atuando na direção perpendicular ao cabo; ",  style="First Paragraph")  
-doc.add_paragraph("- Gc   Fator de rajada, obtido da figura 3 da IEC 60826;",  style="First Paragraph")
-doc.add_paragraph("- Gl   Fator de vão, conforme figura 4 da IEC 60826;",  style="First Paragraph")
-doc.add_paragraph("- Cxc   Coeficiente de arrasto;",  style="First Paragraph")
-doc.add_paragraph("- Φ   Diâmetro do cabo;",  style="First Paragraph")
-doc.add_paragraph("- L   Vâo médio da estrutura;",  style="First Paragraph")
-doc.add_paragraph("- Ω   ângulo entre direção de incidência do vento e o cabo, conforme figura 6 da IEC 60826;",  style="First Paragraph")
-
-
-doc.add_heading("Vento alta intensidade", level = 5) 
-doc.add_paragraph("Fc = qi Cxc Φ L sen²(Ω), onde: ",  style="First Paragraph")  
-doc.add_paragraph("- Fc  Carga de vento, atuando na direção perpendicular ao cabo: ",  style="First Paragraph")  
-doc.add_paragraph("- qi   Pressão dinâmica para vento de alta intensidade;",  style="First Paragraph")
-doc.add_paragraph("- Cxc   Coeficiente de arrasto;",  style="First Paragraph")
-doc.add_paragraph("- Φ   Diâmetro do cabo;",  style="First Paragraph")
-doc.add_paragraph("- L   Vâo médio da estrutura;",  style="First Paragraph")
-doc.add_paragraph("- Ω   ângulo entre direção de incidência do vento e o cabo, conforme figura 6 da IEC 60826;",  style="First Paragraph")
-
-doc.add_heading("Trações nos cabos", level = 2) 
-doc.add_heading("Estados de carga", level = 3) 
-
-
-dados = [["N°", "Descrição", "Temperatura (°C)"],]
-
-for chave, hipotese in hipoteses.items(): 
-    dados.append([str(chave), hipotese["nome"], str(hipotese["Temperatura"])])
-    
-    
-adicionar_tabela(doc,dados)
-doc.add_heading("Condições básicas para os cálculos", level = 3) 
-doc.add_paragraph(f" Vão básico de referência ré: {vao_regulador['re']} m.", style="First Paragraph")
-doc.add_paragraph(f" Vão básico de referência Vante: {vao_regulador['vante']} m.", style="First Paragraph")
-doc.add_paragraph(f" Vão de peso máximo: {vao_de_peso['max']} m.", style="First Paragraph")
-doc.add_paragraph(f" Vão de peso mínimo: {vao_de_peso['min']} m.", style="First Paragraph")
-doc.add_paragraph(f" Vão a vante: {vao['vante']} m.", style="First Paragraph")
-doc.add_paragraph(f" Vão a ré: {vao['re']} m.", style="First Paragraph")
-
-#doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
-
-
-
-
-
-doc.add_heading("Condições de tracionamento dos cabos", level = 3)
-
-dados = [
-    ["Cabo", "Tração Final EDS Ré (kgf)", "Tração Final EDS Vante (kgf)"],
-    ["Condutor", tracao_eds["re"], tracao_eds["vante"]],
-    ["Pára-raios", tracao_eds_pr["re"], tracao_eds_pr["vante"]]
-    ]    
-adicionar_tabela(doc,dados)   
- 
-
-doc.add_heading("Posições dos cabos", level = 3) 
-# Preparar os dados para a tabela
-dados = [["N°", "Tipo de conexão", "Altura na estrutura (m)", "Altura Cabos Vante (m)", "Altura Cabos Ré (m)", "Gc Vante ", "Gc Ré "]]
-
-for chave, fase in geometria_estrutura.items():
-    dados.append([
-        str(chave),
-        fase.get('Tipo', ''),
-        str(fase.get('H', '')),
-        str(fase.get('H_vante', '')),
-        str(fase.get('H_re', '')),
-        str(round(fase.get('gc_vante', ''),2)),
-        str(round(fase.get('gc_re', ''),2))
-    ])
-   
-adicionar_tabela(doc,dados)  
 
-doc.add_heading("Pressões nos cabos", level = 3) 
+    doc.add_heading("Vento alta intensidade", level = 5)
+    doc.add_paragraph("Fc = qi Cxc Φ L sen²(Ω), onde: ",  style="First Paragraph")
+    doc.add_paragraph("- Fc  Carga de vento, atuando na direção perpendicular ao cabo: ",  style="First Paragraph")
+    doc.add_paragraph("- qi   Pressão dinâmica para vento de alta intensidade;",  style="First Paragraph")
+    doc.add_paragraph("- Cxc   Coeficiente de arrasto;",  style="First Paragraph")
+    doc.add_paragraph("- Φ   Diâmetro do cabo;",  style="First Paragraph")
+    doc.add_paragraph("- L   Vâo médio da estrutura;",  style="First Paragraph")
+    doc.add_paragraph("- Ω   ângulo entre direção de incidência do vento e o cabo, conforme figura 6 da IEC 60826;",  style="First Paragraph")
 
-dados = [["Estados de carga", "Fase", "Ré (kgf/m²)", "Vante (kgf/m²)"]]
+    doc.add_heading("Trações nos cabos", level = 2)
+    doc.add_heading("Estados de carga", level = 3)
 
-for numero, fases in pressao_vento_cabo.items():
-    for fase, valores in fases.items():
-        dados.append([
-            str(numero),
-            fase,
-            str(round(valores['re'], 2)),
-            str(round(valores['vante'], 2))
-        ])
 
-adicionar_tabela(doc,dados)  
+    dados = [["N°", "Descrição", "Temperatura (°C)"],]
+
+    for chave, hipotese in hipoteses.items():
+        dados.append([str(chave), hipotese["nome"], str(hipotese["Temperatura"])])
+
 
+    adicionar_tabela(doc,dados)
+    doc.add_heading("Condições básicas para os cálculos", level = 3)
+    doc.add_paragraph(f" Vão básico de referência ré: {vao_regulador['re']} m.", style="First Paragraph")
+    doc.add_paragraph(f" Vão básico de referência Vante: {vao_regulador['vante']} m.", style="First Paragraph")
+    doc.add_paragraph(f" Vão de peso máximo: {vao_de_peso['max']} m.", style="First Paragraph")
+    doc.add_paragraph(f" Vão de peso mínimo: {vao_de_peso['min']} m.", style="First Paragraph")
+    doc.add_paragraph(f" Vão a vante: {vao['vante']} m.", style="First Paragraph")
+    doc.add_paragraph(f" Vão a ré: {vao['re']} m.", style="First Paragraph")
 
-doc.add_heading("Cargas finais nos cabos", level = 2) 
+    #doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
 
-dados = [["Estados de carga", "Fase", "Ré  (kgf)", "Vante (kgf)"]]
 
+    doc.add_heading("Condições de tracionamento dos cabos", level = 3)
 
-for numero, fases in tracao_cabo1.items():
-    for fase, valores in fases.items():
+    dados = [
+        ["Cabo", "Tração Final EDS Ré (kgf)", "Tração Final EDS Vante (kgf)"],
+        ["Condutor", tracao_eds["re"], tracao_eds["vante"]],
+        ["Pára-raios", tracao_eds_pr["re"], tracao_eds_pr["vante"]]
+        ]
+    adicionar_tabela(doc,dados)
+
+
+    doc.add_heading("Posições dos cabos", level = 3)
+    # Preparar os dados para a tabela
+    dados = [["N°", "Tipo de conexão", "Altura na estrutura (m)", "Altura Cabos Vante (m)", "Altura Cabos Ré (m)", "Gc Vante ", "Gc Ré "]]
+
+    for chave, fase in geometria_estrutura.items():
         dados.append([
-            str(numero),
-            fase,
-            str(int(valores.get('re', ''))),
-            str(int(valores.get('vante', '')))
+            str(chave),
+            fase.get('Tipo', ''),
+            str(fase.get('H', '')),
+            str(fase.get('H_vante', '')),
+            str(fase.get('H_re', '')),
+            str(round(fase.get('gc_vante', ''),2)),
+            str(round(fase.get('gc_re', ''),2))
         ])
 
-adicionar_tabela(doc,dados) 
+    adicionar_tabela(doc,dados)
 
-doc.add_heading("Pressão de vento na estrutura", level = 2) 
+    doc.add_heading("Pressões nos cabos", level = 3)
 
-dados = [["Estado de carga","Tronco", "Altura do Centroide (m)", "Gt", "Pressão Transversal (kgf/m²)", "Pressão Longitudinal (kgf/m²)"]]
+    dados = [["Estados de carga", "Fase", "Ré (kgf/m²)", "Vante (kgf/m²)"]]
 
-for chave, hipotese in hipoteses.items():
-    for i, (numero, valores) in enumerate(tronco.items()):
-     if i < len(tronco) - 1: 
+    for numero, fases in pressao_vento_cabo.items():
+        for fase, valores in fases.items():
             dados.append([
-                str(chave),
                 str(numero),
-                str(round(valores["centroide"],2)),
-                str(round(valores["gt"],2)),
-                str(round(pressao_tronco[chave][numero]["T"])),
-                str(round(pressao_tronco[chave][numero]["L"])),
+                fase,
+                str(round(valores['re'], 2)),
+                str(round(valores['vante'], 2))
             ])
 
-adicionar_tabela(doc,dados) 
-
-
-doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
-
-
-descricao_hipoteses = { 
-    1:"Cargas decorrentes da ação do vento máximo de projeto, com direção transversal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    2:"Cargas decorrentes da ação do vento máximo de projeto, com direção longitudinal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    3:"Cargas decorrentes da ação do vento máximo de projeto, a 45° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    4:"Cargas decorrentes da ação do vento máximo de projeto, a 60° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    5:"Cargas decorrentes da ação do vento máximo de projeto, a 75° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    6:"Cargas decorrentes da ação do vento de alta intensidade, com direção transversal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    7:"Cargas decorrentes da ação do vento de alta intensidade, com direção longitudinal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    8:"Cargas decorrentes da ação do vento de alta intensidade, a 45° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).", 
-    9:"Cargas decorrentes da ação do vento de alta intensidade, a 60° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).", 
-    10:"Cargas decorrentes da ação do vento de alta intensidade, a 75° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).", 
-    11: "Cargas de construção/manutenção atuando simultaneamente em qualquer combinação possível de para-raios  ou em qualquer combinação possível de fases, com apenas um dos cabos em lançamento e os demais já lançados; peso próprio da estrutura; sem vento. A carga vertical máxima deverá ser determinada considerando-se carga vertical proveniente de cabo ancorado ao solo, com ângulo de 70° e tração de 125% da tração EDS.", 
-    12:"Carga longitudinal correspondente a 100% da tração EDS atuando em qualquer uma das fases no sentido ré; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
-    13: "Carga longitudinal correspondente a 100% da tração EDS atuando em qualquer uma das fases no sentido Vante; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
-    14: "Carga longitudinal correspondente a 125% da tração EDS atuando em qualquer cabo para-raios  no sentido ré; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ", 
-    15: "Carga longitudinal correspondente a 125% da tração EDS atuando em qualquer cabo para-raios  no sentido Vante; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
-    16: "Cargas longitudinais nos para-raios  correspondentes a 60% das trações EDS e cargas longitudinais nas fases correspondentes a 40% das trações EDS atuando simultaneamente em todos os cabos; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",    
-    17: "Cargas dos cabos na temperatura mínima, sem vento, a estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
-    18: "Cargas decorrentes da ação do vento máximo de projeto, com direção transversal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura considerando cabos para o lado de maior tracionamento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
-    }
+    adicionar_tabela(doc,dados)
 
-doc.add_heading("HIPÓTESES PARA DIMENSIONAMENTO ESTRUTURAL", level = 1) 
 
+    doc.add_heading("Cargas finais nos cabos", level = 2)
 
-for numero, hipotese in hipoteses.items():
-    doc.add_heading(f"{hipotese['nome']}", level = 2) 
-    doc.add_paragraph(f"{descricao_hipoteses[numero]}" ,style="First Paragraph")
+    dados = [["Estados de carga", "Fase", "Ré  (kgf)", "Vante (kgf)"]]
 
-doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
 
-doc.add_heading("FATORES DE SOBRECARGA", level = 1) 
+    for numero, fases in tracao_cabo1.items():
+        for fase, valores in fases.items():
+            dados.append([
+                str(numero),
+                fase,
+                str(int(valores.get('re', ''))),
+                str(int(valores.get('vante', '')))
+            ])
 
-doc.add_paragraph("As cargas atuantes em cada uma das hipóteses de carga indicadas nos itens anteriores devem ser majoradas pelos seguintes fatores de sobrecarga:" ,style="First Paragraph")
-dados = [["Estados de carga", "Transversal", "Longitudinal", "Vertical Máximo", "Vertical Mínimo"]]
+    adicionar_tabela(doc,dados)
 
-for numero, valores in fator_sobrecarga.items():
-        dados.append([
-            numero,
-            str(valores.get('T', '')),
-            str(valores.get('L', '')),
-            str(valores.get('V_normal', '')),
-            str(valores.get('V_reduzido', '')),
-        ])
+    doc.add_heading("Pressão de vento na estrutura", level = 2)
 
-adicionar_tabela(doc,dados) 
+    dados = [["Estado de carga","Tronco", "Altura do Centroide (m)", "Gt", "Pressão Transversal (kgf/m²)", "Pressão Longitudinal (kgf/m²)"]]
 
-doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+    for chave, hipotese in hipoteses.items():
+        for i, (numero, valores) in enumerate(tronco.items()):
+         if i < len(tronco) - 1:
+                dados.append([
+                    str(chave),
+                    str(numero),
+                    str(round(valores["centroide"],2)),
+                    str(round(valores["gt"],2)),
+                    str(round(pressao_tronco[chave][numero]["T"])),
+                    str(round(pressao_tronco[chave][numero]["L"])),
+                ])
 
-doc.add_heading("CARREGAMENTOS", level = 1) 
+    adicionar_tabela(doc,dados)
+
+
+    doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+
+
+    descricao_hipoteses = {
+        1:"Cargas decorrentes da ação do vento máximo de projeto, com direção transversal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        2:"Cargas decorrentes da ação do vento máximo de projeto, com direção longitudinal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        3:"Cargas decorrentes da ação do vento máximo de projeto, a 45° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        4:"Cargas decorrentes da ação do vento máximo de projeto, a 60° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        5:"Cargas decorrentes da ação do vento máximo de projeto, a 75° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        6:"Cargas decorrentes da ação do vento de alta intensidade, com direção transversal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        7:"Cargas decorrentes da ação do vento de alta intensidade, com direção longitudinal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        8:"Cargas decorrentes da ação do vento de alta intensidade, a 45° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        9:"Cargas decorrentes da ação do vento de alta intensidade, a 60° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        10:"Cargas decorrentes da ação do vento de alta intensidade, a 75° com a direção da linha, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        11: "Cargas de construção/manutenção atuando simultaneamente em qualquer combinação possível de para-raios  ou em qualquer combinação possível de fases, com apenas um dos cabos em lançamento e os demais já lançados; peso próprio da estrutura; sem vento. A carga vertical máxima deverá ser determinada considerando-se carga vertical proveniente de cabo ancorado ao solo, com ângulo de 70° e tração de 125% da tração EDS.",
+        12:"Carga longitudinal correspondente a 100% da tração EDS atuando em qualquer uma das fases no sentido ré; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
+        13: "Carga longitudinal correspondente a 100% da tração EDS atuando em qualquer uma das fases no sentido Vante; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
+        14: "Carga longitudinal correspondente a 125% da tração EDS atuando em qualquer cabo para-raios  no sentido ré; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
+        15: "Carga longitudinal correspondente a 125% da tração EDS atuando em qualquer cabo para-raios  no sentido Vante; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
+        16: "Cargas longitudinais nos para-raios  correspondentes a 60% das trações EDS e cargas longitudinais nas fases correspondentes a 40% das trações EDS atuando simultaneamente em todos os cabos; verticais normais e peso próprio da estrutura; sem vento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        17: "Cargas dos cabos na temperatura mínima, sem vento, a estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo). ",
+        18: "Cargas decorrentes da ação do vento máximo de projeto, com direção transversal, sobre cabos, cadeias de isoladores e estrutura; verticais normais e peso próprio da estrutura considerando cabos para o lado de maior tracionamento. A estrutura deve ser também verificada para verticais reduzidas (estrutura com vão gravante mínimo).",
+        }
+
+    doc.add_heading("HIPÓTESES PARA DIMENSIONAMENTO ESTRUTURAL", level = 1)
+
+
+    for numero, hipotese in hipoteses.items():
+        doc.add_heading(f"{hipotese['nome']}", level = 2)
+        doc.add_paragraph(f"{descricao_hipoteses[numero]}" ,style="First Paragraph")
 
-for chave, hipotese in hipoteses.items(): 
-    doc.add_heading(f"{hipotese['nome']}", level = 2) 
-    inserir_grafico(doc, f'arvore/hipotese de carga{chave}.png', "", largura=Inches(6.89))
     doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
-    
-
-doc.add_heading("RESUMO", level = 1) 
-inserir_grafico(doc, 'arvore/resumo.png', "", largura=Inches(6.89))
-    
- # Ajustar as tabelas
-for tabela_index, tabela in enumerate(doc.tables[1:], start=1):
-     # Percorra as linhas da tabela
-     for row in tabela.rows:
-         # Defina a altura da linha
-         row.height = Cm(0.6)  # Altere o valor para a altura desejada
-         # Alinhe o conteúdo verticalmente
-         
-         for cell in row.cells:
-             cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER   
-    
-
-doc.save('arvore/'+str(numero_documento)+ nome_estrutura.replace("/", "-") + '.docx')
-# Registre o tempo de término
-tempo_final = time.time()
-
-# Calcule o tempo decorrido
-tempo_decorrido = tempo_final - tempo_inicial
-
-print(f"Tempo decorrido: {tempo_decorrido} segundos")
\ No newline at end of file
+
+    doc.add_heading("FATORES DE SOBRECARGA", level = 1)
+
+    doc.add_paragraph("As cargas atuantes em cada uma das hipóteses de carga indicadas nos itens anteriores devem ser majoradas pelos seguintes fatores de sobrecarga:" ,style="First Paragraph")
+    dados = [["Estados de carga", "Transversal", "Longitudinal", "Vertical Máximo", "Vertical Mínimo"]]
+
+    for numero, valores in fator_sobrecarga.items():
+            dados.append([
+                numero,
+                str(valores.get('T', '')),
+                str(valores.get('L', '')),
+                str(valores.get('V_normal', '')),
+                str(valores.get('V_reduzido', '')),
+            ])
+
+    adicionar_tabela(doc,dados)
+
+    doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+
+    doc.add_heading("CARREGAMENTOS", level = 1)
+
+    for chave, hipotese in hipoteses.items():
+        doc.add_heading(f"{hipotese['nome']}", level = 2)
+        inserir_grafico(doc, f'arvore/hipotese de carga{chave}.png', "", largura=Inches(6.89))
+        doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+
+
+    doc.add_heading("RESUMO", level = 1)
+    inserir_grafico(doc, 'arvore/resumo.png', "", largura=Inches(6.89))
+
+     # Ajustar as tabelas
+    for tabela_index, tabela in enumerate(doc.tables[1:], start=1):
+         # Percorra as linhas da tabela
+         for row in tabela.rows:
+             # Defina a altura da linha
+             row.height = Cm(0.6)  # Altere o valor para a altura desejada
+             # Alinhe o conteúdo verticalmente
+
+             for cell in row.cells:
+                 cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+
+
+    caminho = 'arvore/'+str(numero_documento)+ nome_estrutura.replace("/", "-") + '.docx'
+    doc.save(caminho)
+    return caminho
+
+
+# =============================================================
+# Execução como script
+# =============================================================
+
+if __name__ == "__main__":
+    # Registre o tempo de início
+    tempo_inicial = time.time()
+
+    resultado = calcular_arvore_carga(ESTRUTURA_EXEMPLO, LINHA_EXEMPLO)
+    estatisticas = resultado["estatisticas_mudanca_estado"]
+    print(f"Mudança de estado: {estatisticas['solucoes']} soluções, {estatisticas['reaproveitadas']} "
+          f"reaproveitadas de {estatisticas['solucoes'] + estatisticas['reaproveitadas']} chamadas")
+    # o resultado precisa ser serializável para voltar dos processos de executar_linha
+    pickle.dumps(resultado)
+
+    salvar_em_txt(resultado["arvore_carga"], 'arvore_carga.txt')
+    salvar_em_xml("arvore_carga.xml")
+    gerar_graficos(resultado, mostrar=True)
+    gerar_memorial(resultado)
+
+    # Registre o tempo de término
+    tempo_final = time.time()
+
+    # Calcule o tempo decorrido
+    tempo_decorrido = tempo_final - tempo_inicial
+
+    print(f"Tempo decorrido: {tempo_decorrido} segundos")
+
+    # Benchmark: consultas à tabela de cabos nos laços (máscara booleana por
+    # acesso, como antes) × propriedades resolvidas uma vez por execução.
+    # 4 pontos de fixação × 13 hipóteses.
+    db = carregar_db_cabos()
+    nomes_cabos = [fase["cabo"] for fase in ESTRUTURA_EXEMPLO["geometria_estrutura"].values()]
+    n_hipoteses, repeticoes = 13, 20
+
+    t0 = time.perf_counter()
+    for _ in range(repeticoes):
+        for _h in range(n_hipoteses):
+            for nome in nomes_cabos:
+                db[db['Cabo'] == nome]["Diametro (mm)"].iloc[0]                       # Cx do cabo
+                selecionado = db.loc[db['Cabo'] == nome]                              # trações
+                [float(selecionado[c].iloc[0]) for c in ("E", "S", "COEF", "Peso (kgf/m)", "Diametro (mm)")]
+                float(db.loc[db['Cabo'] == nome]["Peso (kgf/m)"].iloc[0])            # árvore
+    dt_mascaras = (time.perf_counter() - t0) / repeticoes
+
+    t0 = time.perf_counter()
+    for _ in range(repeticoes):
+        registros = propriedades_cabos(db, nomes_cabos)
+        for _h in range(n_hipoteses):
+            for nome in nomes_cabos:
+                registros[nome].diametro_mm
+                r = registros[nome]
+                [r.E, r.S, r.COEF, r.peso_kgfm, r.diametro_mm]
+                registros[nome].peso_kgfm
+    dt_registros = (time.perf_counter() - t0) / repeticoes
+
+    print(f"\n[BENCHMARK CONSULTA DE CABOS] {len(nomes_cabos)} cabos × {n_hipoteses} hipóteses")
+    print(f"máscaras booleanas: {dt_mascaras * 1e3:.2f} ms por estrutura")
+    print(f"registros resolvidos: {dt_registros * 1e3:.2f} ms por estrutura "
+          f"({dt_mascaras / dt_registros:.0f}x)")
+
+    # Linha completa: uma linha da tabela por estrutura, em paralelo
+    tabela_estruturas = pd.DataFrame([
+        ESTRUTURA_EXEMPLO,
+        {**ESTRUTURA_EXEMPLO, "nome_estrutura": " 0/3", "altura_estrutura": 18, "deflexao": 10},
+        {**ESTRUTURA_EXEMPLO, "nome_estrutura": " 0/4", "vao": {"vante": 320, "re": 280}},
+    ])
+    linha_completa = executar_linha(tabela_estruturas, LINHA_EXEMPLO)
+    print(linha_completa.resumo)
+    print(linha_completa.envoltoria)
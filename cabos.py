@@ -17,9 +17,15 @@ Uso:
 
     cabos_disponiveis = listar_cabos()
 """
-from typing import Dict, List, Optional
-# A classe Cabo é esperada em um módulo chamado 'elementos'
-# from elementos import Cabo
+import functools
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from elementos import Cabo
+from mec_5422 import CalculadoraNBR5422
 
 # Fator de conversão de kN para kgf
 KN_PARA_KGF = 101.971621
@@ -538,12 +544,317 @@ CABOS_PARA_RAIOS = {
 _BD_CABOS = {**CABOS_CAA, **CABOS_CA, **CABOS_PARA_RAIOS, **CABOS_CAL}
 
 
+# =============================================================
+# Catálogo em array estruturado (colunas NumPy, SI pré-calculado)
+# =============================================================
+
+# Um registro por cabo. Colunas de catálogo (mm, kgf, ...) e as mesmas
+# grandezas já convertidas para o SI (mesmas conversões de elementos.Cabo).
+# Dados ausentes no catálogo (ex.: E e alfa dos cabos CAL) ficam como NaN.
+DTYPE_CATALOGO = np.dtype([
+    ("nome", "U16"),
+    ("familia", "U12"),
+    ("diametro_mm", "f8"),
+    ("area_secao_mm2", "f8"),
+    ("peso_kgfm", "f8"),
+    ("modulo_elasticidade_kgfmm2", "f8"),
+    ("coef_dilatacao_termica_1porc", "f8"),
+    ("carga_ruptura_kgf", "f8"),
+    ("resistencia_20c_ohm_km", "f8"),
+    ("diametro_m", "f8"),
+    ("area_secao_m2", "f8"),
+    ("peso_unit_npm", "f8"),
+    ("modulo_elasticidade_pa", "f8"),
+    ("carga_ruptura_n", "f8"),
+    ("comprimento_ruptura_m", "f8"),  # carga de ruptura / peso: relação resistência-peso
+])
+
+# família -> dicionário de origem (ordem = ordem das linhas do catálogo)
+FAMILIAS_CABOS = {
+    "CAA": CABOS_CAA,
+    "CA": CABOS_CA,
+    "PARA_RAIOS": CABOS_PARA_RAIOS,
+    "CAL": CABOS_CAL,
+}
+
+
+def _registro_catalogo(nome: str, familia: str, dados: Dict) -> tuple:
+    """Converte um dicionário de catálogo em uma linha de DTYPE_CATALOGO."""
+    nan = float("nan")
+    if "area_mm2" in dados:
+        # Formato das tabelas CAL (ASTM B399M): massa em kg/km e RMC em kN
+        area = dados["area_mm2"]
+        peso = dados["massa_linear_kg_km"] / 1000.0
+        ruptura = dados["rmc_kN"] * KN_PARA_KGF
+        resistencia = dados.get("resistencia_20C_ohm_km", nan)
+    else:
+        area = dados["area_secao_total_mm2"]
+        peso = dados["peso_total_kgfm"]
+        ruptura = dados["carga_ruptura_kgf"]
+        resistencia = dados.get("resistencia_eletrica_20c_ohm_km", nan)
+    modulo = dados.get("modulo_elasticidade_kgfmm2", nan)
+
+    g = CalculadoraNBR5422.ACELERACAO_GRAVIDADE
+    return (
+        nome, familia, dados["diametro_mm"], area, peso, modulo,
+        dados.get("coef_dilatacao_termica_1porc", nan), ruptura, resistencia,
+        dados["diametro_mm"] / 1000.0,
+        area / 1_000_000.0,
+        peso * g,
+        modulo * g * 1_000_000.0,
+        ruptura * g,
+        ruptura / peso,
+    )
+
+
+class CatalogoCabos:
+    """
+    Catálogo de cabos somente leitura sobre um array estruturado NumPy.
+
+    - coluna(campo): view (sem cópia) de uma propriedade para todos os cabos;
+    - linha(nome): registro do cabo (np.void, view sobre o array), busca O(1);
+    - coluna(campo, nomes): propriedade de vários cabos, para cálculos em lote.
+    """
+
+    def __init__(self, dados: np.ndarray) -> None:
+        self.dados = dados
+        self.dados.flags.writeable = False
+        # o primeiro campo é o nome do cabo ("nome" em DTYPE_CATALOGO, "Cabo" na planilha)
+        self.campo_nome = dados.dtype.names[0]
+        self._indice: Dict[str, int] = {nome: i for i, nome in enumerate(dados[self.campo_nome].tolist())}
+        # índices ordenados (permutação, valores ordenados), criados na primeira consulta do campo
+        self._ordens: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._familias: Dict[str, np.ndarray] = {}
+        if "familia" in dados.dtype.names:
+            self._familias = {
+                familia: np.flatnonzero(dados["familia"] == familia)
+                for familia in np.unique(dados["familia"]).tolist()
+            }
+
+    @classmethod
+    def de_dicionarios(cls, familias: Dict[str, Dict[str, Dict]]) -> "CatalogoCabos":
+        """Monta o catálogo a partir de {família: {nome: dados}} (formato deste módulo)."""
+        registros = [
+            _registro_catalogo(nome, familia, dados)
+            for familia, tabela in familias.items()
+            for nome, dados in tabela.items()
+        ]
+        return cls(np.array(registros, dtype=DTYPE_CATALOGO))
+
+    @classmethod
+    def carregar(
+        cls, origem: Optional[Union[str, Path]] = None, destino: Optional[Union[str, Path]] = None
+    ) -> "CatalogoCabos":
+        """Catálogo sobre a tabela compilada (memory-mapped); ver carregar_tabela_cabos."""
+        return cls(carregar_tabela_cabos(origem, destino))
+
+    def __len__(self) -> int:
+        return len(self.dados)
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self._indice
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._indice)
+
+    def indice(self, nome: str) -> int:
+        """Posição do cabo no catálogo."""
+        try:
+            return self._indice[nome]
+        except KeyError:
+            raise KeyError(f"Cabo com nome '{nome}' não encontrado na base de dados.") from None
+
+    def indices(self, nomes: Sequence[str]) -> np.ndarray:
+        """Posições de vários cabos (na ordem dada, com repetições)."""
+        return np.fromiter((self.indice(n) for n in nomes), dtype=np.intp, count=len(nomes))
+
+    def linha(self, nome: str) -> np.void:
+        """Registro do cabo (view sobre o array; acesse campos por nome)."""
+        return self.dados[self.indice(nome)]
+
+    def coluna(self, campo: str, nomes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Coluna inteira (view) ou, com `nomes`, os valores desses cabos na ordem dada."""
+        if nomes is None:
+            return self.dados[campo]
+        return self.dados[campo][self.indices(nomes)]
+
+    # ---------------- consultas por faixa (índices ordenados) ----------------
+    def _ordem(self, campo: str) -> Tuple[np.ndarray, np.ndarray]:
+        if campo not in self._ordens:
+            if campo not in self.dados.dtype.names or self.dados.dtype[campo].kind != "f":
+                raise ValueError(f"'{campo}' não é uma propriedade numérica do catálogo.")
+            valores = self.dados[campo]
+            perm = np.argsort(valores, kind="stable")  # NaN ficam no fim
+            self._ordens[campo] = (perm, valores[perm])
+        return self._ordens[campo]
+
+    def faixa(self, campo: str, minimo: Optional[float] = None, maximo: Optional[float] = None) -> np.ndarray:
+        """Posições dos cabos com minimo <= campo <= maximo (busca binária; NaN nunca entra)."""
+        perm, ordenados = self._ordem(campo)
+        inicio = 0 if minimo is None else np.searchsorted(ordenados, minimo, side="left")
+        fim = np.searchsorted(ordenados, np.inf if maximo is None else maximo, side="right")
+        return perm[inicio:fim]
+
+    def consultar(
+        self,
+        *,
+        familia: Optional[str] = None,
+        ordenar_por: Optional[str] = None,
+        decrescente: bool = False,
+        **faixas: Tuple[Optional[float], Optional[float]],
+    ) -> np.ndarray:
+        """
+        Posições dos cabos que atendem a todas as faixas (campo=(mín, máx), None = aberto)
+        e, opcionalmente, à família, ordenadas por `ordenar_por`.
+        Ex.: consultar(familia="CAA", carga_ruptura_kgf=(7000, None), peso_kgfm=(None, 0.8))
+        """
+        candidatos = [self.faixa(campo, *limites) for campo, limites in faixas.items()]
+        if familia is not None:
+            candidatos.append(self._familias.get(familia, np.empty(0, dtype=np.intp)))
+        if not candidatos:
+            selecao = np.arange(len(self))
+        else:
+            # parte do conjunto mais seletivo e só testa os demais nesses cabos
+            candidatos.sort(key=len)
+            selecao = np.sort(candidatos[0])
+            for outro in candidatos[1:]:
+                selecao = selecao[np.isin(selecao, outro, assume_unique=True)]
+
+        if ordenar_por is not None:
+            perm, _ = self._ordem(ordenar_por)
+            posicao = np.empty_like(perm)
+            posicao[perm] = np.arange(len(perm))
+            selecao = selecao[np.argsort(posicao[selecao], kind="stable")]
+            if decrescente:
+                selecao = selecao[::-1]
+        return selecao
+
+    def nomes(self, indices: Optional[np.ndarray] = None) -> List[str]:
+        """Nomes dos cabos nas posições dadas (todos, se None)."""
+        nomes = self.dados[self.campo_nome]
+        return (nomes if indices is None else nomes[indices]).tolist()
+
+
+# =============================================================
+# Catálogo compilado (.npy memory-mapped)
+# =============================================================
+
+# Coluna com o nome do cabo na planilha _db/cabos.xlsx
+COLUNA_NOME_XLSX = "Cabo"
+
+
+def _caminhos_compilados(
+    origem: Optional[Union[str, Path]], destino: Optional[Union[str, Path]]
+) -> Tuple[Path, Path]:
+    """(arquivo de origem, arquivo .npy); origem None = dicionários deste módulo."""
+    if origem is None:
+        origem = Path(__file__)
+        padrao = origem.with_name("cabos_catalogo.npy")
+    else:
+        origem = Path(origem)
+        padrao = origem.with_suffix(".npy")
+    return origem, Path(destino) if destino is not None else padrao
+
+
+def _tabela_de_xlsx(origem: Path) -> np.ndarray:
+    """Planilha -> array estruturado com todas as colunas (nome do cabo primeiro)."""
+    import pandas as pd  # só necessário para (re)compilar a partir da planilha
+
+    df = pd.read_excel(origem)
+    if COLUNA_NOME_XLSX not in df.columns:
+        raise ValueError(f"A planilha {origem} não tem a coluna '{COLUNA_NOME_XLSX}'.")
+    colunas = [COLUNA_NOME_XLSX] + [c for c in df.columns if c != COLUNA_NOME_XLSX]
+    valores = []
+    for coluna in colunas:
+        serie = df[coluna]
+        if coluna != COLUNA_NOME_XLSX and pd.api.types.is_numeric_dtype(serie):
+            valores.append(serie.to_numpy(dtype=float, na_value=np.nan))
+        else:
+            valores.append(serie.fillna("").astype(str).to_numpy(dtype=str))
+    tabela = np.empty(len(df), dtype=[(str(c), v.dtype) for c, v in zip(colunas, valores)])
+    for coluna, v in zip(colunas, valores):
+        tabela[str(coluna)] = v
+    return tabela
+
+
+def compilar_tabela_cabos(
+    origem: Optional[Union[str, Path]] = None, destino: Optional[Union[str, Path]] = None
+) -> Path:
+    """
+    Gera o arquivo .npy (array estruturado) a partir de uma planilha .xlsx
+    (requer pandas) ou, com origem None, dos dicionários deste módulo.
+    O .npy recebe o mtime da origem, que é o que carregar_tabela_cabos compara.
+    """
+    origem_path, destino = _caminhos_compilados(origem, destino)
+    # mtime lido antes da origem: se ela mudar durante a leitura, a próxima carga recompila
+    mtime_origem = origem_path.stat().st_mtime_ns
+    tabela = CatalogoCabos.de_dicionarios(FAMILIAS_CABOS).dados if origem is None else _tabela_de_xlsx(origem_path)
+
+    # grava num temporário e renomeia: leitores (ex.: outros processos) nunca veem um arquivo parcial
+    temporario = destino.with_name(f"{destino.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporario, "wb") as f:
+            np.save(f, tabela)
+        os.utime(temporario, ns=(mtime_origem, mtime_origem))
+        os.replace(temporario, destino)
+    except BaseException:
+        temporario.unlink(missing_ok=True)
+        raise
+    return destino
+
+
+def carregar_tabela_cabos(
+    origem: Optional[Union[str, Path]] = None, destino: Optional[Union[str, Path]] = None
+) -> np.ndarray:
+    """
+    Abre a tabela compilada em modo memory-map (somente leitura), recompilando
+    antes se o .npy não existir ou se o mtime da origem tiver mudado.
+
+    Args:
+        origem: planilha .xlsx (ex.: "_db/cabos.xlsx") ou None para os dicionários deste módulo.
+        destino: arquivo .npy (padrão: ao lado da origem, mesmo nome com extensão .npy).
+    """
+    origem_path, destino_path = _caminhos_compilados(origem, destino)
+    if not destino_path.exists() or destino_path.stat().st_mtime_ns != origem_path.stat().st_mtime_ns:
+        compilar_tabela_cabos(origem, destino_path)
+    return np.load(destino_path, mmap_mode="r")
+
+
+# Catálogo padrão, montado uma vez na importação
+CATALOGO = CatalogoCabos.de_dicionarios(FAMILIAS_CABOS)
+
+
+# Máximo de instâncias de Cabo mantidas no registro de criar_cabo
+TAMANHO_REGISTRO_CABOS = 256
+
+
+@functools.lru_cache(maxsize=TAMANHO_REGISTRO_CABOS)
+def _cabo_registrado(nome_cabo: str) -> Cabo:
+    """Cria o Cabo a partir do CATALOGO; o lru_cache garante uma instância por nome."""
+    r = CATALOGO.linha(nome_cabo)
+    if np.isnan(r["modulo_elasticidade_kgfmm2"]) or np.isnan(r["coef_dilatacao_termica_1porc"]):
+        raise ValueError(
+            f"Cabo '{nome_cabo}' ({r['familia']}) não tem módulo de elasticidade e/ou "
+            "coeficiente de dilatação no catálogo."
+        )
+    return Cabo(
+        nome=nome_cabo,
+        diametro_mm=float(r["diametro_mm"]),
+        area_secao_mm2=float(r["area_secao_mm2"]),
+        peso_kgfm=float(r["peso_kgfm"]),
+        modulo_elasticidade_kgfmm2=float(r["modulo_elasticidade_kgfmm2"]),
+        coef_dilatacao_termica_1porc=float(r["coef_dilatacao_termica_1porc"]),
+        carga_ruptura_kgf=float(r["carga_ruptura_kgf"]),
+    )
+
+
 def criar_cabo(nome_cabo: str) -> Optional[Cabo]:
     """
     Cria uma instância da classe Cabo a partir do nome do cabo.
 
-    Busca os dados do cabo no banco de dados interno e, se encontrado,
-    retorna um objeto Cabo inicializado com esses dados.
+    As instâncias são imutáveis e registradas: chamadas repetidas com o mesmo
+    nome devolvem o mesmo objeto (custo de uma busca em dicionário), até o
+    limite de TAMANHO_REGISTRO_CABOS nomes distintos.
 
     Args:
         nome_cabo: O nome do cabo (ex: "Linnet", "Daisy").
@@ -551,18 +862,15 @@ def criar_cabo(nome_cabo: str) -> Optional[Cabo]:
     Returns:
         Uma instância da classe Cabo se o nome for encontrado,
         caso contrário, retorna None.
+
+    Raises:
+        ValueError: se o catálogo não tiver os dados mecânicos do cabo
+            (ex.: cabos CAL, sem módulo de elasticidade e coef. de dilatação).
     """
-    dados_cabo = _BD_CABOS.get(nome_cabo)
-
-    if dados_cabo:
-        # A criação da instância da classe Cabo depende da sua definição
-        # no módulo 'elementos'. Exemplo de como poderia ser:
-        # return Cabo(nome=nome_cabo, **dados_cabo)
-        print(f"Dados para o cabo '{nome_cabo}': {dados_cabo}")
-        return dados_cabo  # Retornando o dicionário por enquanto
-    else:
+    if nome_cabo not in CATALOGO:
         print(f"Cabo com nome '{nome_cabo}' não encontrado na base de dados.")
         return None
+    return _cabo_registrado(nome_cabo)
 
 
 def listar_cabos() -> List[str]:
@@ -574,6 +882,36 @@ def listar_cabos() -> List[str]:
     """
     return list(_BD_CABOS.keys())
 
+
+def consultar_cabos(
+    *,
+    familia: Optional[str] = None,
+    ordenar_por: Optional[str] = None,
+    decrescente: bool = False,
+    **faixas: Tuple[Optional[float], Optional[float]],
+) -> List[str]:
+    """
+    Seleciona cabos por faixas de propriedades do catálogo (busca binária em
+    índices ordenados, sem varrer a base).
+
+    Args:
+        familia: "CAA", "CA", "CAL" ou "PARA_RAIOS" (None = todas).
+        ordenar_por: campo numérico de DTYPE_CATALOGO usado para ordenar.
+        decrescente: ordem decrescente de `ordenar_por`.
+        **faixas: campo=(mínimo, máximo), com None para limite aberto.
+
+    Returns:
+        Lista com os nomes dos cabos selecionados.
+
+    Exemplo:
+        consultar_cabos(familia="CAA", carga_ruptura_kgf=(7000, None), peso_kgfm=(None, 0.8),
+                        ordenar_por="comprimento_ruptura_m", decrescente=True)
+    """
+    return CATALOGO.nomes(
+        CATALOGO.consultar(familia=familia, ordenar_por=ordenar_por, decrescente=decrescente, **faixas)
+    )
+
+
 # Exemplo de uso:
 if __name__ == '__main__':
     # Listar todos os cabos disponíveis
@@ -586,20 +924,38 @@ if __name__ == '__main__':
     print("Testando cabo CAA 'Linnet':")
     cabo_linnet = criar_cabo("Linnet")
     if cabo_linnet:
-        # Aqui você usaria os atributos do objeto Cabo, por exemplo:
-        # print(f"Diâmetro: {cabo_linnet.diametro_mm} mm")
-        # print(f"Carga de Ruptura: {cabo_linnet.carga_ruptura_kgf:.2f} kgf")
-        pass # Apenas o print dentro da função será executado por enquanto
+        print(cabo_linnet)
+        print(f"Peso unitário: {cabo_linnet.peso_unit_npm:.3f} N/m")
+        print(f"Mesma instância na segunda chamada: {criar_cabo('Linnet') is cabo_linnet}")
     print("-" * 30)
 
     # Criar e exibir dados de um cabo CA
     print("Testando cabo CA 'Daisy':")
     cabo_daisy = criar_cabo("Daisy")
     if cabo_daisy:
-        pass
+        print(cabo_daisy)
     print("-" * 30)
 
     # Tentar criar um cabo inexistente
     print("Testando cabo inexistente:")
     cabo_inexistente = criar_cabo("CaboInexistente")
 
+    print("-" * 30)
+
+    # Catálogo em arrays: propriedades SI de vários cabos de uma vez
+    print("Catálogo em array (SI):")
+    nomes = ["Linnet", "Daisy", "EHS_38"]
+    print(f"Peso (N/m): {CATALOGO.coluna('peso_unit_npm', nomes)}")
+    print(f"E (GPa):    {CATALOGO.coluna('modulo_elasticidade_pa', nomes) / 1e9}")
+    print(f"Linnet:     {CATALOGO.linha('Linnet')}")
+
+    # Seleção por faixas: CAA com RTS >= 7000 kgf e peso <= 0,8 kgf/m, por resistência/peso
+    print("-" * 30)
+    selecionados = consultar_cabos(
+        familia="CAA",
+        carga_ruptura_kgf=(7000, None),
+        peso_kgfm=(None, 0.8),
+        ordenar_por="comprimento_ruptura_m",
+        decrescente=True,
+    )
+    print(f"CAA com RTS >= 7000 kgf e peso <= 0,8 kgf/m: {selecionados}")
@@ -9,7 +9,10 @@ as propriedades e os cálculos intrínsecos de cada elemento.
 
 import math
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 # Assumindo que o arquivo mec_5422.py está no mesmo diretório ou em um
 # local acessível pelo Python.
@@ -109,6 +112,74 @@ class Cabo:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class CaboArray:
+    """
+    Propriedades SI de vários cabos (feixes, circuitos) em arrays NumPy, uma
+    posição por cabo, com as versões vetorizadas dos métodos de Cabo.
+
+    Os arrays são somente leitura. Nos métodos, o último eixo das entradas
+    corresponde aos cabos (broadcast usual do NumPy): uma força de vento com
+    formato (n_hipoteses, n_cabos) gera um resultado (n_hipoteses, n_cabos).
+    """
+    nomes: Tuple[str, ...]
+    diametro_m: np.ndarray
+    area_secao_m2: np.ndarray
+    peso_unit_npm: np.ndarray
+    modulo_elasticidade_pa: np.ndarray
+    coef_dilatacao_termica_1porc: np.ndarray
+    carga_ruptura_n: np.ndarray
+
+    _CAMPOS = (
+        "diametro_m", "area_secao_m2", "peso_unit_npm", "modulo_elasticidade_pa",
+        "coef_dilatacao_termica_1porc", "carga_ruptura_n",
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "nomes", tuple(self.nomes))
+        for campo in self._CAMPOS:
+            valores = np.array(getattr(self, campo), dtype=float)
+            if valores.shape != (len(self.nomes),):
+                raise ValueError(f"{campo} deve ter um valor por cabo ({len(self.nomes)}).")
+            valores.flags.writeable = False
+            object.__setattr__(self, campo, valores)
+
+    @classmethod
+    def de_cabos(cls, cabos: Sequence[Cabo]) -> "CaboArray":
+        """Agrupa instâncias de Cabo (já convertidas para o SI)."""
+        return cls(nomes=[c.nome for c in cabos], **{
+            campo: [getattr(c, campo) for c in cabos] for campo in cls._CAMPOS
+        })
+
+    @classmethod
+    def de_catalogo(cls, nomes: Sequence[str], catalogo=None) -> "CaboArray":
+        """
+        Lê as colunas SI direto do catálogo em arrays (cabos.CATALOGO por padrão),
+        sem criar objetos Cabo. Dados ausentes no catálogo ficam como NaN.
+        """
+        if catalogo is None:
+            from cabos import CATALOGO as catalogo  # import tardio: cabos importa este módulo
+        return cls(nomes=nomes, **{campo: catalogo.coluna(campo, nomes) for campo in cls._CAMPOS})
+
+    def __len__(self) -> int:
+        return len(self.nomes)
+
+    @property
+    def coef_arrasto(self) -> np.ndarray:
+        """Coeficiente de arrasto (Cx) de cada cabo (1.2 para d < 15mm, 1.0 caso contrário)."""
+        return CalculadoraNBR5422.coef_arrasto_cabo_array(self.diametro_m, erros="raise")
+
+    def peso_resultante_npm(self, forca_vento_horizontal_npm: ArrayLike) -> np.ndarray:
+        """
+        Peso unitário resultante (N/m) de cada cabo: hypot(peso próprio, vento),
+        com broadcast da força de vento por metro (N/m) contra os cabos.
+        """
+        forca = np.asarray(forca_vento_horizontal_npm, dtype=float)
+        if (forca < 0).any():
+            raise ValueError("Força de vento deve ser não negativa.")
+        return np.hypot(self.peso_unit_npm, forca)
+
+
 # =============================================================
 # Exemplo de uso
 # =============================================================
@@ -158,4 +229,11 @@ if __name__ == "__main__":
 
 
     except Exception as e:
-        print(f"\nErro ao criar o objeto Cabo: {e}")
\ No newline at end of file
+        print(f"\nErro ao criar o objeto Cabo: {e}")
+
+    # Vários cabos de uma vez: peso com vento para 3 pressões × 3 cabos
+    feixe = CaboArray.de_catalogo(["Linnet", "Daisy", "EHS_38"])
+    pressoes = np.array([[0.0], [300.0], [600.0]])  # Pa, uma linha por hipótese
+    forcas = pressoes * feixe.coef_arrasto * feixe.diametro_m  # N/m, (3 hipóteses, 3 cabos)
+    print(f"\nCaboArray {feixe.nomes}:")
+    print(f"Peso resultante (N/m):\n{np.round(feixe.peso_resultante_npm(forcas), 3)}")
@@ -10,13 +10,25 @@ Refatorado para facilitar a criação e iteração sobre N casos de carga.
 Observação importante: ajuste coeficientes/tabelas conforme sua leitura da NBR 5422:2024.
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Callable, Any
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, field, fields
+from enum import Enum, IntEnum
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Callable, Any
+import functools
 import math
 import itertools
+import os
+from pathlib import Path
 import time
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+if TYPE_CHECKING:
+    from elementos import Cabo
+
 
 
 # =============================================================
@@ -40,6 +52,37 @@ class ParametrosTerreno:
     gt_c: float
 
 
+class StatusMudancaEstado(IntEnum):
+    """Códigos de retorno da mudança de estado (mesmos do kernel C++ em mudar_estado.cpp)."""
+    CONVERGIU = 0
+    ARGUMENTO_INVALIDO = 1
+    DERIVADA_NULA = 2
+    SEM_CONVERGENCIA = 3
+
+
+class MetodoMudancaEstado(Enum):
+    """Estratégia de passo do Newton na equação de mudança de estado."""
+    DIFERENCAS_FINITAS = "diferencas_finitas"  # derivada por diferença progressiva (DELTA_DERIVADA)
+    ANALITICO = "analitico"                    # Newton com a derivada fechada do resíduo
+    HALLEY = "halley"                          # Halley (derivadas fechadas de 1ª e 2ª ordem)
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoMudancaEstadoLote:
+    """
+    Resultado de CalculadoraNBR5422.mudar_estado_cabo_lote.
+    Todos os arrays têm o formato (broadcast) dos argumentos de entrada.
+    """
+    tracao_n: np.ndarray    # N, arredondada a 0.1 N; NaN onde não convergiu
+    iteracoes: np.ndarray   # iterações executadas por elemento
+    status: np.ndarray      # StatusMudancaEstado por elemento
+
+    @property
+    def convergiu(self) -> np.ndarray:
+        """Máscara booleana dos elementos que convergiram."""
+        return self.status == StatusMudancaEstado.CONVERGIU
+
+
 # =============================================================
 # Ambiente padrão (singleton simples)
 # =============================================================
@@ -61,11 +104,93 @@ class AmbientePadrao:
         cls.altitude_m = float(altitude_m)
         cls.tipo_terreno = tipo_terreno
 
+    @classmethod
+    def capturar(cls) -> Tuple[float, TipoTerreno]:
+        """Retrato dos padrões atuais (para reaplicar em outro processo)."""
+        return cls.altitude_m, cls.tipo_terreno
+
+    @classmethod
+    def restaurar(cls, estado: Tuple[float, TipoTerreno]) -> None:
+        """Reaplica um retrato obtido com capturar()."""
+        cls.altitude_m, cls.tipo_terreno = estado
+
 
 # =============================================================
 # Núcleo de cálculos
 # =============================================================
 
+# Tamanho máximo de cada memo de fatores de vento (GC, GT, GL)
+TAMANHO_CACHE_FATORES = 4096
+
+
+class _ParametrosTerrenoDict(dict):
+    """dict de ParametrosTerreno que descarta os memos de fatores de vento a cada modificação."""
+
+    def _modificado(self) -> None:
+        CalculadoraNBR5422.limpar_cache()
+
+    def __setitem__(self, chave, valor) -> None:
+        super().__setitem__(chave, valor)
+        self._modificado()
+
+    def __delitem__(self, chave) -> None:
+        super().__delitem__(chave)
+        self._modificado()
+
+    def __ior__(self, outro):
+        resultado = super().__ior__(outro)
+        self._modificado()
+        return resultado
+
+    def clear(self) -> None:
+        super().clear()
+        self._modificado()
+
+    def pop(self, *args):
+        valor = super().pop(*args)
+        self._modificado()
+        return valor
+
+    def popitem(self):
+        item = super().popitem()
+        self._modificado()
+        return item
+
+    def setdefault(self, chave, valor=None):
+        resultado = super().setdefault(chave, valor)
+        self._modificado()
+        return resultado
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._modificado()
+
+
+# Memos (lru_cache: limitados, thread-safe, com contadores de acerto/falha).
+# A classe entra na chave para que subclasses com outros parâmetros não colidam.
+@functools.lru_cache(maxsize=TAMANHO_CACHE_FATORES)
+def _gc_memo(cls: type, h: float, tipo_terreno: TipoTerreno) -> float:
+    p = cls.PARAMETROS_TERRENO[tipo_terreno]
+    gc = p.gc_a * math.log(h) + p.gc_b
+    return float(round(gc, 4))
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_FATORES)
+def _gt_memo(cls: type, h: float, tipo_terreno: TipoTerreno) -> float:
+    p = cls.PARAMETROS_TERRENO[tipo_terreno]
+    gt = p.gt_a * (h ** 2) + p.gt_b * h + p.gt_c
+    return float(round(gt, 4))
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_FATORES)
+def _gl_memo(cls: type, L: float) -> float:
+    if L < 200:
+        return 1.0
+    if L < 800:
+        return 1.693e-10 * L ** 3 - 1.093e-7 * L ** 2 - 2.686e-4 * L + 1.057
+    return 0.858
+
+
 class CalculadoraNBR5422:
     """Rotinas de cálculo auxiliares (ajuste constantes conforme seu procedimento)."""
     # Constantes
@@ -79,12 +204,14 @@ class CalculadoraNBR5422:
     ACELERACAO_GRAVIDADE = 9.80665   # m/s²
 
     # Parâmetros por tipo de terreno (exemplo; alinhar com sua base)
-    PARAMETROS_TERRENO: Dict[TipoTerreno, ParametrosTerreno] = {
+    # Modificações limpam os memos de GC/GT; um dict novo atribuído aqui é
+    # detectado e passa a ser monitorado na próxima consulta.
+    PARAMETROS_TERRENO: Dict[TipoTerreno, ParametrosTerreno] = _ParametrosTerrenoDict({
         TipoTerreno.A: ParametrosTerreno(0.2914, 1.0468, -0.0002, 0.0232, 1.4661),
         TipoTerreno.B: ParametrosTerreno(0.3733, 0.9762, -0.0002, 0.0274, 1.6820),
         TipoTerreno.C: ParametrosTerreno(0.4936, 0.9124, -0.0002, 0.0298, 2.2744),
         TipoTerreno.D: ParametrosTerreno(0.6153, 0.8144, -0.0002, 0.0384, 2.9284),
-    }
+    })
 
     # ------------------------ Atmosfera ------------------------
     @classmethod
@@ -126,35 +253,46 @@ class CalculadoraNBR5422:
     # -------------------- Fatores de vento ---------------------
     @classmethod
     def calcular_gc(cls, altura_m: float, tipo_terreno: TipoTerreno) -> float:
-        """Fator combinado de vento GC para cabos."""
+        """Fator combinado de vento GC para cabos (memoizado por altura/terreno)."""
         if altura_m < 0:
             raise ValueError("Altura deve ser não negativa.")
-        h = max(altura_m, cls.ALTURA_MINIMA_CALCULO)
-        p = cls.PARAMETROS_TERRENO[tipo_terreno]
-        gc = p.gc_a * math.log(h) + p.gc_b
-        return float(round(gc, 4))
+        cls._monitorar_parametros()
+        return _gc_memo(cls, max(altura_m, cls.ALTURA_MINIMA_CALCULO), tipo_terreno)
 
     @classmethod
     def calcular_gl(cls, comprimento_vao_m: float) -> float:
-        """Fator de efetividade GL (polinômio segmentado)."""
+        """Fator de efetividade GL (polinômio segmentado, memoizado por vão)."""
         if comprimento_vao_m < 0:
             raise ValueError("Comprimento do vão deve ser não negativo.")
-        L = comprimento_vao_m
-        if L < 200:
-            return 1.0
-        if L < 800:
-            return 1.693e-10 * L ** 3 - 1.093e-7 * L ** 2 - 2.686e-4 * L + 1.057
-        return 0.858
+        return _gl_memo(cls, comprimento_vao_m)
 
     @classmethod
     def calcular_gt(cls, altura_m: float, tipo_terreno: TipoTerreno) -> float:
-        """Fator combinado de vento GT para suportes/isoladores."""
+        """Fator combinado de vento GT para suportes/isoladores (memoizado por altura/terreno)."""
         if altura_m < 0:
             raise ValueError("Altura deve ser não negativa.")
-        h = max(altura_m, cls.ALTURA_MINIMA_CALCULO)
-        p = cls.PARAMETROS_TERRENO[tipo_terreno]
-        gt = p.gt_a * (h ** 2) + p.gt_b * h + p.gt_c
-        return float(round(gt, 4))
+        cls._monitorar_parametros()
+        return _gt_memo(cls, max(altura_m, cls.ALTURA_MINIMA_CALCULO), tipo_terreno)
+
+    # ---------------- Cache dos fatores de vento ----------------
+    @classmethod
+    def _monitorar_parametros(cls) -> None:
+        if not isinstance(cls.PARAMETROS_TERRENO, _ParametrosTerrenoDict):
+            # PARAMETROS_TERRENO foi reatribuído: descarta o memo e passa a monitorar o novo dict
+            cls.PARAMETROS_TERRENO = _ParametrosTerrenoDict(cls.PARAMETROS_TERRENO)
+            cls.limpar_cache()
+
+    @staticmethod
+    def limpar_cache() -> None:
+        """Esvazia os memos de GC, GT e GL (e zera os contadores)."""
+        _gc_memo.cache_clear()
+        _gt_memo.cache_clear()
+        _gl_memo.cache_clear()
+
+    @staticmethod
+    def info_cache() -> Dict[str, Any]:
+        """Acertos, falhas e ocupação de cada memo (functools._CacheInfo)."""
+        return {"GC": _gc_memo.cache_info(), "GT": _gt_memo.cache_info(), "GL": _gl_memo.cache_info()}
 
     # ----------------------- Ações de vento --------------------
     @staticmethod
@@ -198,7 +336,149 @@ class CalculadoraNBR5422:
         F = gc * gl * pressao_dinamica_pa * coef_arrasto * diametro_m * comprimento_vao_m * (seno ** 2)
         return float(round(F, 2))
 
+    # ------------- Versões vetorizadas (NumPy, array in/out) -------------
+    # Mesmas fórmulas, validações e arredondamentos das versões escalares.
+    # erros="nan" marca cada elemento inválido com NaN; erros="raise" levanta
+    # ValueError com a mensagem do escalar e os índices dos elementos inválidos.
+    @staticmethod
+    def _tratar_invalidos(valores: np.ndarray, invalidos: np.ndarray, mensagem: str, erros: str) -> np.ndarray:
+        if erros not in ("nan", "raise"):
+            raise ValueError("erros deve ser 'nan' ou 'raise'.")
+        if not invalidos.any():
+            return valores
+        if erros == "raise":
+            indices = [tuple(int(i) for i in ix) for ix in np.argwhere(invalidos)[:5]]
+            raise ValueError(f"{mensagem} ({int(invalidos.sum())} elemento(s) inválido(s); primeiros índices: {indices})")
+        return np.where(invalidos, np.nan, valores)
+
+    @staticmethod
+    def codificar_terreno(tipos_terreno: Union[TipoTerreno, str, ArrayLike]) -> np.ndarray:
+        """
+        Converte tipos de terreno (TipoTerreno, 'A'..'D' ou códigos inteiros)
+        em códigos int8 na ordem de TipoTerreno (A=0, B=1, C=2, D=3); -1 se inválido.
+        """
+        if isinstance(tipos_terreno, TipoTerreno):
+            return np.array(list(TipoTerreno).index(tipos_terreno), dtype=np.int8)
+        arr = np.asarray(tipos_terreno)
+        if arr.dtype.kind in "iu":
+            return np.where((arr >= 0) & (arr < len(TipoTerreno)), arr, -1).astype(np.int8)
+        codigos = np.full(arr.shape, -1, dtype=np.int8)
+        if arr.dtype.kind == "U":
+            arr = np.char.upper(arr)
+        for codigo, tipo in enumerate(TipoTerreno):
+            codigos[(arr == tipo) | (arr == tipo.value)] = codigo
+        return codigos
+
+    @classmethod
+    def _tabela_parametros_terreno(cls) -> np.ndarray:
+        """Matriz (n_terrenos, 5) com gc_a, gc_b, gt_a, gt_b, gt_c na ordem de TipoTerreno (NaN se ausente)."""
+        tabela = np.full((len(TipoTerreno), 5), np.nan)
+        for codigo, tipo in enumerate(TipoTerreno):
+            p = cls.PARAMETROS_TERRENO.get(tipo)
+            if p is not None:
+                tabela[codigo] = (p.gc_a, p.gc_b, p.gt_a, p.gt_b, p.gt_c)
+        return tabela
+
+    @classmethod
+    def _parametros_por_elemento(
+        cls, altura_m: ArrayLike, tipo_terreno: Union[TipoTerreno, str, ArrayLike]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        alturas = np.asarray(altura_m, dtype=float)
+        codigos = cls.codificar_terreno(tipo_terreno)
+        alturas, codigos = np.broadcast_arrays(alturas, codigos)
+        tabela = cls._tabela_parametros_terreno()
+        params = tabela[np.where(codigos >= 0, codigos, 0)]
+        terreno_invalido = (codigos < 0) | np.isnan(params[..., 0])
+        h = np.maximum(alturas, cls.ALTURA_MINIMA_CALCULO)
+        return alturas, h, params, terreno_invalido
+
+    @classmethod
+    def calcular_gc_array(
+        cls, altura_m: ArrayLike, tipo_terreno: Union[TipoTerreno, str, ArrayLike], *, erros: str = "nan"
+    ) -> np.ndarray:
+        """Versão vetorizada de calcular_gc (broadcast entre alturas e terrenos)."""
+        alturas, h, p, terreno_invalido = cls._parametros_por_elemento(altura_m, tipo_terreno)
+        gc = np.round(p[..., 0] * np.log(h) + p[..., 1], 4)
+        gc = cls._tratar_invalidos(gc, alturas < 0, "Altura deve ser não negativa.", erros)
+        return cls._tratar_invalidos(gc, terreno_invalido, "tipo_terreno inválido.", erros)
+
+    @classmethod
+    def calcular_gl_array(cls, comprimento_vao_m: ArrayLike, *, erros: str = "nan") -> np.ndarray:
+        """Versão vetorizada de calcular_gl."""
+        L = np.asarray(comprimento_vao_m, dtype=float)
+        gl = np.select(
+            [L < 200, L < 800],
+            [1.0, 1.693e-10 * L ** 3 - 1.093e-7 * L ** 2 - 2.686e-4 * L + 1.057],
+            default=0.858,
+        )
+        return cls._tratar_invalidos(gl, L < 0, "Comprimento do vão deve ser não negativo.", erros)
+
+    @classmethod
+    def calcular_gt_array(
+        cls, altura_m: ArrayLike, tipo_terreno: Union[TipoTerreno, str, ArrayLike], *, erros: str = "nan"
+    ) -> np.ndarray:
+        """Versão vetorizada de calcular_gt (broadcast entre alturas e terrenos)."""
+        alturas, h, p, terreno_invalido = cls._parametros_por_elemento(altura_m, tipo_terreno)
+        gt = np.round(p[..., 2] * (h ** 2) + p[..., 3] * h + p[..., 4], 4)
+        gt = cls._tratar_invalidos(gt, alturas < 0, "Altura deve ser não negativa.", erros)
+        return cls._tratar_invalidos(gt, terreno_invalido, "tipo_terreno inválido.", erros)
+
+    @classmethod
+    def coef_arrasto_cabo_array(cls, diametro_m: ArrayLike, *, erros: str = "nan") -> np.ndarray:
+        """Versão vetorizada de coef_arrasto_cabo."""
+        d = np.asarray(diametro_m, dtype=float)
+        cx = np.where(d < 0.015, 1.2, 1.0)
+        return cls._tratar_invalidos(cx, d <= 0, "Diâmetro deve ser positivo.", erros)
+
+    @classmethod
+    def forca_vento_em_isolador_array(
+        cls, gt: ArrayLike, area_isolador_m2: ArrayLike, pressao_dinamica_pa: ArrayLike, *, erros: str = "nan"
+    ) -> np.ndarray:
+        """Versão vetorizada de forca_vento_em_isolador."""
+        gt, area, q = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (gt, area_isolador_m2, pressao_dinamica_pa)))
+        F = np.round(gt * area * q * cls.COEF_ARRASTO_ISOLADOR, 2)
+        return cls._tratar_invalidos(F, area <= 0, "Área do isolador deve ser positiva.", erros)
+
+    @classmethod
+    def forca_vento_em_cabo_array(
+        cls,
+        *,
+        gl: ArrayLike,
+        gc: ArrayLike,
+        pressao_dinamica_pa: ArrayLike,
+        angulo_incidencia_graus: ArrayLike,
+        diametro_m: ArrayLike,
+        comprimento_vao_m: ArrayLike,
+        coef_arrasto: Optional[ArrayLike] = None,
+        erros: str = "nan",
+    ) -> np.ndarray:
+        """Versão vetorizada de forca_vento_em_cabo (todos os argumentos com broadcast)."""
+        gl, gc, q, ang, d, L = np.broadcast_arrays(*(
+            np.asarray(v, dtype=float)
+            for v in (gl, gc, pressao_dinamica_pa, angulo_incidencia_graus, diametro_m, comprimento_vao_m)
+        ))
+        cx = np.where(d < 0.015, 1.2, 1.0) if coef_arrasto is None else np.asarray(coef_arrasto, dtype=float)
+
+        seno = np.sin(np.radians(ang))
+        F = np.round(gc * gl * q * cx * d * L * (seno ** 2), 2)
+        F = cls._tratar_invalidos(
+            F, ~((ang >= 0.0) & (ang <= 90.0)), "Ângulo de incidência deve estar entre 0 e 90 graus.", erros
+        )
+        return cls._tratar_invalidos(
+            F, (d <= 0) | (L <= 0), "Diâmetro e comprimento de vão devem ser positivos.", erros
+        )
+
     # -------------------- Mudança de estado (esqueleto) --------------------
+    @staticmethod
+    def _normalizar_metodo(metodo: Union[MetodoMudancaEstado, str]) -> MetodoMudancaEstado:
+        if isinstance(metodo, MetodoMudancaEstado):
+            return metodo
+        try:
+            return MetodoMudancaEstado(str(metodo).lower())
+        except ValueError as e:
+            opcoes = ", ".join(f"'{m.value}'" for m in MetodoMudancaEstado)
+            raise ValueError(f"metodo deve ser {opcoes}.") from e
+
     @classmethod
     def mudar_estado_cabo(
         cls,
@@ -211,41 +491,523 @@ class CalculadoraNBR5422:
         temp_final_c: float,
         alfa_thermal_1porc: float,
         comprimento_vao_m: float,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.DIFERENCAS_FINITAS,
     ) -> float:
         """
         Estimativa iterativa da nova tração (N) – Newton-Raphson simplificado.
         Ajuste a equação conforme seu procedimento/catenária.
+
+        Resíduo: f(T) = (1/α)·(n(T)/d − 1) − (T − T0)/(E·S) − Δt, com
+        n(T) = (T/w)·sinh(u), u = w·L/(2T). As derivadas fechadas são
+        f'(T) = (sinh u − u·cosh u)/(α·d·w) − 1/(E·S) e
+        f''(T) = u²·sinh u/(α·d·w·T); ``metodo`` escolhe entre a diferença
+        progressiva original, Newton analítico ou Halley.
         """
         if any(v <= 0 for v in (modulo_elasticidade_pa, area_secao_m2, peso_unit_final_npm, comprimento_vao_m)):
             raise ValueError("Parâmetros físicos devem ser positivos.")
         if tracao_inicial_n <= 0:
             raise ValueError("Tração inicial deve ser positiva.")
+        metodo = cls._normalizar_metodo(metodo)
 
-        T = tracao_inicial_n
-        deltaT = temp_final_c - temp_inicial_c
-
-        for _ in range(cls.MAX_ITERACOES):
-            num = (T / peso_unit_final_npm) * math.sinh(peso_unit_final_npm * comprimento_vao_m / (2.0 * T))
-            den = (tracao_inicial_n / peso_unit_inicial_npm) * math.sinh(
-                peso_unit_inicial_npm * comprimento_vao_m / (2.0 * tracao_inicial_n)
-            )
-            f = (1.0 / alfa_thermal_1porc) * (num / den - 1.0) - (T - tracao_inicial_n) / (modulo_elasticidade_pa * area_secao_m2) - deltaT
+        # Denominador depende só do estado inicial: calculado uma vez
+        den = (tracao_inicial_n / peso_unit_inicial_npm) * math.sinh(
+            peso_unit_inicial_npm * comprimento_vao_m / (2.0 * tracao_inicial_n)
+        )
+        T, _, status = cls._newton_mudanca_estado(
+            tracao_inicial_n,
+            E_S=modulo_elasticidade_pa * area_secao_m2,
+            w=peso_unit_final_npm,
+            L=comprimento_vao_m,
+            alfa=alfa_thermal_1porc,
+            T0=tracao_inicial_n,
+            den=den,
+            deltaT=temp_final_c - temp_inicial_c,
+            metodo=metodo,
+        )
+        if status is not StatusMudancaEstado.CONVERGIU:
+            raise RuntimeError("Mudança de estado: sem convergência nas iterações máximas.")
+        return float(round(T, 1))
 
-            T_delta = T + cls.DELTA_DERIVADA
-            num_d = (T_delta / peso_unit_final_npm) * math.sinh(peso_unit_final_npm * comprimento_vao_m / (2.0 * T_delta))
-            f_d = (1.0 / alfa_thermal_1porc) * (num_d / den - 1.0) - (T_delta - tracao_inicial_n) / (modulo_elasticidade_pa * area_secao_m2) - deltaT
-            deriv = (f_d - f) / cls.DELTA_DERIVADA
+    @classmethod
+    def _newton_mudanca_estado(
+        cls,
+        T: float,
+        *,
+        E_S: float,
+        w: float,
+        L: float,
+        alfa: float,
+        T0: float,
+        den: float,
+        deltaT: float,
+        metodo: MetodoMudancaEstado,
+    ) -> Tuple[float, int, StatusMudancaEstado]:
+        """
+        Laço de Newton partindo do chute T, com ``den`` (estado inicial) já calculado.
+        Retorna (tração sem arredondar, iterações, status); NaN se não convergiu.
+        """
+        for k in range(1, cls.MAX_ITERACOES + 1):
+            u = w * L / (2.0 * T)
+            sinh_u = math.sinh(u)
+            num = (T / w) * sinh_u
+            f = (1.0 / alfa) * (num / den - 1.0) - (T - T0) / E_S - deltaT
+
+            if metodo is MetodoMudancaEstado.DIFERENCAS_FINITAS:
+                T_delta = T + cls.DELTA_DERIVADA
+                num_d = (T_delta / w) * math.sinh(w * L / (2.0 * T_delta))
+                f_d = (1.0 / alfa) * (num_d / den - 1.0) - (T_delta - T0) / E_S - deltaT
+                deriv = (f_d - f) / cls.DELTA_DERIVADA
+            else:
+                k_d = 1.0 / (alfa * den * w)
+                deriv = k_d * (sinh_u - u * math.cosh(u)) - 1.0 / E_S
 
             if abs(deriv) < 1e-12:
-                break
-            T_new = T - f / deriv
+                return math.nan, k, StatusMudancaEstado.DERIVADA_NULA
+            passo = f / deriv
+            if metodo is MetodoMudancaEstado.HALLEY:
+                deriv2 = k_d * u * u * sinh_u / T
+                denom_halley = 1.0 - 0.5 * passo * deriv2 / deriv
+                # Salvaguarda: só aceita a correção se o passo mantiver o sentido do Newton
+                if denom_halley > 0.5:
+                    passo /= denom_halley
+            T_new = T - passo
             if T_new <= 0:
                 T_new = 0.5 * T
             if abs(f) < cls.PRECISAO_MUDANCA_ESTADO:
-                return float(round(T_new, 1))
+                return T_new, k, StatusMudancaEstado.CONVERGIU
             T = T_new
 
-        raise RuntimeError("Mudança de estado: sem convergência nas iterações máximas.")
+        return math.nan, cls.MAX_ITERACOES, StatusMudancaEstado.SEM_CONVERGENCIA
+
+    @classmethod
+    def curva_mudanca_estado(
+        cls,
+        cabo: "Cabo",
+        comprimento_vao_m: float,
+        *,
+        tracao_inicial_n: float,
+        temp_inicial_c: float,
+        temperaturas_c: Optional[ArrayLike] = None,
+        pesos_npm: Optional[ArrayLike] = None,
+        peso_inicial_npm: Optional[float] = None,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.DIFERENCAS_FINITAS,
+    ) -> ResultadoMudancaEstadoLote:
+        """
+        Varredura de mudanças de estado ao longo de um eixo de temperatura e/ou peso.
+
+        Parte do mesmo estado inicial (tracao_inicial_n @ temp_inicial_c, peso
+        inicial = peso próprio do cabo se omitido) e resolve, em ordem, cada par
+        (temperatura, peso) final. Cada solução semeia o Newton da seguinte
+        (warm start) e o denominador do estado inicial é calculado uma só vez.
+        ``temperaturas_c``/``pesos_npm`` omitidos valem a temperatura inicial/peso
+        próprio; um escalar é repetido ao longo do outro eixo. Como o Newton parte
+        de outro chute, a tração pode diferir do cálculo isolado dentro da
+        precisão do solver.
+        """
+        E_S = cabo.modulo_elasticidade_pa * cabo.area_secao_m2
+        alfa = cabo.coef_dilatacao_termica_1porc
+        if peso_inicial_npm is None:
+            peso_inicial_npm = cabo.peso_unit_npm
+        if temperaturas_c is None:
+            temperaturas_c = temp_inicial_c
+        if pesos_npm is None:
+            pesos_npm = cabo.peso_unit_npm
+        temps, pesos = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(temperaturas_c, dtype=float)),
+            np.atleast_1d(np.asarray(pesos_npm, dtype=float)),
+        )
+        temps, pesos = temps.ravel(), pesos.ravel()
+
+        if E_S <= 0 or comprimento_vao_m <= 0 or peso_inicial_npm <= 0 or (pesos <= 0).any():
+            raise ValueError("Parâmetros físicos devem ser positivos.")
+        if tracao_inicial_n <= 0:
+            raise ValueError("Tração inicial deve ser positiva.")
+        metodo = cls._normalizar_metodo(metodo)
+
+        den = (tracao_inicial_n / peso_inicial_npm) * math.sinh(
+            peso_inicial_npm * comprimento_vao_m / (2.0 * tracao_inicial_n)
+        )
+
+        n = temps.size
+        tracao = np.full(n, np.nan)
+        iteracoes = np.zeros(n, dtype=np.int64)
+        status = np.empty(n, dtype=np.int8)
+        chute = tracao_inicial_n
+        for i in range(n):
+            T, iteracoes[i], status[i] = cls._newton_mudanca_estado(
+                chute,
+                E_S=E_S,
+                w=float(pesos[i]),
+                L=comprimento_vao_m,
+                alfa=alfa,
+                T0=tracao_inicial_n,
+                den=den,
+                deltaT=float(temps[i]) - temp_inicial_c,
+                metodo=metodo,
+            )
+            if status[i] == StatusMudancaEstado.CONVERGIU:
+                tracao[i] = round(T, 1)
+                chute = T
+            else:
+                chute = tracao_inicial_n  # recomeça do estado inicial após uma falha
+
+        return ResultadoMudancaEstadoLote(tracao_n=tracao, iteracoes=iteracoes, status=status)
+
+    @classmethod
+    def mudar_estado_cabo_lote(
+        cls,
+        modulo_elasticidade_pa: ArrayLike,
+        area_secao_m2: ArrayLike,
+        peso_unit_inicial_npm: ArrayLike,
+        peso_unit_final_npm: ArrayLike,
+        tracao_inicial_n: ArrayLike,
+        temp_inicial_c: ArrayLike,
+        temp_final_c: ArrayLike,
+        alfa_thermal_1porc: ArrayLike,
+        comprimento_vao_m: ArrayLike,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.DIFERENCAS_FINITAS,
+    ) -> ResultadoMudancaEstadoLote:
+        """
+        Versão vetorizada de mudar_estado_cabo: resolve N problemas de uma vez.
+
+        Aceita escalares ou arrays NumPy (com broadcast). Todos os elementos
+        iteram juntos; cada um sai do laço ao convergir (máscara por elemento).
+        Falhas não levantam exceção: ficam registradas em ``status`` e a tração
+        correspondente vale NaN. ``metodo`` tem o mesmo significado do escalar.
+        """
+        return cls._resolver_lote(
+            modulo_elasticidade_pa, area_secao_m2, peso_unit_inicial_npm, peso_unit_final_npm,
+            tracao_inicial_n, temp_inicial_c, temp_final_c, alfa_thermal_1porc, comprimento_vao_m,
+            metodo=metodo,
+            arredondar=True,
+        )
+
+    @classmethod
+    def _resolver_lote(
+        cls,
+        modulo_elasticidade_pa: ArrayLike,
+        area_secao_m2: ArrayLike,
+        peso_unit_inicial_npm: ArrayLike,
+        peso_unit_final_npm: ArrayLike,
+        tracao_inicial_n: ArrayLike,
+        temp_inicial_c: ArrayLike,
+        temp_final_c: ArrayLike,
+        alfa_thermal_1porc: ArrayLike,
+        comprimento_vao_m: ArrayLike,
+        *,
+        metodo: Union[MetodoMudancaEstado, str],
+        arredondar: bool,
+    ) -> ResultadoMudancaEstadoLote:
+        """Núcleo de mudar_estado_cabo_lote; ``arredondar=False`` devolve a tração sem arredondar."""
+        metodo = cls._normalizar_metodo(metodo)
+        args = np.broadcast_arrays(*(
+            np.asarray(v, dtype=float) for v in (
+                modulo_elasticidade_pa, area_secao_m2, peso_unit_inicial_npm, peso_unit_final_npm,
+                tracao_inicial_n, temp_inicial_c, temp_final_c, alfa_thermal_1porc, comprimento_vao_m,
+            )
+        ))
+        formato = args[0].shape
+        E, A, w_ini, w_fin, T_ini, t_ini, t_fin, alfa, vao = (a.ravel() for a in args)
+
+        n = E.size
+        tracao = np.full(n, np.nan)
+        iteracoes = np.zeros(n, dtype=np.int64)
+        status = np.full(n, StatusMudancaEstado.SEM_CONVERGENCIA, dtype=np.int8)
+
+        validos = (E > 0) & (A > 0) & (w_ini > 0) & (w_fin > 0) & (T_ini > 0) & (vao > 0) & (alfa != 0)
+        status[~validos] = StatusMudancaEstado.ARGUMENTO_INVALIDO
+
+        # Arrays "compactados": só os problemas ainda ativos
+        idx = np.flatnonzero(validos)
+        w = w_fin[idx]
+        L = vao[idx]
+        a = alfa[idx]
+        EA = E[idx] * A[idx]
+        T0 = T_ini[idx]
+        deltaT = t_fin[idx] - t_ini[idx]
+
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            den = (T0 / w_ini[idx]) * np.sinh(w_ini[idx] * L / (2.0 * T0))
+            T = T0.copy()
+
+            for k in range(1, cls.MAX_ITERACOES + 1):
+                if idx.size == 0:
+                    break
+                iteracoes[idx] = k
+
+                u = w * L / (2.0 * T)
+                sinh_u = np.sinh(u)
+                num = (T / w) * sinh_u
+                f = (1.0 / a) * (num / den - 1.0) - (T - T0) / EA - deltaT
+
+                if metodo is MetodoMudancaEstado.DIFERENCAS_FINITAS:
+                    T_delta = T + cls.DELTA_DERIVADA
+                    num_d = (T_delta / w) * np.sinh(w * L / (2.0 * T_delta))
+                    f_d = (1.0 / a) * (num_d / den - 1.0) - (T_delta - T0) / EA - deltaT
+                    deriv = (f_d - f) / cls.DELTA_DERIVADA
+                else:
+                    k_d = 1.0 / (a * den * w)
+                    deriv = k_d * (sinh_u - u * np.cosh(u)) - 1.0 / EA
+
+                nula = np.abs(deriv) < 1e-12
+                passo = f / deriv
+                if metodo is MetodoMudancaEstado.HALLEY:
+                    deriv2 = k_d * u * u * sinh_u / T
+                    denom_halley = 1.0 - 0.5 * passo * deriv2 / deriv
+                    passo = np.where(denom_halley > 0.5, passo / denom_halley, passo)
+                T_new = T - passo
+                T_new = np.where(T_new <= 0, 0.5 * T, T_new)
+                ok = ~nula & (np.abs(f) < cls.PRECISAO_MUDANCA_ESTADO)
+
+                status[idx[nula]] = StatusMudancaEstado.DERIVADA_NULA
+                tracao[idx[ok]] = np.round(T_new[ok], 1) if arredondar else T_new[ok]
+                status[idx[ok]] = StatusMudancaEstado.CONVERGIU
+
+                # Overflow/NaN não converge mais: sai do laço como SEM_CONVERGENCIA
+                ativos = ~(nula | ok) & np.isfinite(f)
+                if not ativos.all():
+                    idx, w, L, a, EA, T0, deltaT, den = (
+                        v[ativos] for v in (idx, w, L, a, EA, T0, deltaT, den)
+                    )
+                    T_new = T_new[ativos]
+                T = T_new
+
+        return ResultadoMudancaEstadoLote(
+            tracao_n=tracao.reshape(formato),
+            iteracoes=iteracoes.reshape(formato),
+            status=status.reshape(formato),
+        )
+
+
+# =============================================================
+# Superfícies de tração (cache opcional de mudança de estado)
+# =============================================================
+
+def _pesos_catmull_rom(t: np.ndarray) -> np.ndarray:
+    """Pesos da convolução cúbica (Keys, a = -0.5) para os nós -1, 0, 1, 2; t em [0, 1]."""
+    t2 = t * t
+    t3 = t2 * t
+    return np.stack(
+        [
+            0.5 * (-t3 + 2.0 * t2 - t),
+            0.5 * (3.0 * t3 - 5.0 * t2 + 2.0),
+            0.5 * (-3.0 * t3 + 4.0 * t2 + t),
+            0.5 * (t3 - t2),
+        ],
+        axis=-1,
+    )
+
+
+@dataclass(slots=True)
+class SuperficieTracao:
+    """
+    Tração final T(temperatura, peso unitário) de um cabo/vão a partir de um
+    estado inicial (EDS), resolvida uma vez numa grade regular e consultada por
+    interpolação bicúbica.
+
+    O erro de interpolação é estimado por célula comparando, no centro de cada
+    célula, o valor interpolado com a solução exata. Consultas fora da grade ou
+    em células cuja estimativa excede ``tolerancia_n`` caem no solver exato.
+    """
+    cabo: "Cabo"
+    comprimento_vao_m: float
+    tracao_inicial_n: float
+    temp_inicial_c: float
+    temperaturas_c: np.ndarray      # eixo 0 da grade (uniforme)
+    pesos_npm: np.ndarray           # eixo 1 da grade (uniforme)
+    tracao_n: np.ndarray            # (n_temperaturas, n_pesos), sem arredondar
+    erro_celula_n: np.ndarray       # (n_temperaturas-1, n_pesos-1), estimativa |interp - exata|
+    tolerancia_n: float
+    metodo: MetodoMudancaEstado = MetodoMudancaEstado.ANALITICO
+    consultas_interpoladas: int = 0
+    consultas_exatas: int = 0
+    _grade_estendida: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Nós fantasmas nas bordas (condição de contorno de Keys) para a convolução cúbica
+        T = self.tracao_n
+        T = np.concatenate([(3.0 * T[0] - 3.0 * T[1] + T[2])[None], T, (3.0 * T[-1] - 3.0 * T[-2] + T[-3])[None]], axis=0)
+        T = np.concatenate(
+            [(3.0 * T[:, 0] - 3.0 * T[:, 1] + T[:, 2])[:, None], T, (3.0 * T[:, -1] - 3.0 * T[:, -2] + T[:, -3])[:, None]],
+            axis=1,
+        )
+        self._grade_estendida = T
+
+    @classmethod
+    def construir(
+        cls,
+        cabo: "Cabo",
+        comprimento_vao_m: float,
+        *,
+        tracao_inicial_n: float,
+        temp_inicial_c: float,
+        temperaturas_c: ArrayLike,
+        pesos_npm: ArrayLike,
+        tolerancia_n: float = 1.0,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.ANALITICO,
+    ) -> "SuperficieTracao":
+        """Resolve a grade (e os centros das células, para a estimativa de erro) em lote."""
+        temps = np.asarray(temperaturas_c, dtype=float)
+        pesos = np.asarray(pesos_npm, dtype=float)
+        if temps.ndim != 1 or pesos.ndim != 1 or temps.size < 4 or pesos.size < 4:
+            raise ValueError("A grade precisa de ao menos 4 temperaturas e 4 pesos.")
+        for eixo in (temps, pesos):
+            passos = np.diff(eixo)
+            if (passos <= 0).any() or not np.allclose(passos, passos[0]):
+                raise ValueError("Os eixos da grade devem ser crescentes e uniformemente espaçados.")
+        if tolerancia_n <= 0:
+            raise ValueError("tolerancia_n deve ser positiva.")
+        metodo = CalculadoraNBR5422._normalizar_metodo(metodo)
+
+        def resolver(t: np.ndarray, w: np.ndarray) -> np.ndarray:
+            res = CalculadoraNBR5422._resolver_lote(
+                cabo.modulo_elasticidade_pa, cabo.area_secao_m2, cabo.peso_unit_npm, w,
+                tracao_inicial_n, temp_inicial_c, t, cabo.coef_dilatacao_termica_1porc, comprimento_vao_m,
+                metodo=metodo,
+                arredondar=False,
+            )
+            if not res.convergiu.all():
+                raise RuntimeError("Mudança de estado: sem convergência em pontos da grade da superfície.")
+            return res.tracao_n
+
+        grade_t, grade_w = np.meshgrid(temps, pesos, indexing="ij")
+        sup = cls(
+            cabo=cabo,
+            comprimento_vao_m=float(comprimento_vao_m),
+            tracao_inicial_n=float(tracao_inicial_n),
+            temp_inicial_c=float(temp_inicial_c),
+            temperaturas_c=temps,
+            pesos_npm=pesos,
+            tracao_n=resolver(grade_t, grade_w),
+            erro_celula_n=np.zeros((temps.size - 1, pesos.size - 1)),
+            tolerancia_n=float(tolerancia_n),
+            metodo=metodo,
+        )
+
+        centro_t, centro_w = np.meshgrid(0.5 * (temps[:-1] + temps[1:]), 0.5 * (pesos[:-1] + pesos[1:]), indexing="ij")
+        sup.erro_celula_n = np.abs(sup._interpolar(centro_t.ravel(), centro_w.ravel())[0] - resolver(centro_t, centro_w).ravel()).reshape(centro_t.shape)
+        return sup
+
+    @property
+    def erro_maximo_n(self) -> float:
+        """Maior erro estimado entre todas as células."""
+        return float(self.erro_celula_n.max())
+
+    def _interpolar(self, t: np.ndarray, w: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Interpolação bicúbica; retorna (valores, dentro_da_grade, índice linear da célula)."""
+        t0, dt, nt = self.temperaturas_c[0], self.temperaturas_c[1] - self.temperaturas_c[0], self.temperaturas_c.size
+        w0, dw, nw = self.pesos_npm[0], self.pesos_npm[1] - self.pesos_npm[0], self.pesos_npm.size
+        st = (t - t0) / dt
+        sw = (w - w0) / dw
+        dentro = (st >= 0) & (st <= nt - 1) & (sw >= 0) & (sw <= nw - 1)
+
+        i = np.clip(np.floor(st), 0, nt - 2).astype(np.intp)
+        j = np.clip(np.floor(sw), 0, nw - 2).astype(np.intp)
+        pt = _pesos_catmull_rom(np.clip(st - i, 0.0, 1.0))
+        pw = _pesos_catmull_rom(np.clip(sw - j, 0.0, 1.0))
+
+        desloc = np.arange(4)
+        # Na grade estendida o nó i-1 da grade original fica no índice i
+        bloco = self._grade_estendida[(i[:, None] + desloc)[:, :, None], (j[:, None] + desloc)[:, None, :]]
+        valores = np.einsum("na,nab,nb->n", pt, bloco, pw)
+        return valores, dentro, i * (nw - 1) + j
+
+    def tracao(self, temperaturas_c: ArrayLike, pesos_npm: ArrayLike) -> np.ndarray:
+        """
+        Tração final (N, arredondada a 0.1 N como o solver) para cada par
+        (temperatura, peso). Usa a interpolação onde o erro estimado da célula
+        está dentro da tolerância; nos demais pontos resolve de forma exata.
+        """
+        t, w = np.broadcast_arrays(np.asarray(temperaturas_c, dtype=float), np.asarray(pesos_npm, dtype=float))
+        formato = t.shape
+        t, w = t.ravel(), w.ravel()
+
+        valores, dentro, celula = self._interpolar(t, w)
+        aceitos = dentro & (self.erro_celula_n.ravel()[celula] <= self.tolerancia_n)
+        resultado = np.round(valores, 1)
+
+        exatos = ~aceitos
+        if exatos.any():
+            res = CalculadoraNBR5422.mudar_estado_cabo_lote(
+                self.cabo.modulo_elasticidade_pa, self.cabo.area_secao_m2, self.cabo.peso_unit_npm, w[exatos],
+                self.tracao_inicial_n, self.temp_inicial_c, t[exatos], self.cabo.coef_dilatacao_termica_1porc,
+                self.comprimento_vao_m,
+                metodo=self.metodo,
+            )
+            resultado[exatos] = res.tracao_n
+
+        self.consultas_interpoladas += int(aceitos.sum())
+        self.consultas_exatas += int(exatos.sum())
+        return resultado.reshape(formato)
+
+
+class CacheSuperficiesTracao:
+    """
+    Cache opcional de SuperficieTracao por (cabo, vão, tração EDS, temperatura EDS).
+
+    A superfície é construída na primeira consulta de cada chave sobre a grade
+    configurada aqui: temperaturas em ``faixa_temperaturas_c`` e pesos como
+    múltiplos do peso próprio do cabo em ``faixa_peso_relativo``.
+    """
+
+    def __init__(
+        self,
+        *,
+        faixa_temperaturas_c: Tuple[float, float] = (-10.0, 90.0),
+        n_temperaturas: int = 41,
+        faixa_peso_relativo: Tuple[float, float] = (1.0, 4.0),
+        n_pesos: int = 31,
+        tolerancia_n: float = 1.0,
+        max_superficies: Optional[int] = 128,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.ANALITICO,
+    ) -> None:
+        self.temperaturas_c = np.linspace(*faixa_temperaturas_c, n_temperaturas)
+        self.peso_relativo = np.linspace(*faixa_peso_relativo, n_pesos)
+        self.tolerancia_n = tolerancia_n
+        self.max_superficies = max_superficies
+        self.metodo = CalculadoraNBR5422._normalizar_metodo(metodo)
+        self._superficies: Dict[Tuple[Any, float, float, float], SuperficieTracao] = {}
+
+    def __len__(self) -> int:
+        return len(self._superficies)
+
+    def obter(
+        self, cabo: "Cabo", comprimento_vao_m: float, tracao_inicial_n: float, temp_inicial_c: float
+    ) -> SuperficieTracao:
+        """Retorna a superfície da chave, construindo-a se necessário."""
+        chave = (cabo, float(comprimento_vao_m), float(tracao_inicial_n), float(temp_inicial_c))
+        sup = self._superficies.get(chave)
+        if sup is None:
+            if self.max_superficies is not None and len(self._superficies) >= self.max_superficies:
+                # descarta a superfície mais antiga (ordem de inserção do dict)
+                self._superficies.pop(next(iter(self._superficies)))
+            sup = SuperficieTracao.construir(
+                cabo,
+                comprimento_vao_m,
+                tracao_inicial_n=tracao_inicial_n,
+                temp_inicial_c=temp_inicial_c,
+                temperaturas_c=self.temperaturas_c,
+                pesos_npm=self.peso_relativo * cabo.peso_unit_npm,
+                tolerancia_n=self.tolerancia_n,
+                metodo=self.metodo,
+            )
+            self._superficies[chave] = sup
+        return sup
+
+    def tracao(
+        self,
+        cabo: "Cabo",
+        comprimento_vao_m: float,
+        tracao_inicial_n: float,
+        temp_inicial_c: float,
+        temperaturas_c: ArrayLike,
+        pesos_npm: ArrayLike,
+    ) -> np.ndarray:
+        """Atalho para obter(...).tracao(temperaturas_c, pesos_npm)."""
+        return self.obter(cabo, comprimento_vao_m, tracao_inicial_n, temp_inicial_c).tracao(temperaturas_c, pesos_npm)
+
+    def limpar(self) -> None:
+        self._superficies.clear()
 
 
 # =============================================================
@@ -274,13 +1036,61 @@ class CasoDeCarga:
     massa_especifica_ar_kgm3: Optional[float] = None
     tags: Tuple[str, ...] = field(default_factory=tuple)
 
-    def __post_init__(self) -> None:
-        # Normaliza tipo de terreno
-        if isinstance(self.tipo_terreno, str) and self.tipo_terreno:
+    # Derivados em cache: calculados no __post_init__ e descartados (None) quando
+    # um campo de origem é reatribuído; a propriedade recalcula sob demanda.
+    _pressao_dinamica: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _densidade_relativa: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    # True quando pressao_atm_pa/massa_especifica_ar_kgm3 vieram de altitude/temperatura
+    # (não informados); variantes_em_lote só rederiva nesse caso
+    _pressao_derivada: bool = field(default=False, init=False, repr=False, compare=False)
+    _massa_derivada: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # campo reatribuído -> caches que dependem dele
+    _DEPENDENTES = {
+        "velocidade_vento_ms": ("_pressao_dinamica",),
+        "massa_especifica_ar_kgm3": ("_pressao_dinamica",),
+        "pressao_atm_pa": ("_densidade_relativa",),
+        "temperatura_ambiente_c": ("_densidade_relativa",),
+    }
+    # campo atmosférico -> marcador de valor derivado (zerado se o campo é reatribuído)
+    _MARCADORES_DERIVADOS = {
+        "pressao_atm_pa": "_pressao_derivada",
+        "massa_especifica_ar_kgm3": "_massa_derivada",
+    }
+
+    # campo -> (predicado de valor inválido, mensagem); usado por _validar e variantes_em_lote
+    _REGRAS_VALIDACAO = {
+        "velocidade_vento_ms": (lambda v: v < 0, "Velocidade do vento deve ser não negativa."),
+        "periodo_retorno_anos": (lambda v: v <= 0, "Período de retorno deve ser positivo."),
+        "tempo_integracao_s": (lambda v: v <= 0, "Tempo de integração deve ser positivo."),
+        "angulo_incidencia_graus": (
+            lambda v: not (0.0 <= v <= 90.0), "Ângulo de incidência deve estar entre 0 e 90 graus."
+        ),
+        "tipo_terreno": (lambda v: not isinstance(v, TipoTerreno), "tipo_terreno inválido."),
+        "altitude_m": (lambda v: v is None or v < 0, "altitude_m deve ser não negativa."),
+    }
+
+    def __setattr__(self, nome: str, valor: Any) -> None:
+        # object.__setattr__ explícito: super() sem argumentos não funciona com slots=True
+        object.__setattr__(self, nome, valor)
+        for cache in CasoDeCarga._DEPENDENTES.get(nome, ()):
+            object.__setattr__(self, cache, None)
+        marcador = CasoDeCarga._MARCADORES_DERIVADOS.get(nome)
+        if marcador is not None:
+            object.__setattr__(self, marcador, False)
+
+    @staticmethod
+    def _normalizar_terreno(tipo_terreno: Optional[Union[TipoTerreno, str]]) -> Optional[Union[TipoTerreno, str]]:
+        if isinstance(tipo_terreno, str) and tipo_terreno:
             try:
-                self.tipo_terreno = TipoTerreno[self.tipo_terreno.upper()]
+                return TipoTerreno[tipo_terreno.upper()]
             except KeyError as e:
                 raise ValueError("tipo_terreno deve ser 'A', 'B', 'C' ou 'D'.") from e
+        return tipo_terreno
+
+    def __post_init__(self) -> None:
+        # Normaliza tipo de terreno
+        self.tipo_terreno = self._normalizar_terreno(self.tipo_terreno)
 
         # Defaults de ambiente
         if self.altitude_m is None:
@@ -294,37 +1104,133 @@ class CasoDeCarga:
         # Derivados
         if self.pressao_atm_pa is None:
             self.pressao_atm_pa = CalculadoraNBR5422.calcular_pressao_padrao(self.altitude_m)
+            self._pressao_derivada = True
         if self.massa_especifica_ar_kgm3 is None:
             self.massa_especifica_ar_kgm3 = CalculadoraNBR5422.calcular_massa_especifica_ar(
                 self.temperatura_ambiente_c, self.altitude_m
             )
+            self._massa_derivada = True
+        self._pressao_dinamica = CalculadoraNBR5422.calcular_pressao_dinamica(
+            self.massa_especifica_ar_kgm3, self.velocidade_vento_ms
+        )
+        self._densidade_relativa = CalculadoraNBR5422.calcular_densidade_relativa_ar(
+            self.pressao_atm_pa, self.temperatura_ambiente_c
+        )
 
     def _validar(self) -> None:
-        if self.velocidade_vento_ms < 0:
-            raise ValueError("Velocidade do vento deve ser não negativa.")
-        if self.periodo_retorno_anos <= 0:
-            raise ValueError("Período de retorno deve ser positivo.")
-        if self.tempo_integracao_s <= 0:
-            raise ValueError("Tempo de integração deve ser positivo.")
-        if not (0.0 <= self.angulo_incidencia_graus <= 90.0):
-            raise ValueError("Ângulo de incidência deve estar entre 0 e 90 graus.")
-        if not isinstance(self.tipo_terreno, TipoTerreno):
-            raise ValueError("tipo_terreno inválido.")
-        if self.altitude_m is None or self.altitude_m < 0:
-            raise ValueError("altitude_m deve ser não negativa.")
+        for nome, (invalido, mensagem) in CasoDeCarga._REGRAS_VALIDACAO.items():
+            if invalido(getattr(self, nome)):
+                raise ValueError(mensagem)
+
+    @classmethod
+    def variantes_em_lote(
+        cls, caso_base: "CasoDeCarga", variacoes: Iterable[Dict[str, Any]]
+    ) -> Iterator["CasoDeCarga"]:
+        """
+        Cria, sob demanda, um caso por dicionário de `variacoes` (campo -> valor),
+        partindo do caso_base (já validado na sua construção).
+
+        Mais rápido que chamar CasoDeCarga(...) em laço: só os campos variados
+        são normalizados/validados e o __init__ é contornado.
+
+        pressao_atm_pa/massa_especifica_ar_kgm3 são copiados do caso base, exceto
+        quando valem None na variação (derivados, como no __post_init__) ou quando
+        o caso base os derivou e altitude_m/temperatura_ambiente_c variam; nesses
+        casos são calculados uma vez por par (altitude, temperatura) distinto.
+        Valores informados explicitamente no caso base são sempre mantidos.
+        """
+        nomes = [f.name for f in fields(cls) if f.init]
+        base = {nome: getattr(caso_base, nome) for nome in nomes}
+        # descritores dos slots: atribuição direta, sem passar por __setattr__
+        slots = {nome: getattr(cls, nome).__set__ for nome in nomes}
+        set_pressao_dinamica = getattr(cls, "_pressao_dinamica").__set__
+        set_densidade_relativa = getattr(cls, "_densidade_relativa").__set__
+        set_pressao_derivada = getattr(cls, "_pressao_derivada").__set__
+        set_massa_derivada = getattr(cls, "_massa_derivada").__set__
+        pressao_derivada = caso_base._pressao_derivada
+        massa_derivada = caso_base._massa_derivada
+        regras = cls._REGRAS_VALIDACAO
+        calc = CalculadoraNBR5422
+        atmosfera: Dict[Tuple[float, float], Tuple[float, float]] = {}
+
+        for variacao in variacoes:
+            valores = dict(base)
+            for nome, valor in variacao.items():
+                if nome not in base:
+                    raise TypeError(f"CasoDeCarga não tem o campo '{nome}'.")
+                if nome == "tipo_terreno":
+                    valor = cls._normalizar_terreno(valor)
+                    if valor is None:
+                        valor = AmbientePadrao.tipo_terreno
+                elif nome == "altitude_m" and valor is None:
+                    valor = AmbientePadrao.altitude_m
+                regra = regras.get(nome)
+                if regra is not None and regra[0](valor):
+                    raise ValueError(regra[1])
+                valores[nome] = valor
+
+            # None (como no __post_init__) ou valor derivado no caso base cujas
+            # entradas variam; valores explícitos do caso base são copiados
+            deriva_pressao = valores["pressao_atm_pa"] is None or (
+                pressao_derivada and "altitude_m" in variacao and "pressao_atm_pa" not in variacao
+            )
+            deriva_massa = valores["massa_especifica_ar_kgm3"] is None or (
+                massa_derivada
+                and ("altitude_m" in variacao or "temperatura_ambiente_c" in variacao)
+                and "massa_especifica_ar_kgm3" not in variacao
+            )
+            if deriva_pressao or deriva_massa:
+                chave = (valores["altitude_m"], valores["temperatura_ambiente_c"])
+                derivados = atmosfera.get(chave)
+                if derivados is None:
+                    derivados = atmosfera[chave] = (
+                        calc.calcular_pressao_padrao(chave[0]),
+                        calc.calcular_massa_especifica_ar(chave[1], chave[0]),
+                    )
+                if deriva_pressao:
+                    valores["pressao_atm_pa"] = derivados[0]
+                if deriva_massa:
+                    valores["massa_especifica_ar_kgm3"] = derivados[1]
+
+            caso = object.__new__(cls)
+            for nome, valor in valores.items():
+                slots[nome](caso, valor)
+            set_pressao_derivada(caso, deriva_pressao or (pressao_derivada and "pressao_atm_pa" not in variacao))
+            set_massa_derivada(caso, deriva_massa or (massa_derivada and "massa_especifica_ar_kgm3" not in variacao))
+            if valores["massa_especifica_ar_kgm3"] == base["massa_especifica_ar_kgm3"] and (
+                valores["velocidade_vento_ms"] == base["velocidade_vento_ms"]
+            ):
+                set_pressao_dinamica(caso, caso_base.pressao_dinamica_pa)
+            else:
+                set_pressao_dinamica(caso, calc.calcular_pressao_dinamica(
+                    valores["massa_especifica_ar_kgm3"], valores["velocidade_vento_ms"]
+                ))
+            if valores["pressao_atm_pa"] == base["pressao_atm_pa"] and (
+                valores["temperatura_ambiente_c"] == base["temperatura_ambiente_c"]
+            ):
+                set_densidade_relativa(caso, caso_base.densidade_relativa_ar)
+            else:
+                set_densidade_relativa(caso, calc.calcular_densidade_relativa_ar(
+                    valores["pressao_atm_pa"], valores["temperatura_ambiente_c"]
+                ))
+            yield caso
 
     # --------- propriedades derivadas ---------
     @property
     def densidade_relativa_ar(self) -> float:
-        return CalculadoraNBR5422.calcular_densidade_relativa_ar(
-            self.pressao_atm_pa, self.temperatura_ambiente_c
-        )
+        if self._densidade_relativa is None:
+            self._densidade_relativa = CalculadoraNBR5422.calcular_densidade_relativa_ar(
+                self.pressao_atm_pa, self.temperatura_ambiente_c
+            )
+        return self._densidade_relativa
 
     @property
     def pressao_dinamica_pa(self) -> float:
-        return CalculadoraNBR5422.calcular_pressao_dinamica(
-            self.massa_especifica_ar_kgm3, self.velocidade_vento_ms
-        )
+        if self._pressao_dinamica is None:
+            self._pressao_dinamica = CalculadoraNBR5422.calcular_pressao_dinamica(
+                self.massa_especifica_ar_kgm3, self.velocidade_vento_ms
+            )
+        return self._pressao_dinamica
 
     # --------- utilitários para cálculo de vento ---------
     def fatores_vento(self, *, altura_cabo_m: float, comprimento_vao_m: float) -> Tuple[float, float, float]:
@@ -434,42 +1340,92 @@ class CasosDeCarga:
         Gera combinações (cartesiano) variando campos do caso_base.
         Ex.: a_partir_de_grade(base, velocidade_vento_ms=[0,10,20], angulo_incidencia_graus=[0,90])
         """
-        chaves = list(grade_variaveis.keys())
-        valores = [list(v) for v in grade_variaveis.values()]
-        combinacoes = itertools.product(*valores)
-
-        casos: List[CasoDeCarga] = []
-        for combo in combinacoes:
-            kwargs = {k: v for k, v in zip(chaves, combo)}
-            # monta descrição com sufixos auto-explicativos
-            sufixos = [f"{k}={cls._rotulo_var(v)}" for k, v in kwargs.items()]
-            desc = f"{caso_base.descricao} | " + ", ".join(sufixos)
-            novo = CasoDeCarga(
-                descricao=desc,
-                velocidade_vento_ms=kwargs.get("velocidade_vento_ms", caso_base.velocidade_vento_ms),
-                periodo_retorno_anos=kwargs.get("periodo_retorno_anos", caso_base.periodo_retorno_anos),
-                tempo_integracao_s=kwargs.get("tempo_integracao_s", caso_base.tempo_integracao_s),
-                temperatura_condutor_c=kwargs.get("temperatura_condutor_c", caso_base.temperatura_condutor_c),
-                temperatura_ambiente_c=kwargs.get("temperatura_ambiente_c", caso_base.temperatura_ambiente_c),
-                angulo_incidencia_graus=kwargs.get("angulo_incidencia_graus", caso_base.angulo_incidencia_graus),
-                altitude_m=kwargs.get("altitude_m", caso_base.altitude_m),
-                tipo_terreno=kwargs.get("tipo_terreno", caso_base.tipo_terreno),
-                pressao_atm_pa=kwargs.get("pressao_atm_pa", caso_base.pressao_atm_pa),
-                massa_especifica_ar_kgm3=kwargs.get("massa_especifica_ar_kgm3", caso_base.massa_especifica_ar_kgm3),
-                tags=kwargs.get("tags", caso_base.tags),
-            )
-            casos.append(novo)
-        return cls(casos)
+        return cls(list(GradeDeCasos(caso_base, **grade_variaveis)))
+
+    @classmethod
+    def grade_preguicosa(
+        cls,
+        caso_base: CasoDeCarga,
+        **grade_variaveis: Sequence[Any],
+    ) -> "GradeDeCasos":
+        """
+        Como a_partir_de_grade, mas sem materializar o produto cartesiano:
+        os casos são criados sob demanda (ver GradeDeCasos).
+        """
+        return GradeDeCasos(caso_base, **grade_variaveis)
+
+    @classmethod
+    def _variacao_da_combinacao(cls, kwargs: Dict[str, Any], descricao_base: str) -> Dict[str, Any]:
+        """Campos variados de uma combinação da grade, com a descrição montada."""
+        # monta descrição com sufixos auto-explicativos
+        sufixos = [f"{k}={cls._rotulo_var(v)}" for k, v in kwargs.items()]
+        variacao = dict(kwargs)
+        variacao["descricao"] = f"{descricao_base} | " + ", ".join(sufixos)
+        return variacao
 
     # ---- transformação/aplicação ----
-    def map(self, func: Callable[[CasoDeCarga], Any]) -> List[Any]:
-        """Aplica uma função a cada caso e retorna a lista de resultados."""
-        return [func(c) for c in self._lista]
+    def map(
+        self,
+        func: Callable[[CasoDeCarga], Any],
+        *,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        tamanho_bloco: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Aplica uma função a cada caso e retorna a lista de resultados.
+
+        Com workers= (ou um executor= já criado) os casos são divididos em blocos
+        avaliados em paralelo num ProcessPoolExecutor; a ordem do resultado é a
+        mesma dos casos. Nesse modo func precisa ser serializável (pickle), ou seja,
+        uma função de módulo e não um lambda.
+        """
+        if workers is None and executor is None:
+            return [func(c) for c in self._lista]
+        return self._em_paralelo(
+            _tarefa_map, func, workers=workers, executor=executor, tamanho_bloco=tamanho_bloco
+        )
+
+    def _em_paralelo(
+        self,
+        tarefa: Callable[..., List[Any]],
+        argumento: Any,
+        *,
+        workers: Optional[int],
+        executor: Optional[Executor],
+        tamanho_bloco: Optional[int],
+    ) -> List[Any]:
+        """
+        Distribui os casos em blocos contíguos por tarefa(ambiente, bloco, argumento)
+        e concatena os resultados na ordem original. O retrato de AmbientePadrao vai
+        junto de cada bloco: processos criados por spawn não herdam set_defaults.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("workers deve ser positivo.")
+        if tamanho_bloco is None:
+            n_workers = workers or os.cpu_count() or 1
+            # ~4 blocos por processo equilibra carga sem multiplicar o custo de pickle
+            tamanho_bloco = max(1, math.ceil(len(self._lista) / (4 * n_workers)))
+        elif tamanho_bloco <= 0:
+            raise ValueError("tamanho_bloco deve ser positivo.")
+
+        blocos = [self._lista[i:i + tamanho_bloco] for i in range(0, len(self._lista), tamanho_bloco)]
+        args = (itertools.repeat(AmbientePadrao.capturar()), blocos, itertools.repeat(argumento))
+        if executor is not None:
+            partes = list(executor.map(tarefa, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                partes = list(ex.map(tarefa, *args))
+        return [item for parte in partes for item in parte]
 
     def filtrar(self, predicado: Callable[[CasoDeCarga], bool]) -> "CasosDeCarga":
         """Retorna uma nova coleção apenas com casos que satisfazem o predicado."""
         return CasosDeCarga([c for c in self._lista if predicado(c)])
 
+    def para_colunar(self) -> "CasosDeCargaColunar":
+        """Converte para a representação colunar (arrays NumPy por campo)."""
+        return CasosDeCargaColunar.de_casos(self._lista)
+
     # ---- avaliações prontas ----
     def avaliar_forcas(
         self,
@@ -479,11 +1435,27 @@ class CasosDeCarga:
         diametro_cabo_m: float,
         area_isolador_m2: Optional[float] = None,
         coef_arrasto_cabo: Optional[float] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        tamanho_bloco: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Calcula, para todos os casos, as forças de vento no cabo (e no isolador se área for dada).
         Retorna uma lista de dicionários (fácil de jogar para Excel/CSV/DataFrame).
+        workers/executor/tamanho_bloco: avaliação em processos paralelos (ver map).
         """
+        if workers is not None or executor is not None:
+            geometria = dict(
+                altura_cabo_m=altura_cabo_m,
+                comprimento_vao_m=comprimento_vao_m,
+                diametro_cabo_m=diametro_cabo_m,
+                area_isolador_m2=area_isolador_m2,
+                coef_arrasto_cabo=coef_arrasto_cabo,
+            )
+            return self._em_paralelo(
+                _tarefa_avaliar_forcas, geometria, workers=workers, executor=executor, tamanho_bloco=tamanho_bloco
+            )
+
         tabela: List[Dict[str, Any]] = []
         for c in self._lista:
             gc, gl, gt = c.fatores_vento(altura_cabo_m=altura_cabo_m, comprimento_vao_m=comprimento_vao_m)
@@ -522,6 +1494,573 @@ class CasosDeCarga:
             tabela.append(linha)
         return tabela
 
+    def avaliar_forcas_geometrias(
+        self,
+        *,
+        alturas_cabo_m: ArrayLike,
+        comprimentos_vao_m: ArrayLike,
+        diametros_cabo_m: ArrayLike,
+        areas_isolador_m2: Optional[ArrayLike] = None,
+        coef_arrasto_cabo: Optional[ArrayLike] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Casos × geometrias de uma vez (ver CasosDeCargaColunar.avaliar_forcas_geometrias)."""
+        return self.para_colunar().avaliar_forcas_geometrias(
+            alturas_cabo_m=alturas_cabo_m,
+            comprimentos_vao_m=comprimentos_vao_m,
+            diametros_cabo_m=diametros_cabo_m,
+            areas_isolador_m2=areas_isolador_m2,
+            coef_arrasto_cabo=coef_arrasto_cabo,
+        )
+
+    def avaliar_forcas_para(
+        self,
+        saida: "SaidaResultados",
+        *,
+        altura_cabo_m: float,
+        comprimento_vao_m: float,
+        diametro_cabo_m: float,
+        area_isolador_m2: Optional[float] = None,
+        coef_arrasto_cabo: Optional[float] = None,
+        tamanho_lote: int = 10_000,
+    ) -> int:
+        """
+        Como avaliar_forcas, mas envia os resultados em lotes de colunas para
+        `saida` (SaidaCSV, SaidaParquet, SaidaArrayEstruturado) em vez de montar
+        a lista de dicionários. Não fecha a saída. Retorna o nº de linhas escritas.
+        """
+        if tamanho_lote <= 0:
+            raise ValueError("tamanho_lote deve ser positivo.")
+        blocos = (self._lista[i:i + tamanho_lote] for i in range(0, len(self._lista), tamanho_lote))
+        return _escrever_em_lotes(
+            blocos,
+            saida,
+            altura_cabo_m=altura_cabo_m,
+            comprimento_vao_m=comprimento_vao_m,
+            diametro_cabo_m=diametro_cabo_m,
+            area_isolador_m2=area_isolador_m2,
+            coef_arrasto_cabo=coef_arrasto_cabo,
+        )
+
+
+def _escrever_em_lotes(blocos: Iterable[Iterable[CasoDeCarga]], saida: "SaidaResultados", **geometria: Any) -> int:
+    """Avalia cada bloco pelo caminho colunar e o escreve em `saida`."""
+    total = 0
+    for bloco in blocos:
+        colunas = CasosDeCargaColunar.de_casos(bloco).avaliar_forcas(**geometria)
+        saida.escrever(colunas)
+        total += len(colunas["descricao"])
+    return total
+
+
+# Tarefas executadas nos processos de CasosDeCarga._em_paralelo (nível de módulo para serem serializáveis)
+
+def _tarefa_map(
+    ambiente: Tuple[float, TipoTerreno], casos: List[CasoDeCarga], func: Callable[[CasoDeCarga], Any]
+) -> List[Any]:
+    AmbientePadrao.restaurar(ambiente)
+    return [func(c) for c in casos]
+
+
+def _tarefa_avaliar_forcas(
+    ambiente: Tuple[float, TipoTerreno], casos: List[CasoDeCarga], geometria: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    AmbientePadrao.restaurar(ambiente)
+    return CasosDeCarga(casos).avaliar_forcas(**geometria)
+
+
+# ------------------- Grade preguiçosa de casos -------------------
+
+class GradeDeCasos:
+    """
+    Produto cartesiano de variações de um caso base, gerado sob demanda.
+
+    Só os valores de cada eixo ficam em memória; len() é o produto dos
+    tamanhos dos eixos. A ordem das combinações é a de itertools.product
+    (o último eixo varia mais rápido), a mesma de CasosDeCarga.a_partir_de_grade.
+    """
+
+    def __init__(self, caso_base: CasoDeCarga, **grade_variaveis: Sequence[Any]) -> None:
+        self.caso_base = caso_base
+        self._chaves = list(grade_variaveis.keys())
+        self._valores = [list(v) for v in grade_variaveis.values()]
+
+    def __len__(self) -> int:
+        return math.prod(len(v) for v in self._valores)
+
+    def __iter__(self) -> Iterator[CasoDeCarga]:
+        descricao = self.caso_base.descricao
+        variacoes = (
+            CasosDeCarga._variacao_da_combinacao(dict(zip(self._chaves, combo)), descricao)
+            for combo in itertools.product(*self._valores)
+        )
+        return CasoDeCarga.variantes_em_lote(self.caso_base, variacoes)
+
+    def __getitem__(self, idx: int) -> CasoDeCarga:
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("índice fora da grade.")
+        combo = []
+        for valores in reversed(self._valores):
+            idx, resto = divmod(idx, len(valores))
+            combo.append(valores[resto])
+        variacao = CasosDeCarga._variacao_da_combinacao(
+            dict(zip(self._chaves, reversed(combo))), self.caso_base.descricao
+        )
+        return next(CasoDeCarga.variantes_em_lote(self.caso_base, [variacao]))
+
+    def em_blocos(self, tamanho_bloco: int) -> Iterator[CasosDeCarga]:
+        """Entrega a grade em CasosDeCarga de até tamanho_bloco casos."""
+        if tamanho_bloco <= 0:
+            raise ValueError("tamanho_bloco deve ser positivo.")
+        casos = iter(self)
+        while True:
+            bloco = list(itertools.islice(casos, tamanho_bloco))
+            if not bloco:
+                return
+            yield CasosDeCarga(bloco)
+
+    def materializar(self) -> CasosDeCarga:
+        """Cria todos os casos de uma vez (equivale a CasosDeCarga.a_partir_de_grade)."""
+        return CasosDeCarga(list(self))
+
+    def avaliar_forcas(
+        self,
+        *,
+        altura_cabo_m: float,
+        comprimento_vao_m: float,
+        diametro_cabo_m: float,
+        area_isolador_m2: Optional[float] = None,
+        coef_arrasto_cabo: Optional[float] = None,
+        tamanho_bloco: int = 10_000,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Mesmas linhas de CasosDeCarga.avaliar_forcas, porém como iterador:
+        a grade é consumida bloco a bloco e no máximo tamanho_bloco casos
+        (e suas linhas) ficam em memória ao mesmo tempo. Com workers/executor
+        cada bloco é dividido entre os processos de um único pool.
+        """
+        geometria = dict(
+            altura_cabo_m=altura_cabo_m,
+            comprimento_vao_m=comprimento_vao_m,
+            diametro_cabo_m=diametro_cabo_m,
+            area_isolador_m2=area_isolador_m2,
+            coef_arrasto_cabo=coef_arrasto_cabo,
+        )
+        if workers is not None and executor is None:
+            if workers <= 0:
+                raise ValueError("workers deve ser positivo.")
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                yield from self.avaliar_forcas(**geometria, tamanho_bloco=tamanho_bloco, executor=ex)
+            return
+        for bloco in self.em_blocos(tamanho_bloco):
+            yield from bloco.avaliar_forcas(**geometria, executor=executor)
+
+    def avaliar_forcas_para(
+        self,
+        saida: "SaidaResultados",
+        *,
+        altura_cabo_m: float,
+        comprimento_vao_m: float,
+        diametro_cabo_m: float,
+        area_isolador_m2: Optional[float] = None,
+        coef_arrasto_cabo: Optional[float] = None,
+        tamanho_lote: int = 10_000,
+    ) -> int:
+        """
+        Avalia a grade em lotes de tamanho_lote casos e os escreve em `saida`
+        (ver CasosDeCarga.avaliar_forcas_para); a memória de pico não depende
+        do tamanho da grade. Retorna o nº de linhas escritas.
+        """
+        return _escrever_em_lotes(
+            self.em_blocos(tamanho_lote),
+            saida,
+            altura_cabo_m=altura_cabo_m,
+            comprimento_vao_m=comprimento_vao_m,
+            diametro_cabo_m=diametro_cabo_m,
+            area_isolador_m2=area_isolador_m2,
+            coef_arrasto_cabo=coef_arrasto_cabo,
+        )
+
+
+# ------------------- Representação colunar (struct-of-arrays) -------------------
+
+_LETRAS_TERRENO = np.array([t.value for t in TipoTerreno])
+
+
+@dataclass
+class CasosDeCargaColunar:
+    """
+    Coleção de casos em colunas NumPy (um array por campo), para grades grandes.
+
+    Campos escalares são repetidos (broadcast) até o número de casos. Como em
+    CasoDeCarga, altitude_m/tipo_terreno omitidos herdam de AmbientePadrao e
+    pressao_atm_pa/massa_especifica_ar_kgm3 omitidos são derivados. O terreno é
+    guardado como código int8 (ver CalculadoraNBR5422.codificar_terreno).
+    """
+    velocidade_vento_ms: ArrayLike
+    periodo_retorno_anos: ArrayLike
+    tempo_integracao_s: ArrayLike
+    temperatura_condutor_c: ArrayLike
+    temperatura_ambiente_c: ArrayLike
+    angulo_incidencia_graus: ArrayLike = 90.0
+    altitude_m: Optional[ArrayLike] = None
+    tipo_terreno: Optional[Union[TipoTerreno, str, ArrayLike]] = None
+    pressao_atm_pa: Optional[ArrayLike] = None
+    massa_especifica_ar_kgm3: Optional[ArrayLike] = None
+    descricao: Optional[Sequence[str]] = None
+    tags: Optional[Sequence[Tuple[str, ...]]] = None
+
+    _NUMERICOS = (
+        "velocidade_vento_ms", "periodo_retorno_anos", "tempo_integracao_s", "temperatura_condutor_c",
+        "temperatura_ambiente_c", "angulo_incidencia_graus", "altitude_m",
+    )
+
+    def __post_init__(self) -> None:
+        if self.altitude_m is None:
+            self.altitude_m = AmbientePadrao.altitude_m
+        if self.tipo_terreno is None:
+            self.tipo_terreno = AmbientePadrao.tipo_terreno
+
+        colunas = [np.asarray(getattr(self, nome), dtype=float) for nome in self._NUMERICOS]
+        codigos = CalculadoraNBR5422.codificar_terreno(self.tipo_terreno)
+        formato = np.broadcast_shapes(*(c.shape for c in colunas), codigos.shape)
+        if len(formato) > 1:
+            raise ValueError("As colunas devem ser unidimensionais.")
+        if formato:
+            n = formato[0]
+        else:
+            n = 1 if self.descricao is None else len(self.descricao)
+        for nome, col in zip(self._NUMERICOS, colunas):
+            setattr(self, nome, np.ascontiguousarray(np.broadcast_to(col, (n,))))
+        self.tipo_terreno = np.ascontiguousarray(np.broadcast_to(codigos, (n,)))
+        self.descricao = [""] * n if self.descricao is None else list(self.descricao)
+        self.tags = [()] * n if self.tags is None else [tuple(t) for t in self.tags]
+        if len(self.descricao) != n or len(self.tags) != n:
+            raise ValueError("descricao/tags devem ter um item por caso.")
+
+        self._validar()
+
+        alt = np.maximum(0.0, self.altitude_m)
+        if self.pressao_atm_pa is None:
+            self.pressao_atm_pa = 101_325.0 * np.exp(-alt / 8434.0)
+        if self.massa_especifica_ar_kgm3 is None:
+            temp_k = self.temperatura_ambiente_c + 273.15
+            self.massa_especifica_ar_kgm3 = np.round(
+                CalculadoraNBR5422.MASSA_AR_REFERENCIA * (CalculadoraNBR5422.TEMP_REFERENCIA / temp_k) * np.exp(-1.2e-4 * alt),
+                3,
+            )
+        self.pressao_atm_pa = np.ascontiguousarray(np.broadcast_to(np.asarray(self.pressao_atm_pa, dtype=float), (n,)))
+        self.massa_especifica_ar_kgm3 = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(self.massa_especifica_ar_kgm3, dtype=float), (n,))
+        )
+
+    def _validar(self) -> None:
+        """Mesmas regras de CasoDeCarga._validar, aplicadas a todas as linhas."""
+        regras = (
+            (self.velocidade_vento_ms < 0, "Velocidade do vento deve ser não negativa."),
+            (self.periodo_retorno_anos <= 0, "Período de retorno deve ser positivo."),
+            (self.tempo_integracao_s <= 0, "Tempo de integração deve ser positivo."),
+            (~((self.angulo_incidencia_graus >= 0.0) & (self.angulo_incidencia_graus <= 90.0)),
+             "Ângulo de incidência deve estar entre 0 e 90 graus."),
+            (self.tipo_terreno < 0, "tipo_terreno inválido."),
+            (~(self.altitude_m >= 0), "altitude_m deve ser não negativa."),
+        )
+        for invalidos, mensagem in regras:
+            if invalidos.any():
+                raise ValueError(mensagem)
+
+    def __len__(self) -> int:
+        return len(self.descricao)
+
+    # --------- conversão de/para a lista de objetos ---------
+    @classmethod
+    def de_casos(cls, casos: Iterable[CasoDeCarga]) -> "CasosDeCargaColunar":
+        """Monta as colunas a partir de CasoDeCarga (ou de um CasosDeCarga)."""
+        casos = list(casos)
+        codigo = {t: i for i, t in enumerate(TipoTerreno)}
+        return cls(
+            velocidade_vento_ms=[c.velocidade_vento_ms for c in casos],
+            periodo_retorno_anos=[c.periodo_retorno_anos for c in casos],
+            tempo_integracao_s=[c.tempo_integracao_s for c in casos],
+            temperatura_condutor_c=[c.temperatura_condutor_c for c in casos],
+            temperatura_ambiente_c=[c.temperatura_ambiente_c for c in casos],
+            angulo_incidencia_graus=[c.angulo_incidencia_graus for c in casos],
+            altitude_m=[c.altitude_m for c in casos],
+            tipo_terreno=np.array([codigo[c.tipo_terreno] for c in casos], dtype=np.int8),
+            pressao_atm_pa=[c.pressao_atm_pa for c in casos],
+            massa_especifica_ar_kgm3=[c.massa_especifica_ar_kgm3 for c in casos],
+            descricao=[c.descricao for c in casos],
+            tags=[c.tags for c in casos],
+        )
+
+    def para_casos(self) -> "CasosDeCarga":
+        """Reconstrói a lista de objetos CasoDeCarga."""
+        tipos = list(TipoTerreno)
+        return CasosDeCarga([
+            CasoDeCarga(
+                descricao=self.descricao[i],
+                velocidade_vento_ms=float(self.velocidade_vento_ms[i]),
+                periodo_retorno_anos=float(self.periodo_retorno_anos[i]),
+                tempo_integracao_s=float(self.tempo_integracao_s[i]),
+                temperatura_condutor_c=float(self.temperatura_condutor_c[i]),
+                temperatura_ambiente_c=float(self.temperatura_ambiente_c[i]),
+                angulo_incidencia_graus=float(self.angulo_incidencia_graus[i]),
+                altitude_m=float(self.altitude_m[i]),
+                tipo_terreno=tipos[self.tipo_terreno[i]],
+                pressao_atm_pa=float(self.pressao_atm_pa[i]),
+                massa_especifica_ar_kgm3=float(self.massa_especifica_ar_kgm3[i]),
+                tags=self.tags[i],
+            )
+            for i in range(len(self))
+        ])
+
+    # --------- derivados vetorizados ---------
+    @property
+    def densidade_relativa_ar(self) -> np.ndarray:
+        t_k = self.temperatura_ambiente_c + 273.15
+        return np.round((self.pressao_atm_pa / 101_325.0) * (293.15 / t_k), 6)
+
+    @property
+    def pressao_dinamica_pa(self) -> np.ndarray:
+        return np.round(0.5 * self.massa_especifica_ar_kgm3 * (self.velocidade_vento_ms ** 2), 2)
+
+    # --------- avaliação vetorizada ---------
+    def avaliar_forcas(
+        self,
+        *,
+        altura_cabo_m: float,
+        comprimento_vao_m: float,
+        diametro_cabo_m: float,
+        area_isolador_m2: Optional[float] = None,
+        coef_arrasto_cabo: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Equivalente colunar de CasosDeCarga.avaliar_forcas: mesmas chaves, mas
+        cada uma mapeia para um array com uma posição por caso.
+        """
+        calc = CalculadoraNBR5422
+        n = len(self)
+        q = self.pressao_dinamica_pa
+        gc = calc.calcular_gc_array(altura_cabo_m, self.tipo_terreno, erros="raise")
+        gt = calc.calcular_gt_array(altura_cabo_m, self.tipo_terreno, erros="raise")
+        gl = np.full(n, calc.calcular_gl(comprimento_vao_m))
+        if coef_arrasto_cabo is None:
+            coef_arrasto_cabo = calc.coef_arrasto_cabo(diametro_cabo_m)
+        F_cabo = calc.forca_vento_em_cabo_array(
+            gl=gl,
+            gc=gc,
+            pressao_dinamica_pa=q,
+            angulo_incidencia_graus=self.angulo_incidencia_graus,
+            diametro_m=diametro_cabo_m,
+            comprimento_vao_m=comprimento_vao_m,
+            coef_arrasto=coef_arrasto_cabo,
+            erros="raise",
+        )
+        resultado: Dict[str, np.ndarray] = {
+            "descricao": np.array(self.descricao, dtype=object),
+            "tags": np.array([",".join(t) for t in self.tags], dtype=object),
+            "V_ms": self.velocidade_vento_ms,
+            "angulo_graus": self.angulo_incidencia_graus,
+            "TR_anos": self.periodo_retorno_anos,
+            "Tint_s": self.tempo_integracao_s,
+            "Tcond_C": self.temperatura_condutor_c,
+            "Tamb_C": self.temperatura_ambiente_c,
+            "alt_m": self.altitude_m,
+            "terreno": _LETRAS_TERRENO[self.tipo_terreno],
+            "rho_kgm3": self.massa_especifica_ar_kgm3,
+            "q_Pa": q,
+            "GC": gc,
+            "GL": gl,
+            "GT": gt,
+            "F_vento_cabo_N": F_cabo,
+        }
+        if area_isolador_m2 is not None and area_isolador_m2 > 0:
+            resultado["F_vento_isolador_N"] = calc.forca_vento_em_isolador_array(
+                gt, area_isolador_m2, q, erros="raise"
+            )
+        return resultado
+
+    def avaliar_forcas_geometrias(
+        self,
+        *,
+        alturas_cabo_m: ArrayLike,
+        comprimentos_vao_m: ArrayLike,
+        diametros_cabo_m: ArrayLike,
+        areas_isolador_m2: Optional[ArrayLike] = None,
+        coef_arrasto_cabo: Optional[ArrayLike] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Avalia todos os casos × todas as geometrias (altura, vão, diâmetro[, área
+        do isolador]) de uma vez; os argumentos geométricos têm broadcast entre si
+        para n_geom posições.
+
+        Retorna as colunas por caso de avaliar_forcas (formato (n_casos,)), "GL"
+        com formato (n_geom,) e "GC", "GT", "F_vento_cabo_N" (e
+        "F_vento_isolador_N" se houver áreas) com formato (n_casos, n_geom).
+        rho/q são calculados uma vez por caso, GL uma vez por geometria e GC/GT
+        uma vez por par distinto (terreno, altura).
+        """
+        calc = CalculadoraNBR5422
+        geometria = [np.asarray(v, dtype=float) for v in (alturas_cabo_m, comprimentos_vao_m, diametros_cabo_m)]
+        if areas_isolador_m2 is not None:
+            geometria.append(np.asarray(areas_isolador_m2, dtype=float))
+        geometria = np.broadcast_arrays(*(np.atleast_1d(v) for v in geometria))
+        if geometria[0].ndim != 1:
+            raise ValueError("Os argumentos geométricos devem ser unidimensionais.")
+        alturas, vaos, diametros = geometria[:3]
+
+        q = self.pressao_dinamica_pa
+        gl = calc.calcular_gl_array(vaos, erros="raise")
+
+        # tabelas (terrenos presentes × alturas distintas), indexadas por caso e geometria
+        terrenos, idx_terreno = np.unique(self.tipo_terreno, return_inverse=True)
+        alturas_u, idx_altura = np.unique(alturas, return_inverse=True)
+        linhas, colunas = idx_terreno.reshape(-1, 1), idx_altura.reshape(1, -1)
+        gc = calc.calcular_gc_array(alturas_u[None, :], terrenos[:, None], erros="raise")[linhas, colunas]
+        gt = calc.calcular_gt_array(alturas_u[None, :], terrenos[:, None], erros="raise")[linhas, colunas]
+
+        if coef_arrasto_cabo is None:
+            coef_arrasto_cabo = calc.coef_arrasto_cabo_array(diametros, erros="raise")
+        F_cabo = calc.forca_vento_em_cabo_array(
+            gl=gl[None, :],
+            gc=gc,
+            pressao_dinamica_pa=q[:, None],
+            angulo_incidencia_graus=self.angulo_incidencia_graus[:, None],
+            diametro_m=diametros[None, :],
+            comprimento_vao_m=vaos[None, :],
+            coef_arrasto=np.broadcast_to(np.asarray(coef_arrasto_cabo, dtype=float), vaos.shape)[None, :],
+            erros="raise",
+        )
+        resultado: Dict[str, np.ndarray] = {
+            "descricao": np.array(self.descricao, dtype=object),
+            "tags": np.array([",".join(t) for t in self.tags], dtype=object),
+            "V_ms": self.velocidade_vento_ms,
+            "angulo_graus": self.angulo_incidencia_graus,
+            "TR_anos": self.periodo_retorno_anos,
+            "Tint_s": self.tempo_integracao_s,
+            "Tcond_C": self.temperatura_condutor_c,
+            "Tamb_C": self.temperatura_ambiente_c,
+            "alt_m": self.altitude_m,
+            "terreno": _LETRAS_TERRENO[self.tipo_terreno],
+            "rho_kgm3": self.massa_especifica_ar_kgm3,
+            "q_Pa": q,
+            "GC": gc,
+            "GL": gl,
+            "GT": gt,
+            "F_vento_cabo_N": F_cabo,
+        }
+        if areas_isolador_m2 is not None:
+            resultado["F_vento_isolador_N"] = calc.forca_vento_em_isolador_array(
+                gt, geometria[3][None, :], q[:, None], erros="raise"
+            )
+        return resultado
+
+
+# ------------------- Saídas de resultados em lote -------------------
+
+class SaidaResultados(ABC):
+    """
+    Destino de avaliar_forcas_para. Recebe lotes de colunas (as chaves de
+    avaliar_forcas mapeando para arrays do mesmo tamanho) via escrever().
+    Use como context manager para garantir fechar().
+    """
+
+    @abstractmethod
+    def escrever(self, colunas: Dict[str, np.ndarray]) -> None:
+        """Grava um lote de colunas."""
+
+    def fechar(self) -> None:
+        pass
+
+    def __enter__(self) -> "SaidaResultados":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fechar()
+
+
+class SaidaCSV(SaidaResultados):
+    """Grava os lotes num arquivo CSV (cabeçalho tirado do primeiro lote)."""
+
+    def __init__(self, caminho: Union[str, Path], *, delimitador: str = ",", encoding: str = "utf-8") -> None:
+        self.caminho = Path(caminho)
+        self._arquivo = open(self.caminho, "w", newline="", encoding=encoding)
+        self._escritor = csv.writer(self._arquivo, delimiter=delimitador)
+        self._cabecalho: Optional[List[str]] = None
+
+    def escrever(self, colunas: Dict[str, np.ndarray]) -> None:
+        if self._cabecalho is None:
+            self._cabecalho = list(colunas)
+            self._escritor.writerow(self._cabecalho)
+        elif list(colunas) != self._cabecalho:
+            raise ValueError("Todos os lotes devem ter as mesmas colunas.")
+        self._escritor.writerows(zip(*(np.asarray(colunas[k]).tolist() for k in self._cabecalho)))
+
+    def fechar(self) -> None:
+        if not self._arquivo.closed:
+            self._arquivo.close()
+
+
+class SaidaParquet(SaidaResultados):
+    """Grava os lotes como row groups de um arquivo Parquet (requer pyarrow)."""
+
+    def __init__(self, caminho: Union[str, Path]) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("SaidaParquet requer o pacote 'pyarrow' (pip install pyarrow).") from e
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.caminho = Path(caminho)
+        self._escritor = None
+
+    def escrever(self, colunas: Dict[str, np.ndarray]) -> None:
+        tabela = self._pa.table({k: np.asarray(v).tolist() if v.dtype == object else v for k, v in colunas.items()})
+        if self._escritor is None:
+            self._escritor = self._pq.ParquetWriter(str(self.caminho), tabela.schema)
+        self._escritor.write_table(tabela)
+
+    def fechar(self) -> None:
+        if self._escritor is not None:
+            self._escritor.close()
+            self._escritor = None
+
+
+class SaidaArrayEstruturado(SaidaResultados):
+    """
+    Acumula os lotes num array estruturado NumPy (um campo por coluna;
+    texto como object). Mais compacto que a lista de dicionários, mas
+    cresce com o número de casos; o resultado fica em .resultado.
+    """
+
+    def __init__(self) -> None:
+        self._lotes: List[np.ndarray] = []
+        self._dtype: Optional[np.dtype] = None
+
+    def escrever(self, colunas: Dict[str, np.ndarray]) -> None:
+        if self._dtype is None:
+            self._dtype = np.dtype([(k, object if np.asarray(v).dtype.kind in "OU" else np.asarray(v).dtype)
+                                    for k, v in colunas.items()])
+        elif list(colunas) != list(self._dtype.names):
+            raise ValueError("Todos os lotes devem ter as mesmas colunas.")
+        lote = np.empty(len(colunas["descricao"]), dtype=self._dtype)
+        for k, v in colunas.items():
+            lote[k] = v
+        self._lotes.append(lote)
+
+    @property
+    def resultado(self) -> np.ndarray:
+        if len(self._lotes) > 1:
+            self._lotes = [np.concatenate(self._lotes)]
+        if not self._lotes:
+            return np.empty(0, dtype=self._dtype or np.dtype([]))
+        return self._lotes[0]
+
 
 # =============================================================
 # Exemplo de uso
@@ -668,3 +2207,104 @@ if __name__ == "__main__":
     print(f"  T_final  (Vento máx)     : {T_final_N:,.1f} N @ {temp_fin_C:.1f} °C")
     print(f"  Flecha inicial (aprox)   : {f_ini_m:.3f} m")
     print(f"  Flecha final (aprox)     : {f_fin_m:.3f} m")
+
+    # ----------------------------------------------------------------------
+    # 9) Exemplo: mudança de estado em lote (vários vãos de uma vez)
+    # ----------------------------------------------------------------------
+    vaos_m = np.array([150.0, 250.0, 400.0, 600.0])
+    t0 = time.perf_counter()
+    lote = CalculadoraNBR5422.mudar_estado_cabo_lote(
+        modulo_elasticidade_pa=E_pa,
+        area_secao_m2=area_m2,
+        peso_unit_inicial_npm=w_ini_npm,
+        peso_unit_final_npm=w_fin_npm,
+        tracao_inicial_n=T_inicial_N,
+        temp_inicial_c=temp_ini_C,
+        temp_final_c=temp_fin_C,
+        alfa_thermal_1porc=alpha_1porC,
+        comprimento_vao_m=vaos_m,
+    )
+    dt = time.perf_counter() - t0
+    print(f"\n[MUDANÇA DE ESTADO EM LOTE] {vaos_m.size} vãos em {dt*1000:.3f} ms")
+    for L_m, T_N, it, ok in zip(vaos_m, lote.tracao_n, lote.iteracoes, lote.convergiu):
+        print(f"  vão {L_m:6.1f} m → T = {T_N:,.1f} N ({it} iterações{'' if ok else ', sem convergência'})")
+
+    # ----------------------------------------------------------------------
+    # 10) Benchmark: derivada por diferença finita × analítica × Halley
+    # ----------------------------------------------------------------------
+    # Grade realista: vãos 50–800 m, EDS 8–30 kN, temperaturas finais -5–75 °C,
+    # com e sem vento (mesmo cabo do exemplo 8).
+    grade_vao, grade_T0, grade_temp, grade_w = np.meshgrid(
+        np.linspace(50.0, 800.0, 16),
+        np.linspace(8_000.0, 30_000.0, 12),
+        np.array([-5.0, 15.0, 50.0, 75.0]),
+        np.array([w_self_npm, w_fin_npm]),
+        indexing="ij",
+    )
+    problemas = list(zip(grade_vao.ravel(), grade_T0.ravel(), grade_temp.ravel(), grade_w.ravel()))
+
+    print(f"\n[BENCHMARK MUDANÇA DE ESTADO] {len(problemas)} problemas")
+    print(f"  {'método':<20} {'iter. média':>11} {'iter. máx':>9} {'escalar (ms)':>13} {'lote (ms)':>10}")
+    for metodo in MetodoMudancaEstado:
+        t0 = time.perf_counter()
+        for L_m, T0_N, t_fin, w_fin in problemas:
+            CalculadoraNBR5422.mudar_estado_cabo(
+                E_pa, area_m2, w_self_npm, w_fin, T0_N, temp_ini_C, t_fin, alpha_1porC, L_m, metodo=metodo
+            )
+        dt_escalar = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        lote = CalculadoraNBR5422.mudar_estado_cabo_lote(
+            E_pa, area_m2, w_self_npm, grade_w, grade_T0, temp_ini_C, grade_temp, alpha_1porC, grade_vao,
+            metodo=metodo,
+        )
+        dt_lote = time.perf_counter() - t0
+        print(
+            f"  {metodo.value:<20} {lote.iteracoes.mean():>11.2f} {lote.iteracoes.max():>9d} "
+            f"{dt_escalar*1000:>13.1f} {dt_lote*1000:>10.1f}"
+        )
+
+    # ----------------------------------------------------------------------
+    # 11) Grade preguiçosa: casos criados e avaliados bloco a bloco
+    # ----------------------------------------------------------------------
+    grade_grande = CasosDeCarga.grade_preguicosa(
+        base,
+        velocidade_vento_ms=np.linspace(0.0, 40.0, 41),
+        angulo_incidencia_graus=np.linspace(0.0, 90.0, 19),
+        temperatura_condutor_c=[15.0, 25.0, 50.0, 75.0],
+        tipo_terreno=["A", "B", "C", "D"],
+    )
+    F_max = max(
+        linha["F_vento_cabo_N"]
+        for linha in grade_grande.avaliar_forcas(
+            altura_cabo_m=altura_cabo_m,
+            comprimento_vao_m=vao_m,
+            diametro_cabo_m=diametro_m,
+            tamanho_bloco=2_000,
+        )
+    )
+    print(f"\n[GRADE PREGUIÇOSA] {len(grade_grande)} casos; F_cabo máx = {F_max:.1f} N")
+
+    # A mesma grade gravada em lotes num array estruturado (ou SaidaCSV/SaidaParquet)
+    with SaidaArrayEstruturado() as saida:
+        n_linhas = grade_grande.avaliar_forcas_para(
+            saida,
+            altura_cabo_m=altura_cabo_m,
+            comprimento_vao_m=vao_m,
+            diametro_cabo_m=diametro_m,
+            tamanho_lote=2_000,
+        )
+    print(f"  {n_linhas} linhas em array estruturado ({saida.resultado.nbytes / 1e6:.1f} MB)")
+
+    # ----------------------------------------------------------------------
+    # 12) Vários vãos/alturas de uma linha de uma só vez (casos × geometrias)
+    # ----------------------------------------------------------------------
+    vaos_linha = np.array([180.0, 350.0, 420.0, 510.0, 640.0, 790.0])
+    res_geo = casos.avaliar_forcas_geometrias(
+        alturas_cabo_m=np.array([18.0, 22.0, 25.0, 25.0, 30.0, 34.0]),
+        comprimentos_vao_m=vaos_linha,
+        diametros_cabo_m=diametro_m,
+        areas_isolador_m2=area_isolador_m2,
+    )
+    print(f"\n[CASOS × GEOMETRIAS] F_cabo {res_geo['F_vento_cabo_N'].shape}; "
+          f"máx por vão (N): {np.round(res_geo['F_vento_cabo_N'].max(axis=0), 1)}")
@@ -11,12 +11,15 @@ Observação importante: ajuste coeficientes/tabelas conforme sua leitura da NBR
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Callable, Any
 import math
 import itertools
 import time
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 
 # =============================================================
@@ -40,6 +43,37 @@ class ParametrosTerreno:
     gt_c: float
 
 
+class MetodoMudancaEstado(Enum):
+    """Estratégia de passo do Newton no kernel C++ (ver mudar_estado.cpp)."""
+    DIFERENCAS_FINITAS = "diferencas_finitas"  # derivada por diferença progressiva (DELTA_DERIVADA)
+    ANALITICO = "analitico"                    # Newton com a derivada fechada do resíduo
+    HALLEY = "halley"                          # Halley (derivadas fechadas de 1ª e 2ª ordem)
+
+
+class StatusMudancaEstado(IntEnum):
+    """Códigos de retorno por elemento de estado_cpp.mudar_estado_cabo_lote."""
+    CONVERGIU = 0
+    ARGUMENTO_INVALIDO = 1
+    DERIVADA_NULA = 2
+    SEM_CONVERGENCIA = 3
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoMudancaEstadoLote:
+    """
+    Resultado de CalculadoraNBR5422.mudar_estado_cabo_lote.
+    Todos os arrays têm o formato (broadcast) dos argumentos de entrada.
+    """
+    tracao_n: np.ndarray    # N, arredondada a 0.1 N; NaN onde não convergiu
+    iteracoes: np.ndarray   # iterações executadas por elemento
+    status: np.ndarray      # StatusMudancaEstado por elemento
+
+    @property
+    def convergiu(self) -> np.ndarray:
+        """Máscara booleana dos elementos que convergiram."""
+        return self.status == StatusMudancaEstado.CONVERGIU
+
+
 # =============================================================
 # Ambiente padrão (singleton simples)
 # =============================================================
@@ -211,10 +245,14 @@ class CalculadoraNBR5422:
         temp_final_c: float,
         alfa_thermal_1porc: float,
         comprimento_vao_m: float,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.DIFERENCAS_FINITAS,
     ) -> float:
         """
         Calcula a nova tração (N) chamando o módulo C++ compilado 'estado_cpp'.
+        ``metodo`` escolhe a derivada: diferença progressiva, analítica ou Halley.
         """
+        if isinstance(metodo, MetodoMudancaEstado):
+            metodo = metodo.value
         try:
             # Delega o cálculo pesado para a função C++ importada
             return estado_cpp.mudar_estado_cabo(
@@ -227,6 +265,7 @@ class CalculadoraNBR5422:
                 temp_final_c=temp_final_c,
                 alfa_thermal_1porc=alfa_thermal_1porc,
                 comprimento_vao_m=comprimento_vao_m,
+                metodo=metodo,
             )
         except NameError:
             # Erro comum se o import falhar no __main__
@@ -236,6 +275,69 @@ class CalculadoraNBR5422:
             # e as re-lança como uma exceção Python para manter a consistência.
             raise RuntimeError(f"Erro no cálculo C++: {e}") from e
 
+    @classmethod
+    def mudar_estado_cabo_lote(
+        cls,
+        modulo_elasticidade_pa: ArrayLike,
+        area_secao_m2: ArrayLike,
+        peso_unit_inicial_npm: ArrayLike,
+        peso_unit_final_npm: ArrayLike,
+        tracao_inicial_n: ArrayLike,
+        temp_inicial_c: ArrayLike,
+        temp_final_c: ArrayLike,
+        alfa_thermal_1porc: ArrayLike,
+        comprimento_vao_m: ArrayLike,
+        metodo: Union[MetodoMudancaEstado, str] = MetodoMudancaEstado.DIFERENCAS_FINITAS,
+        tracao_out: Optional[np.ndarray] = None,
+        num_threads: int = 0,
+    ) -> ResultadoMudancaEstadoLote:
+        """
+        Resolve N mudanças de estado numa única chamada ao C++ (estado_cpp.mudar_estado_cabo_lote).
+
+        Aceita escalares ou arrays (com broadcast). Arrays float64 contíguos já
+        no formato final são repassados sem cópia. ``tracao_out`` é um buffer
+        opcional do chamador (float64, C-contíguo, no formato do broadcast) que
+        recebe as trações. Falhas não levantam exceção: ficam em ``status``.
+        O kernel libera o GIL e divide o lote entre ``num_threads`` threads
+        (0 = todos os núcleos disponíveis).
+        """
+        if isinstance(metodo, MetodoMudancaEstado):
+            metodo = metodo.value
+        args = [
+            np.asarray(v, dtype=np.float64) for v in (
+                modulo_elasticidade_pa, area_secao_m2, peso_unit_inicial_npm, peso_unit_final_npm,
+                tracao_inicial_n, temp_inicial_c, temp_final_c, alfa_thermal_1porc, comprimento_vao_m,
+            )
+        ]
+        formato = np.broadcast_shapes(*(a.shape for a in args))
+        planos = [np.ascontiguousarray(np.broadcast_to(a, formato)).reshape(-1) for a in args]
+
+        if tracao_out is None:
+            tracao_out = np.empty(formato, dtype=np.float64)
+        elif (tracao_out.shape != formato or tracao_out.dtype != np.float64
+              or not tracao_out.flags.c_contiguous or not tracao_out.flags.writeable):
+            raise ValueError("tracao_out deve ser um array float64 C-contíguo e gravável no formato das entradas.")
+        iteracoes = np.empty(formato, dtype=np.int32)
+
+        try:
+            status = estado_cpp.mudar_estado_cabo_lote(
+                *planos,
+                tracao_out=tracao_out.reshape(-1),
+                iteracoes_out=iteracoes.reshape(-1),
+                metodo=metodo,
+                num_threads=num_threads,
+            )
+        except NameError:
+            raise RuntimeError("Módulo 'estado_cpp' não foi importado. Compile o projeto primeiro.")
+        except Exception as e:
+            raise RuntimeError(f"Erro no cálculo C++: {e}") from e
+
+        return ResultadoMudancaEstadoLote(
+            tracao_n=tracao_out,
+            iteracoes=iteracoes,
+            status=status.reshape(formato),
+        )
+
 
 # =============================================================
 # Caso de carga e coleção de casos
@@ -2,18 +2,50 @@
 // Lógica de cálculo mantida, adaptada para pybind11.
 
 #include <cmath>
+#include <algorithm>
+#include <cstdint>
+#include <limits>
 #include <stdexcept>
 #include <string>
+#include <thread>
+#include <vector>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 
+// Parâmetros do solver (fixos aqui para simplicidade, iguais aos do Python)
+constexpr double DELTA_DERIVADA = 1.0;
+constexpr double PRECISAO = 1e-4;
+constexpr int MAX_ITER = 10000;
+// Abaixo disso por thread, o custo de criar threads supera o ganho
+constexpr py::ssize_t MIN_PROBLEMAS_POR_THREAD = 256;
+
+// Estratégia de passo do Newton (mesmos valores de MetodoMudancaEstado no Python)
+enum MetodoMudancaEstado : int {
+    DIFERENCAS_FINITAS = 0,  // derivada por diferença progressiva (delta_derivada)
+    ANALITICO = 1,           // Newton com a derivada fechada do resíduo
+    HALLEY = 2               // Halley (derivadas fechadas de 1ª e 2ª ordem)
+};
+
+MetodoMudancaEstado metodo_de_string(const std::string& metodo)
+{
+    if (metodo == "diferencas_finitas") return DIFERENCAS_FINITAS;
+    if (metodo == "analitico") return ANALITICO;
+    if (metodo == "halley") return HALLEY;
+    throw std::invalid_argument("metodo deve ser 'diferencas_finitas', 'analitico' ou 'halley'.");
+}
+
 // A função de cálculo original, agora interna ao C++
+// Derivadas fechadas do resíduo, com u = w*L/(2T):
+//   f'(T)  = (sinh u - u cosh u) / (alfa * den * w) - 1/(E*S)
+//   f''(T) = u^2 sinh u / (alfa * den * w * T)
 int calcular_mudar_estado(
     double E_pa, double area_m2, double w_ini_npm, double w_fin_npm,
     double T_inicial_N, double temp_inicial_C, double temp_final_C,
     double alfa_1porC, double comprimento_vao_m, double delta_derivada,
-    double precisao, int max_iter, double* T_final_out, int* iters_out)
+    double precisao, int max_iter, MetodoMudancaEstado metodo,
+    double* T_final_out, int* iters_out)
 {
     if (!T_final_out || !iters_out) return 1;
     if (E_pa <= 0.0 || area_m2 <= 0.0 || w_ini_npm <= 0.0 || w_fin_npm <= 0.0 ||
@@ -33,19 +65,35 @@ int calcular_mudar_estado(
     for (int k = 0; k < max_iter; ++k) {
         *iters_out = k + 1;
 
-        const double num = (T / w_fin_npm) * std::sinh(w_fin_npm * L / (2.0 * T));
+        const double u = w_fin_npm * L / (2.0 * T);
+        const double sinh_u = std::sinh(u);
+        const double num = (T / w_fin_npm) * sinh_u;
         const double f = (1.0 / alfa_1porC) * (num / den - 1.0) - (T - T_inicial_N) / (E_pa * area_m2) - deltaT;
 
-        const double T_d = T + delta_derivada;
-        if (T_d <= 0.0) return 1;
+        double deriv;
+        const double kd = 1.0 / (alfa_1porC * den * w_fin_npm);
+        if (metodo == DIFERENCAS_FINITAS) {
+            const double T_d = T + delta_derivada;
+            if (T_d <= 0.0) return 1;
 
-        const double num_d = (T_d / w_fin_npm) * std::sinh(w_fin_npm * L / (2.0 * T_d));
-        const double f_d = (1.0 / alfa_1porC) * (num_d / den - 1.0) - (T_d - T_inicial_N) / (E_pa * area_m2) - deltaT;
+            const double num_d = (T_d / w_fin_npm) * std::sinh(w_fin_npm * L / (2.0 * T_d));
+            const double f_d = (1.0 / alfa_1porC) * (num_d / den - 1.0) - (T_d - T_inicial_N) / (E_pa * area_m2) - deltaT;
 
-        const double deriv = (f_d - f) / delta_derivada;
+            deriv = (f_d - f) / delta_derivada;
+        } else {
+            deriv = kd * (sinh_u - u * std::cosh(u)) - 1.0 / (E_pa * area_m2);
+        }
         if (std::abs(deriv) < tiny) return 2;
 
-        double T_new = T - f / deriv;
+        double passo = f / deriv;
+        if (metodo == HALLEY) {
+            const double deriv2 = kd * u * u * sinh_u / T;
+            const double denom_halley = 1.0 - 0.5 * passo * deriv2 / deriv;
+            // Salvaguarda: só aceita a correção se o passo mantiver o sentido do Newton
+            if (denom_halley > 0.5) passo /= denom_halley;
+        }
+
+        double T_new = T - passo;
         if (T_new <= 0.0) T_new = 0.5 * T;
 
         if (std::abs(f) < precisao) {
@@ -61,20 +109,15 @@ int calcular_mudar_estado(
 double mudar_estado_cabo_py(
     double E_pa, double area_m2, double w_ini_npm, double w_fin_npm,
     double T_inicial_N, double temp_inicial_C, double temp_final_C,
-    double alfa_1porC, double comprimento_vao_m)
+    double alfa_1porC, double comprimento_vao_m, const std::string& metodo)
 {
-    // Parâmetros do solver (fixos aqui para simplicidade, iguais aos do Python)
-    const double delta_derivada = 1.0;
-    const double precisao = 1e-4;
-    const int max_iter = 10000;
-
     double T_final;
     int iters;
 
     int ret_code = calcular_mudar_estado(
         E_pa, area_m2, w_ini_npm, w_fin_npm, T_inicial_N,
         temp_inicial_C, temp_final_C, alfa_1porC, comprimento_vao_m,
-        delta_derivada, precisao, max_iter, &T_final, &iters);
+        DELTA_DERIVADA, PRECISAO, MAX_ITER, metodo_de_string(metodo), &T_final, &iters);
 
     // Converte códigos de erro em exceções do Python
     switch (ret_code) {
@@ -92,6 +135,103 @@ double mudar_estado_cabo_py(
 }
 
 
+// Buffers NumPy float64 contíguos; com noconvert() o pybind11 recusa arrays
+// que exigiriam cópia, garantindo acesso zero-copy aos dados do chamador.
+using ArrayDouble = py::array_t<double, py::array::c_style>;
+using ArrayInt = py::array_t<std::int32_t, py::array::c_style>;
+
+// Versão em lote: resolve N problemas numa única travessia Python/C++.
+// Escreve as trações em tracao_out (NaN onde falhou), opcionalmente as
+// iterações em iteracoes_out, e devolve o código de retorno por elemento
+// (0 = convergiu, 1 = argumentos inválidos, 2 = derivada nula, 3 = sem convergência).
+// O laço roda sem o GIL, dividido em blocos contíguos entre num_threads
+// threads (0 = std::thread::hardware_concurrency()).
+ArrayInt mudar_estado_cabo_lote_py(
+    const ArrayDouble& E_pa, const ArrayDouble& area_m2,
+    const ArrayDouble& w_ini_npm, const ArrayDouble& w_fin_npm,
+    const ArrayDouble& T_inicial_N, const ArrayDouble& temp_inicial_C,
+    const ArrayDouble& temp_final_C, const ArrayDouble& alfa_1porC,
+    const ArrayDouble& comprimento_vao_m, ArrayDouble& tracao_out,
+    py::object iteracoes_out, const std::string& metodo, int num_threads)
+{
+    if (num_threads < 0) {
+        throw std::invalid_argument("mudar_estado_cabo_lote: num_threads deve ser >= 0.");
+    }
+    const MetodoMudancaEstado met = metodo_de_string(metodo);
+    const py::ssize_t n = E_pa.size();
+    for (const ArrayDouble* a : {&area_m2, &w_ini_npm, &w_fin_npm, &T_inicial_N, &temp_inicial_C,
+                                 &temp_final_C, &alfa_1porC, &comprimento_vao_m,
+                                 static_cast<const ArrayDouble*>(&tracao_out)}) {
+        if (a->size() != n) {
+            throw std::invalid_argument("mudar_estado_cabo_lote: todos os arrays devem ter o mesmo tamanho.");
+        }
+    }
+
+    std::int32_t* iters = nullptr;
+    ArrayInt iters_arr;
+    if (!iteracoes_out.is_none()) {
+        // Sem conversão implícita: uma cópia faria as escritas se perderem
+        if (!py::isinstance<ArrayInt>(iteracoes_out)) {
+            throw std::invalid_argument("mudar_estado_cabo_lote: iteracoes_out deve ser um array int32 contíguo.");
+        }
+        iters_arr = py::reinterpret_borrow<ArrayInt>(iteracoes_out);
+        if (iters_arr.size() != n) {
+            throw std::invalid_argument("mudar_estado_cabo_lote: iteracoes_out deve ter o mesmo tamanho das entradas.");
+        }
+        iters = iters_arr.mutable_data();
+    }
+
+    const double* E = E_pa.data();
+    const double* A = area_m2.data();
+    const double* w1 = w_ini_npm.data();
+    const double* w2 = w_fin_npm.data();
+    const double* T0 = T_inicial_N.data();
+    const double* t1 = temp_inicial_C.data();
+    const double* t2 = temp_final_C.data();
+    const double* alfa = alfa_1porC.data();
+    const double* L = comprimento_vao_m.data();
+    double* T_out = tracao_out.mutable_data();
+
+    ArrayInt status(n);
+    std::int32_t* st = status.mutable_data();
+
+    auto resolver_faixa = [=](py::ssize_t inicio, py::ssize_t fim) {
+        for (py::ssize_t i = inicio; i < fim; ++i) {
+            double T_final = std::numeric_limits<double>::quiet_NaN();
+            int it = 0;
+            st[i] = calcular_mudar_estado(
+                E[i], A[i], w1[i], w2[i], T0[i], t1[i], t2[i], alfa[i], L[i],
+                DELTA_DERIVADA, PRECISAO, MAX_ITER, met, &T_final, &it);
+            T_out[i] = (st[i] == 0) ? T_final : std::numeric_limits<double>::quiet_NaN();
+            if (iters) iters[i] = it;
+        }
+    };
+
+    py::ssize_t n_threads = num_threads > 0
+        ? num_threads
+        : static_cast<py::ssize_t>(std::max(1u, std::thread::hardware_concurrency()));
+    n_threads = std::max<py::ssize_t>(1, std::min(n_threads, n / MIN_PROBLEMAS_POR_THREAD));
+
+    {
+        // Os buffers continuam referenciados pelos objetos Python acima;
+        // daqui em diante só acessamos memória crua, sem tocar na API Python.
+        py::gil_scoped_release sem_gil;
+        if (n_threads == 1) {
+            resolver_faixa(0, n);
+        } else {
+            std::vector<std::thread> threads;
+            threads.reserve(static_cast<std::size_t>(n_threads));
+            const py::ssize_t bloco = (n + n_threads - 1) / n_threads;
+            for (py::ssize_t inicio = 0; inicio < n; inicio += bloco) {
+                threads.emplace_back(resolver_faixa, inicio, std::min(n, inicio + bloco));
+            }
+            for (auto& t : threads) t.join();
+        }
+    }
+    return status;
+}
+
+
 // Definição do módulo Python "estado_cpp"
 PYBIND11_MODULE(estado_cpp, m) {
     m.doc() = "Módulo C++ para cálculo de mudança de estado de cabos (NBR 5422)";
@@ -106,6 +246,27 @@ PYBIND11_MODULE(estado_cpp, m) {
           py::arg("temp_inicial_c"),
           py::arg("temp_final_c"),
           py::arg("alfa_thermal_1porc"),
-          py::arg("comprimento_vao_m")
+          py::arg("comprimento_vao_m"),
+          py::arg("metodo") = "diferencas_finitas",
+          py::call_guard<py::gil_scoped_release>()
+    );
+
+    m.def("mudar_estado_cabo_lote", &mudar_estado_cabo_lote_py,
+          "Calcula N mudanças de estado sobre arrays float64 contíguos (zero-copy); "
+          "escreve as trações em tracao_out e devolve os códigos de retorno por elemento. "
+          "Executa sem o GIL, dividido em num_threads threads (0 = todos os núcleos).",
+          py::arg("modulo_elasticidade_pa").noconvert(),
+          py::arg("area_secao_m2").noconvert(),
+          py::arg("peso_unit_inicial_npm").noconvert(),
+          py::arg("peso_unit_final_npm").noconvert(),
+          py::arg("tracao_inicial_n").noconvert(),
+          py::arg("temp_inicial_c").noconvert(),
+          py::arg("temp_final_c").noconvert(),
+          py::arg("alfa_thermal_1porc").noconvert(),
+          py::arg("comprimento_vao_m").noconvert(),
+          py::arg("tracao_out").noconvert(),
+          py::arg("iteracoes_out") = py::none(),
+          py::arg("metodo") = "diferencas_finitas",
+          py::arg("num_threads") = 0
     );
 }
\ No newline at end of file